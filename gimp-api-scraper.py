@@ -1,11 +1,21 @@
-import time
+import argparse
+import functools
+import hashlib
+import os
+import threading
+import requests
 import yaml
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin
 
 BASE_URL = "https://developer.gimp.org/api/3.0/libgimp/"
+PAGE_TIMEOUT = 10
+POOL_SIZE = 6  # Concurrent page fetches
+CACHE_DIR = ".scraper_cache"
+# LibYAML's C emitter, when PyYAML was built against it
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 PRIMITIVE_MAP = {
     "gchar": "string",
     "gboolean": "boolean",
@@ -24,42 +34,72 @@ PRIMITIVE_MAP = {
     "guint8*": "integer",
 }
 
+# Only the tags each page type reads from are turned into tree nodes.
+INDEX_STRAINER = SoupStrainer(["h4", "table", "a"])
+SIDEBAR_STRAINER = SoupStrainer("nav", class_="sidebar")
+METHOD_STRAINER = SoupStrainer(["h4", "p", "dl", "dt", "dd", "code"])
+ENUM_STRAINER = SoupStrainer(["h1", "h4", "table", "td", "p"])
+
+@functools.lru_cache(maxsize=256)
 def glib_to_openapi(glib_type):
     # remove const
     glib_type = glib_type.replace("const ", "")
-    if glib_type in PRIMITIVE_MAP:
-        return PRIMITIVE_MAP[glib_type]
-    return glib_type
-
-def get_soup(driver, url):
-    driver.get(url)
-    time.sleep(1)  # Wait for JS to load
-    return BeautifulSoup(driver.page_source, "html.parser")
-
-def scrape_classes(driver):
-    soup = get_soup(driver, BASE_URL)
-    classes_section = soup.find("h4", id="classes")
-    table = classes_section.find_next("div").find("table")
-    paths = {}
+    return PRIMITIVE_MAP.get(glib_type, glib_type)
+
+class CachedSession(requests.Session):
+    """Session that keeps fetched page bodies on disk, keyed by URL."""
+
+    def __init__(self, cache_dir, refresh=False):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def fetch(self, url):
+        path = os.path.join(self.cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+        if not self.refresh and os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        response = self.get(url, timeout=PAGE_TIMEOUT)
+        response.raise_for_status()
+        # Write under a per-thread name first so readers never see a partial page
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(response.content)
+        os.replace(tmp_path, path)
+        return response.content
+
+def make_session(refresh=False):
+    """HTTP session keeping one connection alive per worker thread."""
+    session = CachedSession(CACHE_DIR, refresh)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE))
+    return session
+
+def get_soup(session, url, strainer=None):
+    # The API reference is static HTML, so no browser is needed to render it
+    return BeautifulSoup(session.fetch(url), "lxml", parse_only=strainer)
+
+def scrape_classes(session, executor, root):
+    classes_section = root.find("h4", id="classes")
+    table = classes_section.find_next("table")
+    classes = []
     for row in table.find_all("tr")[1:]:
         a = row.find("a")
         class_name = a.text.strip()
         if class_name.startswith("Param"):
             continue
         class_url = urljoin(BASE_URL, a['href'])
-        paths.update(scrape_class_methods(driver, class_name, class_url))
-    return paths
+        classes.append((class_name, executor.submit(scrape_class_methods, session, class_url)))
 
-def scrape_class_methods(driver, class_name, class_url):
-    soup = get_soup(driver, class_url)
-    sidebar = soup.find("nav", class_="sidebar")
-    method_links = [a for a in sidebar.find_all("a") if "method" in a.get("href", "")]
+    # Fan out every method page across the workers, then collect in page order
+    methods = []
+    for class_name, links in classes:
+        for method_name, method_url in links.result():
+            path = f"Gimp.{class_name}.{method_name}"
+            methods.append((path, executor.submit(scrape_method, session, method_url)))
     paths = {}
-    for a in method_links:
-        method_url = urljoin(class_url, a['href'])
-        method_name = a.text.strip()
-        method_data = scrape_method(driver, method_url)
-        path = f"Gimp.{class_name}.{method_name}"
+    for path, future in methods:
+        method_data = future.result()
         paths[path] = {
             "get": {
                 "summary": method_data["description"],
@@ -68,56 +108,72 @@ def scrape_class_methods(driver, class_name, class_url):
         }
     return paths
 
-def scrape_method(driver, method_url):
-    soup = get_soup(driver, method_url)
+def scrape_class_methods(session, class_url):
+    soup = get_soup(session, class_url, SIDEBAR_STRAINER)
+    sidebar = soup.find("nav", class_="sidebar")
+    method_links = sidebar.select('a[href*="method"]')
+    return [(a.text.strip(), urljoin(class_url, a['href'])) for a in method_links]
+
+def scrape_method(session, method_url):
+    soup = get_soup(session, method_url, METHOD_STRAINER)
     desc = soup.find("h4", id="description").find_next("p").text.strip()
     params = []
     params_dl = soup.find("h4", id="parameters")
     if params_dl:
         dl = params_dl.find_next("dl")
         for dt, dd in zip(dl.find_all("dt"), dl.find_all("dd")):
-            method_desc = "No description available."
-            if len(dd.find_all("p")) >= 3:
-                method_desc = dd.find_all("p")[2].text.strip()
-            is_required = dd.find("code", string="NULL") is None
+            # One walk over the <p>s yields the type, nullability and description
+            ps = dd.find_all("p")
+            type_code = ps[0].find("code") if ps else None
+            schema_type = glib_to_openapi(type_code.text.strip()) if type_code else "string"
+            method_desc = ps[2].text.strip() if len(ps) >= 3 else "No description available."
+            is_required = not any(p.find("code", string="NULL") for p in ps)
             params.append({
                 "name": dt.text.strip(),
                 "in": "query",
                 "description": method_desc,
                 "required": is_required,
-                "schema": {"type": glib_to_openapi(dd.find_all("p")[0].find("code").text.strip())}
+                "schema": {"type": schema_type}
             })
     return {"description": desc, "parameters": params}
 
-def scrape_enums(driver):
-    soup = get_soup(driver, BASE_URL)
-    enums_section = soup.find("h4", id="enums")
-    table = enums_section.find_next("div").find("table")
-    enums = {}
+def scrape_enums(session, executor, root):
+    enums_section = root.find("h4", id="enums")
+    table = enums_section.find_next("table")
+    futures = []
     for row in table.find_all("tr")[1:]:
         a = row.find("a")
         enum_url = urljoin(BASE_URL, a['href'])
-        enum_data = scrape_enum(driver, enum_url)
+        futures.append(executor.submit(scrape_enum, session, enum_url))
+    enums = {}
+    for future in futures:
+        enum_data = future.result()
         enums[enum_data["name"]] = enum_data
     return enums
 
-def scrape_enum(driver, enum_url):
-    soup = get_soup(driver, enum_url)
+def scrape_enum(session, enum_url):
+    soup = get_soup(session, enum_url, ENUM_STRAINER)
     name = "Gimp." + soup.find("h1").text.strip()
-    desc = soup.find("h4", id="description").find_next("div").find("p").text.strip()
+    desc = soup.find("h4", id="description").find_next("p").text.strip()
     members = []
-    members_table = soup.find("h4", id="members").find_next("div").find("table")
+    members_table = soup.find("h4", id="members").find_next("table")
     for row in members_table.find_all("tr")[1:]:
-        members.append(row.find_all("td")[0].text.strip())
+        members.append(row.find("td").text.strip())
     return {"name": name, "description": desc, "values": members}
 
 def main():
-    options = Options()
-    options.headless = True
-    driver = webdriver.Chrome(options=options)
+    parser = argparse.ArgumentParser(description="Scrape the GIMP 3.0 API reference into an OpenAPI spec.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"re-download every page instead of reading it from {CACHE_DIR}/")
+    args = parser.parse_args()
+
+    session = make_session(refresh=args.no_cache)
     try:
-        paths = scrape_classes(driver)
-        enums = scrape_enums(driver)
+        with ThreadPoolExecutor(max_workers=POOL_SIZE) as executor:
+            # The index page lists both classes and enums, so fetch it once
+            root = get_soup(session, BASE_URL, INDEX_STRAINER)
+            paths = scrape_classes(session, executor, root)
+            enums = scrape_enums(session, executor, root)
         openapi = {
             "openapi": "3.0.0",
             "info": {"title": "GIMP 3.0 API", "version": "1.0.0"},
@@ -127,9 +183,9 @@ def main():
             }
         }
         with open("gimp_openapi.yaml", "w") as f:
-            yaml.dump(openapi, f)
+            yaml.dump(openapi, f, Dumper=YAML_DUMPER, sort_keys=False)
     finally:
-        driver.quit()
+        session.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
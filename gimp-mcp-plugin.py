@@ -8,25 +8,204 @@ gi.require_version('GimpUi', '3.0')
 from gi.repository import GimpUi
 from gi.repository import GLib
 from gi.repository import Gio
-import socket
+gi.require_version('Gegl', '0.4')
+from gi.repository import Gegl
+import asyncio
+import base64
 import json
 import sys
+import tempfile
 import traceback
 import os
+import socket
+import struct
 import threading
 import inspect
+import importlib
+import collections
+
+# Per-request progress messages cross the plug-in IPC boundary, so they are off unless asked for
+DEBUG = os.environ.get("GIMP_MCP_DEBUG") == "1"
+
+try:
+    import orjson
+except ImportError:  # GIMP's bundled Python does not always ship orjson
+    orjson = None
+
+def _json_default(obj):
+    """JSON has no binary type, so send bytes as base64 (msgpack replies carry them raw)."""
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode('ascii')
+    return str(obj)
+
+if orjson:
+    def _dumps(obj):
+        return orjson.dumps(obj, default=_json_default)
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, default=_json_default).encode('utf-8')
+    _loads = json.loads
+
+try:
+    import msgpack
+except ImportError:  # Clients fall back to JSON when the hello reply doesn't offer msgpack
+    msgpack = None
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    shared_memory = None
+
+# Every message is a 4-byte network-order length followed by that many bytes of UTF-8 JSON,
+# or of MessagePack when the top bit of the length is set. Replies use the request's codec.
+HEADER = struct.Struct("!I")
+MSGPACK_FLAG = 0x80000000
+# Room for a brush buffer or ICC profile reply to be handed to the kernel in one go
+SEND_BUFFER_SIZE = 1 << 20
+CODECS = ["msgpack", "json"] if msgpack else ["json"]
+# Binary results at least this large go through shared memory for clients on this machine
+SHM_THRESHOLD = 64 * 1024
+# Seconds a client has to read a shared memory block before the plugin unlinks it itself
+SHM_GRACE_PERIOD = 60
+# Default Babl format for the bulk pixel commands
+PIXEL_FORMAT = "R'G'B'A u8"
+# Pixel coordinates travel as packed little-endian int32 (x, y) pairs
+COORD = struct.Struct("<ii")
+# Gimp.Image methods that change its layer, channel or path list. A batch making at least
+# FREEZE_THRESHOLD such changes to one list has it frozen, so GIMP's UI updates it once.
+FREEZABLE = {
+    'insert_layer': 'layers', 'remove_layer': 'layers', 'reorder_item': 'layers',
+    'raise_item': 'layers', 'lower_item': 'layers',
+    'raise_item_to_top': 'layers', 'lower_item_to_bottom': 'layers',
+    'insert_channel': 'channels', 'remove_channel': 'channels',
+    'insert_path': 'paths', 'remove_path': 'paths',
+}
+FREEZE_THRESHOLD = 4
+# GIDirection of output parameters, which PyGObject returns rather than takes
+GI_DIRECTION_OUT = 1
+# GITypeTag values for recognising arrays of doubles, such as polygon coordinates
+GI_TYPE_TAG_DOUBLE = 11
+GI_TYPE_TAG_ARRAY = 15
+# Local clients connect here instead of over loopback TCP where Unix sockets exist
+SOCKET_PATH = os.environ.get("GIMP_MCP_SOCKET", os.path.join(tempfile.gettempdir(), "gimp-mcp.sock"))
+
+def _as_bytes(value):
+    """Binary request fields arrive raw over msgpack and base64-encoded over JSON."""
+    return base64.b64decode(value) if isinstance(value, str) else bytes(value)
+
+def _bounding_rect(coords):
+    xs = [x for x, _ in coords]
+    ys = [y for _, y in coords]
+    return min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1
+
+def _dense_region(coords):
+    """The rectangle covering coords if reading all of it beats one read per pixel, else None."""
+    if not coords:
+        return None
+    region = _bounding_rect(coords)
+    return region if region[2] * region[3] <= 16 * len(coords) else None
+
+def _doubles(value):
+    """A double array argument as a list: sent as packed little-endian float64 over
+    msgpack, or as a list or comma/space separated text of numbers."""
+    if isinstance(value, (bytes, bytearray)):
+        return list(struct.unpack(f"<{len(value) // 8}d", value))
+    if isinstance(value, str):
+        return [float(number) for number in value.replace(',', ' ').split()]
+    return value
+
+def _freeze_targets(calls):
+    """(image_id, list name) for each image list that calls change often enough to freeze."""
+    counts = collections.Counter()
+    for call in calls:
+        parts = call.get('api_parts') or (call.get('api_path') or '').split('.')[1:]
+        image_id = (call.get('kwargs') or {}).get('image_id')
+        if len(parts) == 2 and parts[0] == 'Image' and parts[1] in FREEZABLE and image_id:
+            counts[image_id, FREEZABLE[parts[1]]] += 1
+    return [target for target, count in counts.items() if count >= FREEZE_THRESHOLD]
+
+def _to_shared_memory(data):
+    """Copy data into a new shared memory block, which the client unlinks once it has read it."""
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        block.buf[:len(data)] = data
+    except BaseException:
+        block.unlink()
+        raise
+    finally:
+        block.close()
+    # The client owns the block now, so keep our resource tracker from unlinking it at exit
+    resource_tracker.unregister(block._name, "shared_memory")
+    return {"__shm__": block.name, "size": len(data)}
+
+def _offload(value, blocks):
+    """value with every large bytes payload inside it moved to shared memory. The new
+    blocks' names are added to blocks."""
+    if isinstance(value, (bytes, bytearray)):
+        if len(value) < SHM_THRESHOLD:
+            return value
+        marker = _to_shared_memory(value)
+        blocks.add(marker["__shm__"])
+        return marker
+    if isinstance(value, dict):
+        return {key: _offload(item, blocks) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_offload(item, blocks) for item in value]
+    return value
+
+def _unlink_block(name, blocks):
+    """Unlink the shared memory block name unless the client already has, or it was
+    already dropped from blocks."""
+    if name not in blocks:
+        return
+    blocks.discard(name)
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:  # The client read and unlinked it
+        return
+    block.close()
+    block.unlink()
 
 def N_(message): return message
 def _(message): return GLib.dgettext(None, message)
 
 class MCPPlugin(Gimp.PlugIn):
-    def __init__(self, host='localhost', port=9877):
+    def __init__(self, host='localhost', port=9877, socket_path=SOCKET_PATH):
         super().__init__()
         self.host = host
         self.port = port
+        self.socket_path = socket_path
         self.running = False
-        self.socket = None
+        self.loop = None
+        self.server = None
+        self.unix_server = None
         self.server_thread = None
+        self.main_loop = None
+        # The GIMP API surface is static, so resolved paths never go stale.
+        # Each entry is (target, whether it takes an 'image' argument, and the
+        # enum classes of its enum parameters by argument position).
+        self._api_cache = {}
+        # Result type -> serializer, filled in the first time each type is returned
+        self._serializers = {
+            list: self._serialize_list,
+            # Return value and output parameters of GI calls that have them
+            tuple: self._serialize_list,
+            str: str, int: str, float: str, bool: str, type(None): str,
+            # Raw pixel and profile data; msgpack carries it as a bin field
+            bytes: bytes, GLib.Bytes: GLib.Bytes.get_data,
+        }
+        # Request type -> handler run on GIMP's main thread. Requests in the old
+        # format have no type and are call_api.
+        self._handlers = {
+            'call_api': self.execute_command,
+            'batch': self.execute_batch,
+            'get_pixels': self.execute_get_pixels,
+            'set_pixels': self.execute_set_pixels,
+            'get_thumbnail': self.execute_get_thumbnail,
+            'apply_filters': self.execute_apply_filters,
+            'describe_drawable': self.execute_describe_drawable,
+        }
 
     def do_query_procedures(self):
         """Register the plugin procedure."""
@@ -52,83 +231,190 @@ class MCPPlugin(Gimp.PlugIn):
         self.running = True
 
         try:
-            Gimp.message("Creating socket...")
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind((self.host, self.port))
-            self.socket.listen(1)
-
-            Gimp.message(f"GimpMCP server started on {self.host}:{self.port}")
-
-            while self.running:
-                client, address = self.socket.accept()
-                print(f"Connected to client: {address}")
-
-                # Handle client in a separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client,)
+            if DEBUG:
+                Gimp.message("Creating socket...")
+            self.loop = asyncio.new_event_loop()
+            self.server = self.loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.port, reuse_address=True)
+            )
+            if self.socket_path and hasattr(asyncio, "start_unix_server") and sys.platform != "win32":
+                self.unix_server = self.loop.run_until_complete(
+                    asyncio.start_unix_server(self._handle_client, self.socket_path)
                 )
-                client_thread.daemon = True
-                client_thread.start()
+
+            # All client I/O runs on one event loop thread; GIMP calls are
+            # handed back to this thread through the GLib main loop below.
+            self.server_thread = threading.Thread(target=self.loop.run_forever)
+            self.server_thread.daemon = True
+            self.server_thread.start()
+
+            Gimp.message(f"GimpMCP server started on {self.host}:{self.port}"
+                         + (f" and {self.socket_path}" if self.unix_server else ""))
+
+            self.main_loop = GLib.MainLoop()
+            self.main_loop.run()
 
         except Exception as e:
             Gimp.message(f"Error starting server: {str(e)}")
             self.running = False
 
-            if self.socket:
-                self.socket.close()
-                self.socket = None
+            if self.server:
+                self.server.close()
+                self.server = None
+
+            if self.unix_server:
+                self.unix_server.close()
+                self.unix_server = None
+                try:
+                    os.unlink(self.socket_path)
+                except OSError:
+                    pass
 
             if self.server_thread:
+                self.loop.call_soon_threadsafe(self.loop.stop)
                 self.server_thread.join(timeout=1.0)
                 self.server_thread = None
 
             return procedure.new_return_values(Gimp.PDBStatusType.SUCCESS, GLib.Error())
 
-    def _handle_client(self, client):
-        """Handle connected client"""
-        Gimp.message("Client handler started")
-        # client.settimeout(None)  # No timeout
-        buffer = b''
-
-        data = client.recv(4096)
-        Gimp.message(f"Received data: {data}")
-        # if not data:
-        #     print("Client disconnected")
-        #     break
-
-        buffer += data
-        request = json.loads(buffer.decode('utf-8'))
-        buffer = b''
-        Gimp.message(f"Parsed request: {request}")
-        response = self.execute_command(request)
-        Gimp.message(f"Generated response: {response}")
-        response_data = json.dumps(response)
-        client.sendall(response_data.encode('utf-8'))
-        Gimp.message("Response sent successfully")
-        client.close()
-        Gimp.message("Client closed")
-        return        
+    async def _handle_client(self, reader, writer):
+        """Handle connected client, serving requests until it disconnects"""
+        if DEBUG:
+            Gimp.message("Client handler started")
+
+        # Requests with an 'id' may be pipelined and are answered as each completes. The
+        # session holds the write lock, shm choice, opcode table and a reused msgpack packer.
+        packer = msgpack.Packer(use_bin_type=True, default=str) if msgpack else None
+        session = {"write_lock": asyncio.Lock(), "shm": False, "ops": {}, "packer": packer, "blocks": set()}
+        in_flight = set()
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break  # Client closed the connection between requests
+                (length,) = HEADER.unpack(header)
+                packed = bool(length & MSGPACK_FLAG)
+                data = await reader.readexactly(length & ~MSGPACK_FLAG)
+                if DEBUG:
+                    Gimp.message(f"Received data: {data}")
+                request = msgpack.unpackb(data, raw=False) if packed else _loads(data)
+                if DEBUG:
+                    Gimp.message(f"Parsed request: {request}")
+                # Resolved here, in arrival order, since a request that defines an
+                # opcode may still be running when the next one uses it
+                params = request.get('params')
+                if isinstance(params, dict) and 'op' in params:
+                    if 'api_path' in params:
+                        session["ops"][params['op']] = params['api_path']
+                    else:
+                        params['api_path'] = session["ops"].get(params['op'])
+                if 'id' in request:
+                    task = asyncio.ensure_future(self._respond(request, packed, writer, session))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                else:
+                    await self._respond(request, packed, writer, session)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            if DEBUG:
+                Gimp.message(f"Client connection lost: {e}")
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            # Blocks in replies the client never read would otherwise outlive it
+            for name in list(session["blocks"]):
+                _unlink_block(name, session["blocks"])
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            if DEBUG:
+                Gimp.message("Client closed")
+
+    async def _respond(self, request, packed, writer, session):
+        """Run one request and send its response in the request's codec, echoing its id."""
+        if request.get('type') == 'hello':
+            # Negotiation doesn't touch GIMP, so answer it here. Only clients on this
+            # machine ask for shared memory; it can't cross to another host.
+            session["shm"] = bool(shared_memory and request.get('params', {}).get('shm'))
+            response = {"status": "success", "result": {"codecs": CODECS, "shm": session["shm"], "ops": True}}
+        else:
+            response = await self._run_on_main_thread(request)
+            if session["shm"] and response.get("status") == "success":
+                # Normally the client unlinks each block once read. These are for when
+                # it never does, e.g. because it crashed.
+                blocks = set()
+                response["result"] = _offload(response["result"], blocks)
+                session["blocks"].update(blocks)
+                for name in blocks:
+                    self.loop.call_later(SHM_GRACE_PERIOD, _unlink_block, name, session["blocks"])
+        if 'id' in request:
+            response['id'] = request['id']
+        if DEBUG:
+            Gimp.message(f"Generated response: {response}")
+        if packed:
+            response_data = session["packer"].pack(response)
+            header = HEADER.pack(len(response_data) | MSGPACK_FLAG)
+        else:
+            response_data = _dumps(response)
+            header = HEADER.pack(len(response_data))
+        async with session["write_lock"]:
+            writer.write(header)
+            writer.write(response_data)
+            await writer.drain()
+        if DEBUG:
+            Gimp.message("Response sent successfully")
+
+    def _run_on_main_thread(self, request):
+        """Schedule the request's handler on GIMP's main thread, returning a future for its response."""
+        future = self.loop.create_future()
+        request_type = request.get('type', 'call_api')
+        handler = self._handlers.get(request_type)
+        if handler is None:
+            # Answered here, off GIMP's main thread, so without Gimp.message
+            future.set_result({"status": "error", "error": f"Unknown command type {request_type!r}"})
+            return future
+
+        def dispatch():
+            try:
+                response = handler(request)
+            except Exception as e:  # Still answer, or the client waits forever
+                response = self._error_response(e)
+            self.loop.call_soon_threadsafe(future.set_result, response)
+            return GLib.SOURCE_REMOVE
+
+        GLib.idle_add(dispatch)
+        return future
 
     def execute_command(self, request):
         """Execute commands in GIMP's main thread."""
         try:
-            Gimp.message(f"Raw request: {request}")
+            if DEBUG:
+                Gimp.message(f"Raw request: {request}")
             
             # Handle both old and new request formats
             params = request.get('params', {})
             api_path = params.get('api_path', '')
+            api_parts = params.get('api_parts')
             args = params.get('args', [])
             kwargs = params.get('kwargs', {})
+            if 'op' in params and not api_path:
+                raise ValueError(f"Unknown opcode {params['op']}; it was never defined on this connection")
             
             # If params is empty, try the old format
             if not params:
+                params = request  # Batch calls also come in this form
                 api_path = request.get('api_path', '')
+                api_parts = request.get('api_parts')
                 args = request.get('args', [])
                 kwargs = request.get('kwargs', {})
 
-            Gimp.message(f"Executing command: {api_path} with args {args} and kwargs {kwargs}")
+            if DEBUG:
+                Gimp.message(f"Executing command: {api_path or api_parts} with args {args} and kwargs {kwargs}")
 
             # Get Gimp.Image if kwargs specifies it
             image = None
@@ -136,43 +422,340 @@ class MCPPlugin(Gimp.PlugIn):
                 image = Gimp.Image.get_by_id(kwargs.get('image_id'))
                 del kwargs['image_id']
 
-            # Dynamically resolve the API method
-            current = Gimp
-            for part in api_path.split('.')[1:]:  # Skip 'Gimp' as we already have it
-                current = getattr(current, part)
+            # Dynamically resolve the API method. Generated callers can send
+            # api_parts, the path already split below 'Gimp', to skip the split.
+            key = tuple(api_parts) if api_parts else api_path
+            resolved = self._api_cache.get(key)
+            if resolved is None:
+                current = Gimp
+                parts = api_parts or api_path.split('.')[1:]  # Skip 'Gimp' as we already have it
+                for part in parts:
+                    current = getattr(current, part)
+                info = self._parameter_info(current)
+                # Gimp.Image methods take the image as their instance, whatever GI names it
+                takes_image = self._takes_image(current) or bool(info[-1]) and parts[0] == 'Image'
+                resolved = self._api_cache[key] = (current, takes_image, *info)
+            current, takes_image, enums, doubles, hidden, arity, offset = resolved
 
             # Call the method
             if callable(current):
-                sig = inspect.signature(current)
-                if 'image' in sig.parameters:
+                if offset and params.get('instance') is False:
+                    # The Gimp_* tools leave out the instance; give it a slot so
+                    # positions line up with the full argument list
+                    args = [None, *args]
+                if hidden and len(args) == arity:
+                    # Placeholders for output parameters, which PyGObject returns instead,
+                    # and for array lengths, which it takes from the arrays
+                    args = [arg for position, arg in enumerate(args) if position not in hidden]
+                if takes_image:
                     args[0] = image
+                # Enum arguments may be given by name, e.g. "RED" for Gimp.HistogramChannel.RED
+                for position, enum in enums.items():
+                    if position < len(args) and isinstance(args[position], str):
+                        args[position] = getattr(enum, args[position].upper().replace('-', '_'))
+                for position in doubles:
+                    if position < len(args):
+                        args[position] = _doubles(args[position])
                 result = current(*args, **kwargs)
             else:
                 result = current
 
-            # Serialize result
+            result = self.serialize_result(result)
+
+            if DEBUG:
+                Gimp.message(f"Command result: {result}")
+            return {"status": "success", "result": result}
+
+        except Exception as e:
+            return self._error_response(e)
+
+    @staticmethod
+    def _error_response(e):
+        error_msg = f"Error executing command: {str(e)}\n{traceback.format_exc()}"
+        Gimp.message(error_msg)
+        return {
+            "status": "error",
+            "error": str(e),
+            "traceback": traceback.format_exc()
+        }
+
+    def execute_batch(self, request):
+        """Execute several call_api commands in order within one main-loop dispatch.
+
+        Each call has the same fields as call_api params and gets its own
+        success or error response, so one failing call doesn't stop the rest.
+        Image lists the batch changes many times are frozen around it.
+
+        Optional params: image_id, with undo_group to make the batch one undo
+        step on that image and freeze to freeze all its item lists.
+        """
+        params = request.get('params', {})
+        calls = params.get('calls', [])
+        if not isinstance(calls, list) or not all(isinstance(call, dict) for call in calls):
+            return self._error_response(TypeError("calls must be a list of call_api params objects"))
+        image_id = params.get('image_id')
+        group = None
+        if image_id:
+            group = Gimp.Image.get_by_id(image_id)
+            if group is None:
+                return self._error_response(ValueError(f"No image with id {image_id}"))
+            if not params.get('undo_group'):
+                group = None
+        frozen = []
+        grouped = None
+        try:
+            targets = dict.fromkeys(_freeze_targets(calls))
+            if image_id and params.get('freeze'):
+                targets.update(dict.fromkeys((image_id, kind) for kind in ('layers', 'channels', 'paths')))
+            if group is not None:
+                group.undo_group_start()
+                grouped = group
+            for target_id, kind in targets:
+                try:
+                    image = Gimp.Image.get_by_id(target_id)
+                    getattr(image, f"freeze_{kind}")()
+                    frozen.append((image, kind))
+                except Exception:  # Only an optimisation; the calls report their own errors
+                    pass
+            return {"status": "success", "result": [self.execute_command(call) for call in calls]}
+        except Exception as e:
+            return self._error_response(e)
+        finally:
+            for image, kind in reversed(frozen):
+                try:
+                    getattr(image, f"thaw_{kind}")()
+                except Exception:  # The batch may have deleted the image
+                    pass
+            if grouped is not None:
+                try:
+                    grouped.undo_group_end()
+                except Exception:
+                    pass
+
+    def execute_get_pixels(self, request):
+        """Read many pixels of a drawable with one request.
+
+        params: drawable_id, coords (packed COORD pairs, raw or base64) and an
+        optional Babl format. The result is the pixels' bytes in coordinate order.
+        """
+        try:
+            params = request.get('params', {})
+            drawable = Gimp.Item.get_by_id(params['drawable_id'])
+            coords = list(COORD.iter_unpack(_as_bytes(params['coords'])))
+            pixel_format = params.get('format') or PIXEL_FORMAT
+            buffer = drawable.get_buffer()
+            region = _dense_region(coords)
+            if region:
+                x0, y0, width, height = region
+                data = buffer.get(Gegl.Rectangle.new(*region), 1.0, pixel_format, Gegl.AbyssPolicy.NONE)
+                bpp = len(data) // (width * height)
+                offsets = (((y - y0) * width + (x - x0)) * bpp for x, y in coords)
+                result = b"".join(data[offset:offset + bpp] for offset in offsets)
+            else:
+                result = b"".join(buffer.get(Gegl.Rectangle.new(x, y, 1, 1), 1.0, pixel_format, Gegl.AbyssPolicy.NONE)
+                                  for x, y in coords)
+            return {"status": "success", "result": result}
+        except Exception as e:
+            return self._error_response(e)
+
+    def execute_set_pixels(self, request):
+        """Write many pixels of a drawable with one request.
+
+        params: drawable_id, coords (packed COORD pairs), colors (the pixels'
+        bytes in coordinate order; both raw or base64) and an optional Babl format.
+        """
+        try:
+            params = request.get('params', {})
+            drawable = Gimp.Item.get_by_id(params['drawable_id'])
+            coords = list(COORD.iter_unpack(_as_bytes(params['coords'])))
+            colors = _as_bytes(params['colors'])
+            pixel_format = params.get('format') or PIXEL_FORMAT
+            if not coords:
+                return {"status": "success", "result": 0}
+            bpp, remainder = divmod(len(colors), len(coords))
+            if remainder or not bpp:
+                raise ValueError(f"{len(colors)} bytes of color for {len(coords)} pixels")
+            buffer = drawable.get_buffer()
+            region = _dense_region(coords)
+            if region:
+                # Read-modify-write the covering rectangle in one go
+                x0, y0, width, height = region
+                rect = Gegl.Rectangle.new(*region)
+                data = bytearray(buffer.get(rect, 1.0, pixel_format, Gegl.AbyssPolicy.NONE))
+                for i, (x, y) in enumerate(coords):
+                    offset = ((y - y0) * width + (x - x0)) * bpp
+                    data[offset:offset + bpp] = colors[i * bpp:(i + 1) * bpp]
+                buffer.set(rect, pixel_format, bytes(data))
+            else:
+                x0, y0, width, height = _bounding_rect(coords)
+                for i, (x, y) in enumerate(coords):
+                    buffer.set(Gegl.Rectangle.new(x, y, 1, 1), pixel_format, colors[i * bpp:(i + 1) * bpp])
+            buffer.flush()
+            drawable.update(x0, y0, width, height)
+            return {"status": "success", "result": len(coords)}
+        except Exception as e:
+            return self._error_response(e)
+
+    def execute_get_thumbnail(self, request):
+        """Fetch a drawable thumbnail's pixels, size and format with one request.
+
+        params: drawable_id, dest_width, dest_height and optionally the source
+        area src_x, src_y, src_width, src_height (default: the whole drawable).
+        """
+        try:
+            params = request.get('params', {})
+            drawable = Gimp.Item.get_by_id(params['drawable_id'])
+            src_width = params.get('src_width') or drawable.get_width()
+            src_height = params.get('src_height') or drawable.get_height()
+            data, width, height, bpp = drawable.get_sub_thumbnail_data(
+                params.get('src_x', 0), params.get('src_y', 0), src_width, src_height,
+                params['dest_width'], params['dest_height'])
+            return {"status": "success", "result": {
+                "pixels": self.serialize_result(data),
+                "width": width,
+                "height": height,
+                "bpp": bpp,
+                "rowstride": width * bpp,
+                "format": str(drawable.get_thumbnail_format()),
+            }}
+        except Exception as e:
+            return self._error_response(e)
+
+    def execute_apply_filters(self, request):
+        """Apply a chain of GEGL filters to a drawable in a single render.
+
+        params: drawable_id and filters, a list of {"operation", "properties",
+        "name", "opacity"} with all but operation optional. The filters are
+        stacked as layer effects and merged together, so GIMP renders them as
+        one graph instead of one pass over the pixels per filter.
+        """
+        try:
+            params = request.get('params', {})
+            drawable = Gimp.Item.get_by_id(params['drawable_id'])
+            if drawable.get_filters():
+                # merge_filters() would bake those in along with ours
+                raise ValueError("The drawable already has layer effects; merge or remove them first")
+            image = drawable.get_image()
+            image.undo_group_start()
+            try:
+                for spec in params['filters']:
+                    drawable_filter = Gimp.DrawableFilter.new(drawable, spec['operation'], spec.get('name', ''))
+                    config = drawable_filter.get_config()
+                    for name, value in spec.get('properties', {}).items():
+                        config.set_property(name, value)
+                    if 'opacity' in spec:
+                        drawable_filter.set_opacity(spec['opacity'])
+                    drawable_filter.update()
+                    drawable.append_filter(drawable_filter)
+                drawable.merge_filters()
+            finally:
+                image.undo_group_end()
+            return {"status": "success", "result": len(params['filters'])}
+        except Exception as e:
+            return self._error_response(e)
+
+    def execute_describe_drawable(self, request):
+        """Report a drawable's type, size and depth with one request.
+
+        params: drawable_id. The is_rgb/is_gray/is_indexed/has_alpha flags are
+        derived from the image type here instead of costing a PDB call each.
+        """
+        try:
+            drawable = Gimp.Item.get_by_id(request.get('params', {})['drawable_id'])
+            image_type = drawable.type()
+            # Gimp.ImageType pairs each base type with its alpha variant: RGB, RGBA, GRAY, ...
+            base, alpha = divmod(int(image_type), 2)
+            return {"status": "success", "result": {
+                "type": image_type.value_name,
+                "is_rgb": base == 0,
+                "is_gray": base == 1,
+                "is_indexed": base == 2,
+                "has_alpha": bool(alpha),
+                "bpp": drawable.get_bpp(),
+                "width": drawable.get_width(),
+                "height": drawable.get_height(),
+            }}
+        except Exception as e:
+            return self._error_response(e)
+
+    @staticmethod
+    def _takes_image(target):
+        """Whether target is a callable with an 'image' parameter."""
+        if not callable(target):
+            return False
+        try:
+            return 'image' in inspect.signature(target).parameters
+        except (TypeError, ValueError):  # Some GI callables have no introspectable signature
+            return False
+
+    @staticmethod
+    def _parameter_info(target):
+        """What execute_command needs to know about a GI callable's parameters.
+
+        Returns the enum class of each enum parameter and the positions of
+        double array parameters, both among the arguments Python passes; the
+        positions of parameters PyGObject doesn't take (outputs, and array
+        lengths it derives from the array) in an argument list that includes
+        them; that list's length; and 1 for methods, whose positions count the
+        instance, else 0. Looked up once per API path, so conversions cost
+        little per call.
+        """
+        # Functions and unbound methods are gi.FunctionInfo objects themselves
+        info = getattr(target, '__info__', target)
+        if not hasattr(info, 'get_arguments'):
+            return {}, (), frozenset(), None, 0
+        offset = 1 if info.is_method() else 0
+        arguments = info.get_arguments()
+        type_infos = [arg.get_type_info() if hasattr(arg, 'get_type_info') else arg.get_type() for arg in arguments]
+        hidden = {position for position, arg in enumerate(arguments, offset) if arg.get_direction() == GI_DIRECTION_OUT}
+        for type_info in type_infos:
+            if type_info.get_tag() == GI_TYPE_TAG_ARRAY:
+                get_length = getattr(type_info, 'get_array_length_index', None) or type_info.get_array_length
+                if get_length() >= 0:
+                    hidden.add(offset + get_length())
+        enums = {}
+        doubles = []
+        inputs = [type_info for position, type_info in enumerate(type_infos, offset) if position not in hidden]
+        for position, type_info in enumerate(inputs, offset):
+            if type_info.get_tag() == GI_TYPE_TAG_ARRAY:
+                if type_info.get_param_type(0).get_tag() == GI_TYPE_TAG_DOUBLE:
+                    doubles.append(position)
+                continue
+            interface = type_info.get_interface()
+            if interface is None:
+                continue
+            try:
+                namespace = importlib.import_module(f"gi.repository.{interface.get_namespace()}")
+            except ImportError:
+                continue
+            enum = getattr(namespace, interface.get_name(), None)
+            if isinstance(enum, type) and hasattr(enum, '__enum_values__'):
+                enums[position] = enum
+        return enums, tuple(doubles), frozenset(hidden), offset + len(arguments), offset
+
+    def serialize_result(self, result):
+        """Serialize a command result with the handler cached for its type."""
+        handler = self._serializers.get(type(result))
+        if handler is None:
             if hasattr(result, "id"):  # For Gimp objects
-                result = {"id": result.id}
+                handler = self._serialize_with_id
             elif isinstance(result, list):
-                result = [self.serialize_gimp_object(item) for item in result]
+                handler = self._serialize_list
             else:
-                result = str(result)
+                handler = str
+            self._serializers[type(result)] = handler
+        return handler(result)
 
-            Gimp.message(f"Command result: {result}")
-            return {"status": "success", "result": result}
+    def _serialize_with_id(self, result):
+        return {"id": result.id}
 
-        except Exception as e:
-            error_msg = f"Error executing command: {str(e)}\n{traceback.format_exc()}"
-            Gimp.message(error_msg)
-            return {
-                "status": "error",
-                "error": str(e),
-                "traceback": traceback.format_exc()
-            }
+    def _serialize_list(self, result):
+        return [self.serialize_gimp_object(item) for item in result]
 
     def serialize_gimp_object(self, obj):
         """Serialize Gimp objects to JSON-friendly formats."""
-        Gimp.message(f"Serializing object: {obj}")
+        if DEBUG:
+            Gimp.message(f"Serializing object: {obj}")
         if obj.__class__.__name__ == "Image":
             return {"id": Gimp.Image.get_id(obj), "type": obj.__class__.__name__}
         return str(obj)
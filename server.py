@@ -3,60 +3,315 @@
 # Provides an MCP interface to control GIMP via a socket connection.
 
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp.tools import Tool
+import asyncio
+import os
+import tempfile
 import socket
 import json
 import logging
 import inspect
+import struct
+import base64
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("GimpMCPServer")
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard library codec
+    orjson = None
+
+if orjson:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj, default=None):
+        return json.dumps(obj, default=default).encode('utf-8')
+    def _loads(data):
+        return json.loads(bytes(data))
+
+try:
+    import msgpack
+except ImportError:  # stay on JSON
+    msgpack = None
+if os.environ.get("GIMP_MCP_JSON") == "1":
+    msgpack = None  # Keep the wire readable, e.g. for debugging with a packet capture
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # large results stay inline
+    shared_memory = None
+
+try:
+    import uvloop
+except ImportError:  # stay on the standard asyncio loop
+    uvloop = None
+
+# Every message is a 4-byte network-order length followed by that many bytes of UTF-8 JSON,
+# or of MessagePack when the top bit of the length is set
+HEADER = struct.Struct("!I")
+MSGPACK_FLAG = 0x80000000
+# Large enough for a brush buffer or ICC profile to arrive without the window filling up
+SOCKET_BUFFER_SIZE = 1 << 20
+# The plugin also listens here when GIMP runs on this machine; must match the plugin's path
+SOCKET_PATH = os.environ.get("GIMP_MCP_SOCKET", os.path.join(tempfile.gettempdir(), "gimp-mcp.sock"))
+
 class GimpConnection:
-    def __init__(self, host='localhost', port=9877):
+    """One connection to the plugin shared by all tool calls.
+
+    Every request carries an id and the plugin echoes it, so any number of
+    requests can be in flight at once; a background task hands each response
+    to the caller waiting on its id. Plugins that predate ids answer strictly
+    in order, so an id-less response goes to the oldest pending request.
+    """
+
+    def __init__(self, host='localhost', port=9877, path=SOCKET_PATH):
         self.host = host
         self.port = port
-        self.sock = None
-
-    def connect(self):
-        if self.sock:
-            return
+        self.path = path
+        self.reader = None
+        self.writer = None
+        self.packed = False
+        self.shm = False
+        # api_path -> opcode, once the plugin has agreed to them; see send_command
+        self.ops = None
+        self._pending = {}
+        self._next_id = 0
+        # Packs every msgpack request into the same internal buffer instead of a new
+        # Packer and buffer per packb() call. pack() runs without awaiting, so requests
+        # on the one event loop never interleave in it.
+        self._packer = msgpack.Packer(use_bin_type=True) if msgpack else None
+        self._reader_task = None
+        self._connect_lock = asyncio.Lock()
+
+    async def connect(self):
+        async with self._connect_lock:
+            if self.writer:
+                return
+            try:
+                sock, endpoint = await self._open_socket()
+                local = sock.family == getattr(socket, "AF_UNIX", None)
+                self.reader, self.writer = await asyncio.open_connection(sock=sock)
+                logger.info(f"Connected to GIMP at {endpoint}")
+            except Exception as e:
+                logger.error(f"Failed to connect: {e}")
+                raise ConnectionError("Could not connect to GIMP. Ensure the MCP Server plugin is running.")
+            self._reader_task = asyncio.create_task(self._read_responses(self.reader))
+            await self._negotiate(local)
+
+    async def _open_socket(self):
+        """Connect to the plugin's Unix socket if it has one on this machine, otherwise over
+        a TCP socket tuned for request/response traffic. Returns the socket and a description."""
+        loop = asyncio.get_running_loop()
+        if self.path and hasattr(socket, "AF_UNIX") and os.path.exists(self.path):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            try:
+                await loop.sock_connect(sock, self.path)
+                return sock, self.path
+            except OSError as e:  # Left behind by a GIMP that has since exited
+                sock.close()
+                logger.info(f"Unix socket {self.path} not accepting connections ({e}), using TCP")
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to GIMP at {self.host}:{self.port}")
-        except Exception as e:
-            logger.error(f"Failed to connect: {e}")
-            raise ConnectionError("Could not connect to GIMP. Ensure the MCP Server plugin is running.")
-
-    def send_command(self, command_type, params=None):
-        if not self.sock:
-            self.connect()
-        command = {"type": command_type, "params": params or {}}
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Buffer sizes must be set before connecting to affect the advertised window
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            await loop.sock_connect(sock, (self.host, self.port))
+            if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except BaseException:
+            sock.close()
+            raise
+        return sock, f"{self.host}:{self.port}"
+
+    async def _negotiate(self, local):
+        """Switch to MessagePack and opcodes if the plugin offers them, and over the Unix
+        socket ask for large binary results through shared memory. Older plugins answer
+        the JSON hello with something else and the connection stays on plain JSON."""
+        codecs = ["msgpack", "json"] if msgpack else ["json"]
+        response = await self.send_command("hello", {"codecs": codecs, "shm": bool(local and shared_memory)})
+        result = response.get("result")
+        if isinstance(result, dict):
+            self.packed = bool(msgpack) and "msgpack" in result.get("codecs", ())
+            self.shm = bool(result.get("shm"))
+            if result.get("ops"):
+                self.ops = {}
+
+    async def send_command(self, command_type, params=None):
+        if not self.writer:
+            await self.connect()
+        self._next_id += 1
+        request_id = self._next_id
+        new_op = None
+        if self.ops is not None and command_type == "call_api":
+            # The first call to each api_path assigns it the next opcode; later calls send
+            # just the opcode. Requests are written in this order, so the plugin always
+            # sees an opcode defined before it is used.
+            params = dict(params)
+            op = self.ops.get(params["api_path"])
+            if op is None:
+                op = new_op = len(self.ops)
+            else:
+                del params["api_path"]
+            params["op"] = op
+        command = {"type": command_type, "params": params or {}, "id": request_id}
+        if self.packed:
+            payload = self._packer.pack(command)
+            header = HEADER.pack(len(payload) | MSGPACK_FLAG)
+        else:
+            payload = _dumps(command)
+            header = HEADER.pack(len(payload))
+        # A cancelled caller leaves its future here, so the reply is still matched and discarded
+        future = self._pending[request_id] = asyncio.get_running_loop().create_future()
         try:
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
-            response = self.sock.recv(1024)
-            self.sock = None
-            return json.loads(response.decode('utf-8'))
+            self.writer.writelines((header, payload))
+            # Only a written definition counts. Nothing awaited since len(self.ops), so no
+            # other request can have taken the same opcode.
+            if new_op is not None:
+                self.ops[params["api_path"]] = new_op
+            await self.writer.drain()
         except Exception as e:
             logger.error(f"Communication error: {e}")
-            self.sock = None
+            self.close(e)
+        try:
+            return await future
+        except ConnectionError as e:
             raise Exception(f"Error communicating with GIMP: {e}")
 
-# Global connection
-_gimp_connection = None
-
-def get_gimp_connection():
-    global _gimp_connection
-    if _gimp_connection is None:
-        _gimp_connection = GimpConnection()
-        _gimp_connection.connect()
-    return _gimp_connection
+    async def _read_responses(self, reader):
+        """Resolve pending requests from responses until the connection fails."""
+        try:
+            while True:
+                (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+                body = await reader.readexactly(length & ~MSGPACK_FLAG)
+                response = msgpack.unpackb(body, raw=False) if length & MSGPACK_FLAG else _loads(body)
+                if self.shm and "result" in response:
+                    # Read even if nobody is waiting any more, or the blocks are never unlinked
+                    response["result"] = _restore_shared(response["result"])
+                request_id = response["id"] if "id" in response else next(iter(self._pending), None)
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not isinstance(e, asyncio.IncompleteReadError):
+                logger.error(f"Communication error: {e}")
+            self.close(ConnectionError(f"Connection to GIMP lost: {e}"))
+
+    def close(self, error=None):
+        """Drop the connection, failing every request still waiting on it, and the cached
+        results, which may not hold for the GIMP session the next connection reaches."""
+        _getter_cache.invalidate()
+        if self.writer:
+            try:
+                self.writer.close()
+            finally:
+                self.reader = self.writer = None
+                self.packed = self.shm = False
+                self.ops = None
+        if self._reader_task and self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+        self._reader_task = None
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(str(error or "Connection to GIMP closed.")))
+
+def _restore_shared(value):
+    """value with every shared memory marker the plugin left in it replaced by its
+    bytes. Each block is unlinked once copied out; the plugin never reads it again."""
+    if isinstance(value, dict):
+        if "__shm__" in value:
+            block = shared_memory.SharedMemory(name=value["__shm__"])
+            try:
+                return bytes(block.buf[:value["size"]])
+            finally:
+                block.close()
+                block.unlink()
+        return {key: _restore_shared(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore_shared(item) for item in value]
+    return value
+
+def _encode_bytes(obj):
+    """Base64-encode binary results (brush buffers, ICC profiles) for the JSON tool output."""
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode('ascii')
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class ResultCache:
+    """Results of side-effect-free GIMP getters, reused until anything else is sent.
+
+    Every command that might modify the image calls invalidate(), and so does
+    dropping the connection, since IDs from a GIMP session that has gone mean
+    nothing in the next; every reconnect follows a close(). A cached value is
+    therefore never older than the last change made through this server. A read
+    that overlaps an invalidation is not stored, since it may predate the change.
+    Once the results held reach max_size characters, the oldest are dropped first.
+    """
+
+    def __init__(self, api_paths, max_size=8 * 1024 * 1024):
+        self.api_paths = frozenset(api_paths)
+        self.max_size = max_size
+        self.entries = {}
+        self.size = 0
+        self.generation = 0
+
+    def invalidate(self):
+        self.generation += 1
+        self.entries.clear()
+        self.size = 0
+
+    async def fetch(self, key, send):
+        if key in self.entries:
+            return self.entries[key]
+        generation = self.generation
+        result = await send()
+        if generation == self.generation and not result.startswith("Error") and len(result) <= self.max_size:
+            self.entries[key] = result
+            self.size += len(result)
+            while self.size > self.max_size:
+                self.size -= len(self.entries.pop(next(iter(self.entries))))
+        return result
+
+# Image and item identity and type checks repeated while walking the layer tree, which
+# never change for a given image or item, and gradient samples, evaluated segment by
+# segment. Drawable and image sizes, types and formats, histograms, thumbnails,
+# resolution, guides, sample points, palettes, profiles, item lists and names and the
+# selection are left out since GIMP's UI changes them without going through this server.
+_getter_cache = ResultCache([f"Gimp.Image.{name}" for name in (
+    "get_id", "get_layer_by_tattoo", "get_channel_by_tattoo", "get_path_by_tattoo",
+)] + [f"Gimp.Item.{name}" for name in (
+    "get_id", "get_image",
+    "is_channel", "is_drawable", "is_group", "is_group_layer", "is_layer", "is_layer_mask",
+    "is_path", "is_selection", "is_text_layer",
+)] + [f"Gimp.Gradient.{name}" for name in (
+    "get_uniform_samples", "get_custom_samples", "get_number_of_segments",
+    "segment_get_blending_function", "segment_get_coloring_type", "segment_get_left_color",
+    "segment_get_left_pos", "segment_get_middle_pos", "segment_get_right_color",
+    "segment_get_right_pos",
+)])
+
+# Method name prefixes of API calls that only read, so sending one uncached keeps the cache.
+# They are not cached themselves unless listed in _getter_cache.
+READ_ONLY_PREFIXES = ("get_", "find_", "is_", "has_", "list_")
+
+# Shared connection; send_command (re)connects it as needed. The socket is left for
+# process exit to close, since the event loop is gone by the time atexit runs.
+_connection = GimpConnection()
 
 # MCP server
 mcp = FastMCP('SampleMCP', description='Sample integration through MCP')
 
 @mcp.tool()
-def call_api(ctx: Context, api_path: str, args: list = [], kwargs: dict = {}) -> str:
+async def call_api(ctx: Context, api_path: str, args: list = [], kwargs: dict = {}) -> str:
     """Call any GIMP 3.0 API method dynamically.
 
     Parameters:
@@ -68,35 +323,217 @@ def call_api(ctx: Context, api_path: str, args: list = [], kwargs: dict = {}) ->
     Returns:
     - JSON string of the result or error message
     """
+    return await _call_api_impl(api_path, args, kwargs)
+
+def _coordinates(segs):
+    """The numbers in a coordinate list given as a list or as comma/space separated text."""
+    return segs if isinstance(segs, list) else segs.replace(',', ' ').split()
+
+def _positive_size(args):
+    return args[0] > 0 and args[1] > 0
+
+# api_path -> (check on the positional args, error) for mistakes GIMP would only reject
+# after a round trip. A check that can't make sense of the args lets the call through.
+# Checks index args as the Gimp_* tools send them, without the instance.
+ARGUMENT_CHECKS = {
+    "Gimp.Image.scale": (_positive_size, "new_width and new_height must be positive"),
+    "Gimp.Image.resize": (_positive_size, "new_width and new_height must be positive"),
+    "Gimp.Image.crop": (_positive_size, "new_width and new_height must be positive"),
+    "Gimp.Layer.scale": (_positive_size, "new_width and new_height must be positive"),
+    "Gimp.Layer.resize": (_positive_size, "new_width and new_height must be positive"),
+    "Gimp.Image.select_polygon": (
+        lambda args: len(_coordinates(args[2])) == args[1] and args[1] % 2 == 0,
+        "segs must hold num_segs numbers, an x and a y for each point"),
+    "Gimp.Image.insert_layer": (lambda args: args[0] is not None, "layer is required"),
+}
+
+# Gimp.ChannelOps values, the operation of the selection and mask combining calls. GIMP 2's
+# intersect-with-floating operation has no ChannelOps value in GIMP 3, so it is refused here.
+CHANNEL_OPS = {"ADD": 0, "SUBTRACT": 1, "REPLACE": 2, "INTERSECT": 3, "INTERSECT_WITH_FLOATING": None}
+
+# api_path -> (position, values) of an enum argument the server converts from a value name
+# to its number, so the plugin passes it straight to GIMP. Positions are in args as the
+# Gimp_* tools send them, without the instance: combine_masks takes channel2 first.
+ENUM_ARGUMENTS = {
+    "Gimp.Channel.combine_masks": (1, CHANNEL_OPS),
+    "Gimp.Image.select_color": (0, CHANNEL_OPS),
+    "Gimp.Image.select_contiguous_color": (0, CHANNEL_OPS),
+    "Gimp.Image.select_ellipse": (0, CHANNEL_OPS),
+    "Gimp.Image.select_item": (0, CHANNEL_OPS),
+    "Gimp.Image.select_polygon": (0, CHANNEL_OPS),
+    "Gimp.Image.select_rectangle": (0, CHANNEL_OPS),
+    "Gimp.Image.select_round_rectangle": (0, CHANNEL_OPS),
+}
+
+def _enum_name(api_path, args, instance):
+    """(position in args, value name) of api_path's enum argument if given by name, else None.
+    instance is whether args start with the instance, as in call_api."""
+    position, values = ENUM_ARGUMENTS.get(api_path, (None, None))
+    if position is None:
+        return None
+    position += instance
+    if position >= len(args) or not isinstance(args[position], str):
+        return None
+    return position, args[position].upper().replace('-', '_').replace(' ', '_')
+
+def _enum_numbers(api_path, args, instance=False):
+    """args with api_path's enum argument given by value name, e.g. "add", as its number."""
+    named = _enum_name(api_path, args, instance)
+    if named is None:
+        return args
+    position, name = named
+    number = ENUM_ARGUMENTS[api_path][1].get(name)
+    if number is None:
+        return args  # Let GIMP report it
+    return [*args[:position], number, *args[position + 1:]]
+
+# api_path -> position of a double array argument, e.g. polygon coordinates, in args as the
+# Gimp_* tools send them. Over msgpack it is sent as packed float64 rather than as one text
+# or list item per number.
+DOUBLE_ARRAYS = {
+    "Gimp.Image.select_polygon": 2,
+    "Gimp.Drawable.curves_spline": 2,
+    "Gimp.Drawable.curves_explicit": 2,
+    "Gimp.Path.stroke_new_from_points": 2,
+}
+
+def _pack_doubles(api_path, args, instance=False):
+    """args with api_path's double array packed for a msgpack connection, if it has one.
+    instance is whether args start with the instance, as in call_api."""
+    position = DOUBLE_ARRAYS.get(api_path)
+    if position is None or not _connection.packed:
+        return args
+    position += instance
+    if position >= len(args):
+        return args
+    try:
+        numbers = [float(number) for number in _coordinates(args[position])]
+    except (AttributeError, TypeError, ValueError):
+        return args  # Let GIMP report it
+    return [*args[:position], struct.pack(f"<{len(numbers)}d", *numbers), *args[position + 1:]]
+
+def _check_arguments(api_path, args, instance=False):
+    """The error for args that fail api_path's ARGUMENT_CHECKS entry, else None.
+    instance is whether args start with the instance, as in call_api."""
+    named = _enum_name(api_path, args, instance)
+    if named is not None:
+        values = ENUM_ARGUMENTS[api_path][1]
+        if named[1] in values and values[named[1]] is None:
+            return f"{named[1].lower()} is not available in GIMP 3"
+    check, error = ARGUMENT_CHECKS.get(api_path, (None, None))
+    try:
+        return None if check is None or check(args[1:] if instance else args) else error
+    except (IndexError, TypeError, AttributeError):
+        return None
+
+def _call_params(api_path, args, kwargs=None, instance=True):
+    """call_api params for one call, its arguments checked and converted for the wire.
+    Raises ValueError with the error of an ARGUMENT_CHECKS entry the args fail."""
+    error = _check_arguments(api_path, args, instance)
+    if error:
+        raise ValueError(error)
+    params = {"api_path": api_path, "args": _pack_doubles(api_path, _enum_numbers(api_path, args, instance), instance),
+              "kwargs": kwargs or {}}
+    if not instance:
+        params["instance"] = False
+    return params
+
+async def _call_api_impl(api_path, args, kwargs=None, instance=True):
+    """Run one GIMP API call; shared by call_api and the Gimp_* tools.
+
+    The Gimp_* tools pass instance=False: their args leave out the instance
+    a method's args start with in call_api.
+    """
+    try:
+        params = _call_params(api_path, args, kwargs, instance)
+    except ValueError as e:
+        return f"Error: {_dumps(str(e)).decode('utf-8')}"
+    if api_path in _getter_cache.api_paths:
+        key = (api_path, _dumps((args, kwargs, instance)))
+        return await _getter_cache.fetch(key, lambda: _send_read(key, params))
+    if api_path.rpartition('.')[2].startswith(READ_ONLY_PREFIXES):
+        return await _send_read((api_path, _dumps((args, kwargs, instance))), params)
+    return await _send_impl("call_api", params)
+
+# (generation, api_path, arguments) -> reply task for read-only calls waiting on GIMP
+_reads_in_flight = {}
+
+async def _send_read(key, params):
+    """Send a read-only call, sharing the reply of an identical one already in flight.
+
+    The key includes the cache generation, so a read sent after a modifying
+    call never shares the reply of one sent before it.
+    """
+    key = (_getter_cache.generation, *key)
+    task = _reads_in_flight.get(key)
+    if task is None:
+        task = _reads_in_flight[key] = asyncio.ensure_future(_send_impl("call_api", params, read_only=True))
+        task.add_done_callback(lambda _: _reads_in_flight.pop(key, None))
+    # One caller being cancelled must not cancel the reply the others are waiting on
+    return await asyncio.shield(task)
+
+async def _send_impl(command_type, params, read_only=False):
+    """Send one command to the plugin and render its result as the tool's JSON text.
+
+    Unless the command is read_only, cached getter results are dropped first.
+    """
+    if not read_only:
+        _getter_cache.invalidate()
     try:
-        conn = get_gimp_connection()
-        result = conn.send_command("call_api", {"api_path": api_path, "args": args, "kwargs": kwargs})
+        result = await _connection.send_command(command_type, params)
         if result["status"] == "success":
-            return json.dumps(result["result"])
+            return _dumps(result["result"], default=_encode_bytes).decode('utf-8')
         else:
-            return f"Error: {json.dumps(result["error"])}"
+            return f"Error: {_dumps(result['error']).decode('utf-8')}"
     except Exception as e:
         return f"Error: {e}"
 
 @mcp.tool()
-def Gimp_Brush_get_angle(ctx: Context, angle: float) -> str:
-    """Gets the rotation angle of a generated brush.
+async def batch_call_api(ctx: Context, calls: list) -> str:
+    """Call several GIMP 3.0 API methods in one round trip.
 
-    :param angle: The rotation angle of the brush in degree.
+    Parameters:
+    - calls: List of calls, each a dictionary with "api_path" and optional "args" and "kwargs"
+     as for call_api. They run in order.
+
+    Returns:
+    - JSON list with each call's result, or {"error": message} for calls that failed
     """
-    return call_api(ctx, 'Gimp.Brush.get_angle', args=[angle])
+    return await _call_batch_impl(calls)
 
-@mcp.tool()
-def Gimp_Brush_get_aspect_ratio(ctx: Context, aspect_ratio: float) -> str:
-    """Gets the aspect ratio of a generated brush.
+async def _call_batch_impl(calls, options=None):
+    """Run a list of call_api params in one batch request; shared by the batch tools.
 
-    :param aspect_ratio: The aspect ratio of the brush.
+    options are extra batch params, e.g. an image_id to make the calls one undo step on.
     """
-    return call_api(ctx, 'Gimp.Brush.get_aspect_ratio', args=[aspect_ratio])
+    _getter_cache.invalidate()
+    try:
+        result = await _connection.send_command("batch", {"calls": calls, **(options or {})})
+        if result["status"] != "success":
+            return f"Error: {_dumps(result['error']).decode('utf-8')}"
+        if not isinstance(result["result"], list):
+            return "Error: the GIMP plugin does not support batched calls; update gimp-mcp-plugin.py"
+        results = [r["result"] if r["status"] == "success" else {"error": r["error"]} for r in result["result"]]
+        return _dumps(results, default=_encode_bytes).decode('utf-8')
+    except Exception as e:
+        return f"Error: {e}"
 
-@mcp.tool()
-def Gimp_Brush_get_buffer(ctx: Context, max_width: int, max_height: int, format: str) -> str:
-    """Gets pixel data of the brush within the bounding box specified by max_width
+# Every plain GIMP API tool: (api_path, params, docstring[, wire order]).
+# params follow the tool signature as (name, type[, default]); the wire order
+# is given only where it differs, i.e. where an optional argument sits in the middle.
+TOOL_SPECS = [
+    ('Gimp.Brush.get_angle', [('angle', float)],
+     """Gets the rotation angle of a generated brush.
+
+    :param angle: The rotation angle of the brush in degree.
+    """),
+    ('Gimp.Brush.get_aspect_ratio', [('aspect_ratio', float)],
+     """Gets the aspect ratio of a generated brush.
+
+    :param aspect_ratio: The aspect ratio of the brush.
+    """),
+    ('Gimp.Brush.get_buffer', [('max_width', int), ('max_height', int), ('format', str)],
+     """Gets pixel data of the brush within the bounding box specified by max_width
 and max_height. The data will be scaled down so that it fits within this
 size without changing its ratio. If the brush is smaller than this size to
 begin with, it will not be scaled up.
@@ -104,31 +541,22 @@ begin with, it will not be scaled up.
     :param max_width: A maximum width for the returned buffer.
     :param max_height: A maximum height for the returned buffer.
     :param format: An optional Babl format.
-    """
-    return call_api(ctx, 'Gimp.Brush.get_buffer', args=[max_width, max_height, format])
-
-@mcp.tool()
-def Gimp_Brush_get_hardness(ctx: Context, hardness: float) -> str:
-    """Gets the hardness of a generated brush.
+    """),
+    ('Gimp.Brush.get_hardness', [('hardness', float)],
+     """Gets the hardness of a generated brush.
 
     :param hardness: The hardness of the brush.
-    """
-    return call_api(ctx, 'Gimp.Brush.get_hardness', args=[hardness])
-
-@mcp.tool()
-def Gimp_Brush_get_info(ctx: Context, width: int, height: int, mask_bpp: int, color_bpp: int) -> str:
-    """Gets information about the brush.
+    """),
+    ('Gimp.Brush.get_info', [('width', int), ('height', int), ('mask_bpp', int), ('color_bpp', int)],
+     """Gets information about the brush.
 
     :param width: The brush width.
     :param height: The brush height.
     :param mask_bpp: The brush mask bpp.
     :param color_bpp: The brush color bpp.
-    """
-    return call_api(ctx, 'Gimp.Brush.get_info', args=[width, height, mask_bpp, color_bpp])
-
-@mcp.tool()
-def Gimp_Brush_get_mask(ctx: Context, max_width: int, max_height: int, format: str) -> str:
-    """Gets mask data of the brush within the bounding box specified by max_width
+    """),
+    ('Gimp.Brush.get_mask', [('max_width', int), ('max_height', int), ('format', str)],
+     """Gets mask data of the brush within the bounding box specified by max_width
 and max_height. The data will be scaled down so that it fits within this
 size without changing its ratio. If the brush is smaller than this size to
 begin with, it will not be scaled up.
@@ -136,175 +564,112 @@ begin with, it will not be scaled up.
     :param max_width: A maximum width for the returned buffer.
     :param max_height: A maximum height for the returned buffer.
     :param format: An optional Babl format.
-    """
-    return call_api(ctx, 'Gimp.Brush.get_mask', args=[max_width, max_height, format])
-
-@mcp.tool()
-def Gimp_Brush_get_radius(ctx: Context, radius: float) -> str:
-    """Gets the radius of a generated brush.
+    """),
+    ('Gimp.Brush.get_radius', [('radius', float)],
+     """Gets the radius of a generated brush.
 
     :param radius: The radius of the brush in pixels.
-    """
-    return call_api(ctx, 'Gimp.Brush.get_radius', args=[radius])
-
-@mcp.tool()
-def Gimp_Brush_get_shape(ctx: Context, shape: str) -> str:
-    """Gets the shape of a generated brush.
+    """),
+    ('Gimp.Brush.get_shape', [('shape', str)],
+     """Gets the shape of a generated brush.
 
     :param shape: The brush shape.
-    """
-    return call_api(ctx, 'Gimp.Brush.get_shape', args=[shape])
-
-@mcp.tool()
-def Gimp_Brush_get_spacing(ctx: Context) -> str:
-    """Gets the brush spacing, the stamping frequency.
+    """),
+    ('Gimp.Brush.get_spacing', [],
+     """Gets the brush spacing, the stamping frequency.
 
-    """
-    return call_api(ctx, 'Gimp.Brush.get_spacing', args=[])
-
-@mcp.tool()
-def Gimp_Brush_get_spikes(ctx: Context, spikes: int) -> str:
-    """Gets the number of spikes for a generated brush.
+    """),
+    ('Gimp.Brush.get_spikes', [('spikes', int)],
+     """Gets the number of spikes for a generated brush.
 
     :param spikes: The number of spikes on the brush.
-    """
-    return call_api(ctx, 'Gimp.Brush.get_spikes', args=[spikes])
-
-@mcp.tool()
-def Gimp_Brush_is_generated(ctx: Context) -> str:
-    """Whether the brush is generated (parametric versus raster).
-
-    """
-    return call_api(ctx, 'Gimp.Brush.is_generated', args=[])
+    """),
+    ('Gimp.Brush.is_generated', [],
+     """Whether the brush is generated (parametric versus raster).
 
-@mcp.tool()
-def Gimp_Brush_set_angle(ctx: Context, angle_in: float, angle_out: float) -> str:
-    """Sets the rotation angle of a generated brush.
+    """),
+    ('Gimp.Brush.set_angle', [('angle_in', float), ('angle_out', float)],
+     """Sets the rotation angle of a generated brush.
 
     :param angle_in: The desired brush rotation angle in degrees.
     :param angle_out: The brush rotation angle actually assigned.
-    """
-    return call_api(ctx, 'Gimp.Brush.set_angle', args=[angle_in, angle_out])
-
-@mcp.tool()
-def Gimp_Brush_set_aspect_ratio(ctx: Context, aspect_ratio_in: float, aspect_ratio_out: float) -> str:
-    """Sets the aspect ratio of a generated brush.
+    """),
+    ('Gimp.Brush.set_aspect_ratio', [('aspect_ratio_in', float), ('aspect_ratio_out', float)],
+     """Sets the aspect ratio of a generated brush.
 
     :param aspect_ratio_in: The desired brush aspect ratio.
     :param aspect_ratio_out: The brush aspect ratio actually assigned.
-    """
-    return call_api(ctx, 'Gimp.Brush.set_aspect_ratio', args=[aspect_ratio_in, aspect_ratio_out])
-
-@mcp.tool()
-def Gimp_Brush_set_hardness(ctx: Context, hardness_in: float, hardness_out: float) -> str:
-    """Sets the hardness of a generated brush.
+    """),
+    ('Gimp.Brush.set_hardness', [('hardness_in', float), ('hardness_out', float)],
+     """Sets the hardness of a generated brush.
 
     :param hardness_in: The desired brush hardness.
     :param hardness_out: The brush hardness actually assigned.
-    """
-    return call_api(ctx, 'Gimp.Brush.set_hardness', args=[hardness_in, hardness_out])
-
-@mcp.tool()
-def Gimp_Brush_set_radius(ctx: Context, radius_in: float, radius_out: float) -> str:
-    """Sets the radius of a generated brush.
+    """),
+    ('Gimp.Brush.set_radius', [('radius_in', float), ('radius_out', float)],
+     """Sets the radius of a generated brush.
 
     :param radius_in: The desired brush radius in pixel.
     :param radius_out: The brush radius actually assigned.
-    """
-    return call_api(ctx, 'Gimp.Brush.set_radius', args=[radius_in, radius_out])
-
-@mcp.tool()
-def Gimp_Brush_set_shape(ctx: Context, shape_in: str, shape_out: str) -> str:
-    """Sets the shape of a generated brush.
+    """),
+    ('Gimp.Brush.set_shape', [('shape_in', str), ('shape_out', str)],
+     """Sets the shape of a generated brush.
 
     :param shape_in: The brush shape.
     :param shape_out: The brush shape actually assigned.
-    """
-    return call_api(ctx, 'Gimp.Brush.set_shape', args=[shape_in, shape_out])
-
-@mcp.tool()
-def Gimp_Brush_set_spacing(ctx: Context, spacing: int) -> str:
-    """Sets the brush spacing.
+    """),
+    ('Gimp.Brush.set_spacing', [('spacing', int)],
+     """Sets the brush spacing.
 
     :param spacing: The brush spacing.
-    """
-    return call_api(ctx, 'Gimp.Brush.set_spacing', args=[spacing])
-
-@mcp.tool()
-def Gimp_Brush_set_spikes(ctx: Context, spikes_in: int, spikes_out: int) -> str:
-    """Sets the number of spikes for a generated brush.
+    """),
+    ('Gimp.Brush.set_spikes', [('spikes_in', int), ('spikes_out', int)],
+     """Sets the number of spikes for a generated brush.
 
     :param spikes_in: The desired number of spikes.
     :param spikes_out: The number of spikes actually assigned.
-    """
-    return call_api(ctx, 'Gimp.Brush.set_spikes', args=[spikes_in, spikes_out])
-
-@mcp.tool()
-def Gimp_Channel_combine_masks(ctx: Context, channel2: str, operation: str, offx: int, offy: int) -> str:
-    """Combine two channel masks.
+    """),
+    ('Gimp.Channel.combine_masks', [('channel2', str), ('operation', str), ('offx', int), ('offy', int)],
+     """Combine two channel masks.
 
     :param channel2: The channel2.
     :param operation: The selection operation.
     :param offx: X offset between upper left corner of channels: (second - first).
     :param offy: Y offset between upper left corner of channels: (second - first).
-    """
-    return call_api(ctx, 'Gimp.Channel.combine_masks', args=[channel2, operation, offx, offy])
-
-@mcp.tool()
-def Gimp_Channel_copy(ctx: Context) -> str:
-    """Copy a channel.
-
-    """
-    return call_api(ctx, 'Gimp.Channel.copy', args=[])
-
-@mcp.tool()
-def Gimp_Channel_get_color(ctx: Context) -> str:
-    """Get the compositing color of the specified channel.
-
-    """
-    return call_api(ctx, 'Gimp.Channel.get_color', args=[])
-
-@mcp.tool()
-def Gimp_Channel_get_opacity(ctx: Context) -> str:
-    """Get the opacity of the specified channel.
+    """),
+    ('Gimp.Channel.copy', [],
+     """Copy a channel.
 
-    """
-    return call_api(ctx, 'Gimp.Channel.get_opacity', args=[])
+    """),
+    ('Gimp.Channel.get_color', [],
+     """Get the compositing color of the specified channel.
 
-@mcp.tool()
-def Gimp_Channel_get_show_masked(ctx: Context) -> str:
-    """Get the composite method of the specified channel.
+    """),
+    ('Gimp.Channel.get_opacity', [],
+     """Get the opacity of the specified channel.
 
-    """
-    return call_api(ctx, 'Gimp.Channel.get_show_masked', args=[])
+    """),
+    ('Gimp.Channel.get_show_masked', [],
+     """Get the composite method of the specified channel.
 
-@mcp.tool()
-def Gimp_Channel_set_color(ctx: Context, color: str) -> str:
-    """Set the compositing color of the specified channel.
+    """),
+    ('Gimp.Channel.set_color', [('color', str)],
+     """Set the compositing color of the specified channel.
 
     :param color: The new channel compositing color.
-    """
-    return call_api(ctx, 'Gimp.Channel.set_color', args=[color])
-
-@mcp.tool()
-def Gimp_Channel_set_opacity(ctx: Context, opacity: float) -> str:
-    """Set the opacity of the specified channel.
+    """),
+    ('Gimp.Channel.set_opacity', [('opacity', float)],
+     """Set the opacity of the specified channel.
 
     :param opacity: The new channel opacity.
-    """
-    return call_api(ctx, 'Gimp.Channel.set_opacity', args=[opacity])
-
-@mcp.tool()
-def Gimp_Channel_set_show_masked(ctx: Context, show_masked: bool) -> str:
-    """Set the composite method of the specified channel.
+    """),
+    ('Gimp.Channel.set_show_masked', [('show_masked', bool)],
+     """Set the composite method of the specified channel.
 
     :param show_masked: The new channel composite method.
-    """
-    return call_api(ctx, 'Gimp.Channel.set_show_masked', args=[show_masked])
-
-@mcp.tool()
-def Gimp_Choice_add(ctx: Context, nick: str, id: int, label: str, help: str) -> str:
-    """This procedure adds a new possible value to choice list of values.
+    """),
+    ('Gimp.Choice.add', [('nick', str), ('id', int), ('label', str), ('help', str)],
+     """This procedure adds a new possible value to choice list of values.
 The id is an optional integer identifier. This can be useful for instance
 when you want to work with different enum values mapped to each nick.
 
@@ -312,497 +677,304 @@ when you want to work with different enum values mapped to each nick.
     :param id: Optional integer ID for nick.
     :param label: The label of choice.
     :param help: Optional longer help text for nick.
-    """
-    return call_api(ctx, 'Gimp.Choice.add', args=[nick, id, label, help])
-
-@mcp.tool()
-def Gimp_Choice_get_documentation(ctx: Context, nick: str, label: str, help: str) -> str:
-    """Returns the documentation strings for nick.
+    """),
+    ('Gimp.Choice.get_documentation', [('nick', str), ('label', str), ('help', str)],
+     """Returns the documentation strings for nick.
 
     :param nick: The possible value’s nick you need documentation for.
     :param label: The label of nick.
     :param help: The help text of nick.
-    """
-    return call_api(ctx, 'Gimp.Choice.get_documentation', args=[nick, label, help])
-
-@mcp.tool()
-def Gimp_Choice_get_help(ctx: Context, nick: str) -> str:
-    """Returns the longer documentation for nick.
+    """),
+    ('Gimp.Choice.get_help', [('nick', str)],
+     """Returns the longer documentation for nick.
 
     :param nick: The nick to lookup.
-    """
-    return call_api(ctx, 'Gimp.Choice.get_help', args=[nick])
-
-@mcp.tool()
-def Gimp_Choice_get_id(ctx: Context, nick: str) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Choice.get_id', [('nick', str)],
+     """Available since: 3.0
 
     :param nick: The nick to lookup.
-    """
-    return call_api(ctx, 'Gimp.Choice.get_id', args=[nick])
-
-@mcp.tool()
-def Gimp_Choice_get_label(ctx: Context, nick: str) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Choice.get_label', [('nick', str)],
+     """Available since: 3.0
 
     :param nick: The nick to lookup.
-    """
-    return call_api(ctx, 'Gimp.Choice.get_label', args=[nick])
-
-@mcp.tool()
-def Gimp_Choice_is_valid(ctx: Context, nick: str) -> str:
-    """This procedure checks if the given nick is valid and refers to
+    """),
+    ('Gimp.Choice.is_valid', [('nick', str)],
+     """This procedure checks if the given nick is valid and refers to
 an existing choice.
 
     :param nick: The nick to check.
-    """
-    return call_api(ctx, 'Gimp.Choice.is_valid', args=[nick])
-
-@mcp.tool()
-def Gimp_Choice_list_nicks(ctx: Context) -> str:
-    """This procedure returns the list of nicks allowed for choice.
+    """),
+    ('Gimp.Choice.list_nicks', [],
+     """This procedure returns the list of nicks allowed for choice.
 
-    """
-    return call_api(ctx, 'Gimp.Choice.list_nicks', args=[])
-
-@mcp.tool()
-def Gimp_Choice_set_sensitive(ctx: Context, nick: str, sensitive: bool) -> str:
-    """Change the sensitivity of a possible nick. Technically a non-sensitive nick
+    """),
+    ('Gimp.Choice.set_sensitive', [('nick', str), ('sensitive', bool)],
+     """Change the sensitivity of a possible nick. Technically a non-sensitive nick
 means it cannot be chosen anymore (so gimp_choice_is_valid() will
 return FALSE; nevertheless gimp_choice_list_nicks() and other
 functions to get information about a choice will still function).
 
     :param nick: The nick to lookup.
     :param sensitive: No description available.
-    """
-    return call_api(ctx, 'Gimp.Choice.set_sensitive', args=[nick, sensitive])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_cmyk_color_profile(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_cmyk_color_profile', args=[])
+    """),
+    ('Gimp.ColorConfig.get_cmyk_color_profile', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorConfig_get_display_bpc(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_display_bpc', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_display_color_profile(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_display_color_profile', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_display_intent(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_display_intent', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_display_optimize(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_display_optimize', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_display_profile_from_gdk(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_display_profile_from_gdk', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_gray_color_profile(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_gray_color_profile', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_mode(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_mode', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_out_of_gamut_color(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_out_of_gamut_color', args=[])
-
-@mcp.tool()
-def Gimp_ColorConfig_get_rgb_color_profile(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorConfig.get_display_bpc', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_rgb_color_profile', args=[])
+    """),
+    ('Gimp.ColorConfig.get_display_color_profile', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorConfig_get_simulation_bpc(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorConfig.get_display_intent', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_simulation_bpc', args=[])
+    """),
+    ('Gimp.ColorConfig.get_display_optimize', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorConfig_get_simulation_color_profile(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorConfig.get_display_profile_from_gdk', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_simulation_color_profile', args=[])
+    """),
+    ('Gimp.ColorConfig.get_gray_color_profile', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorConfig_get_simulation_gamut_check(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorConfig.get_mode', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_simulation_gamut_check', args=[])
+    """),
+    ('Gimp.ColorConfig.get_out_of_gamut_color', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_ColorConfig_get_simulation_intent(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorConfig.get_rgb_color_profile', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_simulation_intent', args=[])
+    """),
+    ('Gimp.ColorConfig.get_simulation_bpc', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorConfig_get_simulation_optimize(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorConfig.get_simulation_color_profile', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorConfig.get_simulation_optimize', args=[])
+    """),
+    ('Gimp.ColorConfig.get_simulation_gamut_check', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorProfile_get_copyright(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorConfig.get_simulation_intent', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_copyright', args=[])
+    """),
+    ('Gimp.ColorConfig.get_simulation_optimize', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorProfile_get_description(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorProfile.get_copyright', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_description', args=[])
+    """),
+    ('Gimp.ColorProfile.get_description', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorProfile_get_format(ctx: Context, format: str, intent: str, error: str = None) -> str:
-    """This function takes a GimpColorProfile and a Babl format and
+    """),
+    ('Gimp.ColorProfile.get_format', [('format', str), ('intent', str), ('error', str, None)],
+     """This function takes a GimpColorProfile and a Babl format and
 returns a new Babl format with profile‘s RGB primaries and TRC,
 and format‘s pixel layout.
 
     :param format: A Babl format.
     :param intent: A GimpColorRenderingIntent.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_format', args=[format, intent, error])
-
-@mcp.tool()
-def Gimp_ColorProfile_get_icc_profile(ctx: Context, length: int) -> str:
-    """This function returns profile as ICC profile data. The returned
+    """),
+    ('Gimp.ColorProfile.get_icc_profile', [('length', int)],
+     """This function returns profile as ICC profile data. The returned
 memory belongs to profile and must not be modified or freed.
 
     :param length: Return location for the number of bytes.
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_icc_profile', args=[length])
-
-@mcp.tool()
-def Gimp_ColorProfile_get_label(ctx: Context) -> str:
-    """This function returns a string containing profile‘s “title”, a
+    """),
+    ('Gimp.ColorProfile.get_label', [],
+     """This function returns a string containing profile‘s “title”, a
 string that can be used to label the profile in a user interface.
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_label', args=[])
-
-@mcp.tool()
-def Gimp_ColorProfile_get_lcms_profile(ctx: Context) -> str:
-    """This function returns profile‘s cmsHPROFILE. The returned
+    """),
+    ('Gimp.ColorProfile.get_lcms_profile', [],
+     """This function returns profile‘s cmsHPROFILE. The returned
 value belongs to profile and must not be modified or freed.
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_lcms_profile', args=[])
-
-@mcp.tool()
-def Gimp_ColorProfile_get_manufacturer(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_manufacturer', args=[])
-
-@mcp.tool()
-def Gimp_ColorProfile_get_model(ctx: Context) -> str:
-    """Available since: 2.10
+    """),
+    ('Gimp.ColorProfile.get_manufacturer', [],
+     """Available since: 2.10
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_model', args=[])
+    """),
+    ('Gimp.ColorProfile.get_model', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorProfile_get_space(ctx: Context, intent: str, error: str = None) -> str:
-    """This function returns the Babl space of profile, for the
+    """),
+    ('Gimp.ColorProfile.get_space', [('intent', str), ('error', str, None)],
+     """This function returns the Babl space of profile, for the
 specified intent.
 
     :param intent: A GimpColorRenderingIntent.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_space', args=[intent, error])
-
-@mcp.tool()
-def Gimp_ColorProfile_get_summary(ctx: Context) -> str:
-    """This function return a string containing a multi-line summary of
+    """),
+    ('Gimp.ColorProfile.get_summary', [],
+     """This function return a string containing a multi-line summary of
 profile‘s description, model, manufacturer and copyright, to be
 used as detailed information about the profile in a user interface.
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.get_summary', args=[])
-
-@mcp.tool()
-def Gimp_ColorProfile_is_cmyk(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.is_cmyk', args=[])
+    """),
+    ('Gimp.ColorProfile.is_cmyk', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorProfile_is_equal(ctx: Context, profile2: str) -> str:
-    """Compares two profiles.
+    """),
+    ('Gimp.ColorProfile.is_equal', [('profile2', str)],
+     """Compares two profiles.
 
     :param profile2: A GimpColorProfile.
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.is_equal', args=[profile2])
-
-@mcp.tool()
-def Gimp_ColorProfile_is_gray(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.is_gray', args=[])
+    """),
+    ('Gimp.ColorProfile.is_gray', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorProfile_is_linear(ctx: Context) -> str:
-    """This function determines is the ICC profile represented by a GimpColorProfile
+    """),
+    ('Gimp.ColorProfile.is_linear', [],
+     """This function determines is the ICC profile represented by a GimpColorProfile
 is a linear RGB profile or not, some profiles that are LUTs though linear
 will also return FALSE;
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.is_linear', args=[])
-
-@mcp.tool()
-def Gimp_ColorProfile_is_rgb(ctx: Context) -> str:
-    """Available since: 2.10
-
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.is_rgb', args=[])
+    """),
+    ('Gimp.ColorProfile.is_rgb', [],
+     """Available since: 2.10
 
-@mcp.tool()
-def Gimp_ColorProfile_new_linear_from_color_profile(ctx: Context) -> str:
-    """This function creates a new RGB GimpColorProfile with a linear TRC
+    """),
+    ('Gimp.ColorProfile.new_linear_from_color_profile', [],
+     """This function creates a new RGB GimpColorProfile with a linear TRC
 and profile‘s RGB chromacities and whitepoint.
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.new_linear_from_color_profile', args=[])
-
-@mcp.tool()
-def Gimp_ColorProfile_new_srgb_trc_from_color_profile(ctx: Context) -> str:
-    """This function creates a new RGB GimpColorProfile with a sRGB gamma
+    """),
+    ('Gimp.ColorProfile.new_srgb_trc_from_color_profile', [],
+     """This function creates a new RGB GimpColorProfile with a sRGB gamma
 TRC and profile‘s RGB chromacities and whitepoint.
 
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.new_srgb_trc_from_color_profile', args=[])
-
-@mcp.tool()
-def Gimp_ColorProfile_save_to_file(ctx: Context, file: str, error: str = None) -> str:
-    """This function saves profile to file as ICC profile.
+    """),
+    ('Gimp.ColorProfile.save_to_file', [('file', str), ('error', str, None)],
+     """This function saves profile to file as ICC profile.
 
     :param file: A GFile.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.ColorProfile.save_to_file', args=[file, error])
-
-@mcp.tool()
-def Gimp_ColorTransform_process_buffer(ctx: Context, src_buffer: str, src_rect: str, dest_buffer: str, dest_rect: str) -> str:
-    """This function transforms buffer into another buffer.
+    """),
+    ('Gimp.ColorTransform.process_buffer', [('src_buffer', str), ('src_rect', str), ('dest_buffer', str), ('dest_rect', str)],
+     """This function transforms buffer into another buffer.
 
     :param src_buffer: Source GeglBuffer.
     :param src_rect: Rectangle in src_buffer.
     :param dest_buffer: Destination GeglBuffer.
     :param dest_rect: Rectangle in dest_buffer.
-    """
-    return call_api(ctx, 'Gimp.ColorTransform.process_buffer', args=[src_buffer, src_rect, dest_buffer, dest_rect])
-
-@mcp.tool()
-def Gimp_ColorTransform_process_pixels(ctx: Context, src_format: str, src_pixels: str = None, dest_format: str = None, dest_pixels: str = None, length: int = 0) -> str:
-    """This function transforms a contiguous line of pixels.
+    """),
+    ('Gimp.ColorTransform.process_pixels', [('src_format', str), ('src_pixels', str, None), ('dest_format', str, None), ('dest_pixels', str, None), ('length', int, 0)],
+     """This function transforms a contiguous line of pixels.
 
     :param src_format: Babl format of src_pixels.
     :param src_pixels: Pointer to the source pixels.
     :param dest_format: Babl format of dest_pixels.
     :param dest_pixels: Pointer to the destination pixels.
     :param length: Number of pixels to process.
-    """
-    return call_api(ctx, 'Gimp.ColorTransform.process_pixels', args=[src_format, src_pixels, dest_format, dest_pixels, length])
+    """),
+    ('Gimp.Display.delete', [],
+     """Delete the specified display.
 
-@mcp.tool()
-def Gimp_Display_delete(ctx: Context) -> str:
-    """Delete the specified display.
+    """),
+    ('Gimp.Display.get_id', [],
+     """mostly internal data and not reusable across sessions.
 
-    """
-    return call_api(ctx, 'Gimp.Display.delete', args=[])
+    """),
+    ('Gimp.Display.get_window_handle', [],
+     """Get a handle to the native window for an image display.
 
-@mcp.tool()
-def Gimp_Display_get_id(ctx: Context) -> str:
-    """mostly internal data and not reusable across sessions.
+    """),
+    ('Gimp.Display.is_valid', [],
+     """Returns TRUE if the display is valid.
 
-    """
-    return call_api(ctx, 'Gimp.Display.get_id', args=[])
+    """),
+    ('Gimp.Display.present', [],
+     """Present the specified display.
 
-@mcp.tool()
-def Gimp_Display_get_window_handle(ctx: Context) -> str:
-    """Get a handle to the native window for an image display.
+    """),
+    ('Gimp.Drawable.append_filter', [('filter', str)],
+     """This procedure appends the specified drawable effect at the top of the
+    effect list of drawable.
 
-    """
-    return call_api(ctx, 'Gimp.Display.get_window_handle', args=[])
+    :param filter: The drawable filter to append.
+    """),
+    ('Gimp.Drawable.brightness_contrast', [('brightness', float), ('contrast', float)],
+     """Modify brightness/contrast in the specified drawable.
 
-@mcp.tool()
-def Gimp_Display_is_valid(ctx: Context) -> str:
-    """Returns TRUE if the display is valid.
+    :param brightness: Brightness adjustment.
+    :param contrast: Contrast adjustment.
+    """),
+    ('Gimp.Drawable.color_balance', [('transfer_mode', str), ('preserve_lum', bool), ('cyan_red', float), ('magenta_green', float), ('yellow_blue', float)],
+     """Modify the color balance of the specified drawable.
 
-    """
-    return call_api(ctx, 'Gimp.Display.is_valid', args=[])
+    :param transfer_mode: Transfer mode.
+    :param preserve_lum: Preserve luminosity values at each pixel.
+    :param cyan_red: Cyan-Red color balance.
+    :param magenta_green: Magenta-Green color balance.
+    :param yellow_blue: Yellow-Blue color balance.
+    """),
+    ('Gimp.Drawable.colorize_hsl', [('hue', float), ('saturation', float), ('lightness', float)],
+     """Render the drawable as a grayscale image seen through a colored glass.
 
-@mcp.tool()
-def Gimp_Display_present(ctx: Context) -> str:
-    """Present the specified display.
+    :param hue: Hue in degrees.
+    :param saturation: Saturation in percent.
+    :param lightness: Lightness in percent.
+    """),
+    ('Gimp.Drawable.curves_explicit', [('channel', str), ('num_values', int), ('values', str)],
+     """Modifies the intensity curve(s) for specified drawable.
 
-    """
-    return call_api(ctx, 'Gimp.Display.present', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_append_filter(ctx: Context, filter: str) -> str:
-    """This procedure appends the specified drawable effect at the top of the
-    effect list of drawable.
-
-    :param filter: The drawable filter to append.
-    """
-    return call_api(ctx, 'Gimp.Drawable.append_filter', args=[filter])
-
-@mcp.tool()
-def Gimp_Drawable_append_new_filter(ctx: Context, operation_name: str, name: str, mode: str, opacity: float, *filter_args: str) -> str:
-    """Utility function which combines gimp_drawable_filter_new()
-    followed by setting arguments for the
-    GimpDrawableFilterConfig returned by
-    gimp_drawable_filter_get_config(), and finally appending with
-    gimp_drawable_append_filter()
-
-    :param operation_name: The GEGL operation’s name.
-    :param name: The effect name.
-    :param mode: The blend mode.
-    :param opacity: The opacity from 0.0 (transparent) to 1.0 (opaque).
-    :param filter_args: A variable-length list of operation argument names and values.
-                        The list will be null-terminated automatically.
-    """
-    # Build the argument list by appending a None to serve as a null terminator.
-    args = [operation_name, name, mode, opacity] + list(filter_args) + [None]
-    return call_api(ctx, 'Gimp.Drawable.append_new_filter', args=args)
-
-@mcp.tool()
-def Gimp_Drawable_brightness_contrast(ctx: Context, brightness: float, contrast: float) -> str:
-    """Modify brightness/contrast in the specified drawable.
-
-    :param brightness: Brightness adjustment.
-    :param contrast: Contrast adjustment.
-    """
-    return call_api(ctx, 'Gimp.Drawable.brightness_contrast', args=[brightness, contrast])
-
-@mcp.tool()
-def Gimp_Drawable_color_balance(ctx: Context, transfer_mode: str, preserve_lum: bool, cyan_red: float, magenta_green: float, yellow_blue: float) -> str:
-    """Modify the color balance of the specified drawable.
-
-    :param transfer_mode: Transfer mode.
-    :param preserve_lum: Preserve luminosity values at each pixel.
-    :param cyan_red: Cyan-Red color balance.
-    :param magenta_green: Magenta-Green color balance.
-    :param yellow_blue: Yellow-Blue color balance.
-    """
-    return call_api(ctx, 'Gimp.Drawable.color_balance', args=[transfer_mode, preserve_lum, cyan_red, magenta_green, yellow_blue])
-
-@mcp.tool()
-def Gimp_Drawable_colorize_hsl(ctx: Context, hue: float, saturation: float, lightness: float) -> str:
-    """Render the drawable as a grayscale image seen through a colored glass.
-
-    :param hue: Hue in degrees.
-    :param saturation: Saturation in percent.
-    :param lightness: Lightness in percent.
-    """
-    return call_api(ctx, 'Gimp.Drawable.colorize_hsl', args=[hue, saturation, lightness])
-
-@mcp.tool()
-def Gimp_Drawable_curves_explicit(ctx: Context, channel: str, num_values: int, values: str) -> str:
-    """Modifies the intensity curve(s) for specified drawable.
-
-    :param channel: The channel to modify.
-    :param num_values: The number of values in the new curve.
-    :param values: The explicit curve.
-    """
-    return call_api(ctx, 'Gimp.Drawable.curves_explicit', args=[channel, num_values, values])
-
-@mcp.tool()
-def Gimp_Drawable_curves_spline(ctx: Context, channel: str, num_points: int, points: str) -> str:
-    """Modifies the intensity curve(s) for specified drawable.
+    :param channel: The channel to modify.
+    :param num_values: The number of values in the new curve.
+    :param values: The explicit curve.
+    """),
+    ('Gimp.Drawable.curves_spline', [('channel', str), ('num_points', int), ('points', str)],
+     """Modifies the intensity curve(s) for specified drawable.
 
     :param channel: The channel to modify.
     :param num_points: The number of values in the control point array.
     :param points: The spline control points: { cp1.x, cp1.y, cp2.x, cp2.y, … }.
-    """
-    return call_api(ctx, 'Gimp.Drawable.curves_spline', args=[channel, num_points, points])
-
-@mcp.tool()
-def Gimp_Drawable_desaturate(ctx: Context, desaturate_mode: str) -> str:
-    """Desaturate the contents of the specified drawable, with the
+    """),
+    ('Gimp.Drawable.desaturate', [('desaturate_mode', str)],
+     """Desaturate the contents of the specified drawable, with the
 specified formula.
 
     :param desaturate_mode: The formula to use to desaturate.
-    """
-    return call_api(ctx, 'Gimp.Drawable.desaturate', args=[desaturate_mode])
-
-@mcp.tool()
-def Gimp_Drawable_edit_bucket_fill(ctx: Context, fill_type: str, x: float, y: float) -> str:
-    """Fill the area by a seed fill starting at the specified coordinates.
+    """),
+    ('Gimp.Drawable.edit_bucket_fill', [('fill_type', str), ('x', float), ('y', float)],
+     """Fill the area by a seed fill starting at the specified coordinates.
 
     :param fill_type: The type of fill.
     :param x: The x coordinate of this bucket fill’s application.
     :param y: The y coordinate of this bucket fill’s application.
-    """
-    return call_api(ctx, 'Gimp.Drawable.edit_bucket_fill', args=[fill_type, x, y])
-
-@mcp.tool()
-def Gimp_Drawable_edit_clear(ctx: Context) -> str:
-    """Clear selected area of drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.edit_clear', args=[])
+    """),
+    ('Gimp.Drawable.edit_clear', [],
+     """Clear selected area of drawable.
 
-@mcp.tool()
-def Gimp_Drawable_edit_fill(ctx: Context, fill_type: str) -> str:
-    """Fill selected area of drawable.
+    """),
+    ('Gimp.Drawable.edit_fill', [('fill_type', str)],
+     """Fill selected area of drawable.
 
     :param fill_type: The type of fill.
-    """
-    return call_api(ctx, 'Gimp.Drawable.edit_fill', args=[fill_type])
-
-@mcp.tool()
-def Gimp_Drawable_edit_gradient_fill(ctx: Context, gradient_type: str, offset: float, supersample: bool, supersample_max_depth: int, supersample_threshold: float, dither: bool, x1: float, y1: float, x2: float, y2: float) -> str:
-    """Draw a gradient between the starting and ending coordinates with the
+    """),
+    ('Gimp.Drawable.edit_gradient_fill', [('gradient_type', str), ('offset', float), ('supersample', bool), ('supersample_max_depth', int), ('supersample_threshold', float), ('dither', bool), ('x1', float), ('y1', float), ('x2', float), ('y2', float)],
+     """Draw a gradient between the starting and ending coordinates with the
 specified gradient type.
 
     :param gradient_type: The type of gradient.
@@ -815,135 +987,87 @@ specified gradient type.
     :param y1: The y coordinate of this gradient’s starting point.
     :param x2: The x coordinate of this gradient’s ending point.
     :param y2: The y coordinate of this gradient’s ending point.
-    """
-    return call_api(ctx, 'Gimp.Drawable.edit_gradient_fill', args=[gradient_type, offset, supersample, supersample_max_depth, supersample_threshold, dither, x1, y1, x2, y2])
-
-@mcp.tool()
-def Gimp_Drawable_edit_stroke_item(ctx: Context, item: str) -> str:
-    """Stroke the specified item
+    """),
+    ('Gimp.Drawable.edit_stroke_item', [('item', str)],
+     """Stroke the specified item
 
     :param item: The item to stroke.
-    """
-    return call_api(ctx, 'Gimp.Drawable.edit_stroke_item', args=[item])
-
-@mcp.tool()
-def Gimp_Drawable_edit_stroke_selection(ctx: Context) -> str:
-    """Stroke the current selection
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.edit_stroke_selection', args=[])
+    """),
+    ('Gimp.Drawable.edit_stroke_selection', [],
+     """Stroke the current selection
 
-@mcp.tool()
-def Gimp_Drawable_equalize(ctx: Context, mask_only: bool) -> str:
-    """Equalize the contents of the specified drawable.
+    """),
+    ('Gimp.Drawable.equalize', [('mask_only', bool)],
+     """Equalize the contents of the specified drawable.
 
     :param mask_only: Equalization option.
-    """
-    return call_api(ctx, 'Gimp.Drawable.equalize', args=[mask_only])
-
-@mcp.tool()
-def Gimp_Drawable_extract_component(ctx: Context, component: int, invert: bool, linear: bool) -> str:
-    """Extract a color model component.
+    """),
+    ('Gimp.Drawable.extract_component', [('component', int), ('invert', bool), ('linear', bool)],
+     """Extract a color model component.
 
     :param component: Component (RGB Red (0), RGB Green (1), RGB Blue (2), Hue (3), HSV Saturation (4), HSV Value (5), HSL Saturation (6), HSL Lightness (7), CMYK Cyan (8), CMYK Magenta (9), CMYK Yellow (10), CMYK Key (11), Y’CbCr Y’ (12), Y’CbCr Cb (13), Y’CbCr Cr (14), LAB L (15), LAB A (16), LAB B (17), LCH C(ab) (18), LCH H(ab) (19), Alpha (20)).
     :param invert: Invert the extracted component.
     :param linear: Use linear output instead of gamma corrected.
-    """
-    return call_api(ctx, 'Gimp.Drawable.extract_component', args=[component, invert, linear])
-
-@mcp.tool()
-def Gimp_Drawable_fill(ctx: Context, fill_type: str) -> str:
-    """Fill the drawable with the specified fill mode.
+    """),
+    ('Gimp.Drawable.fill', [('fill_type', str)],
+     """Fill the drawable with the specified fill mode.
 
     :param fill_type: The type of fill.
-    """
-    return call_api(ctx, 'Gimp.Drawable.fill', args=[fill_type])
-
-@mcp.tool()
-def Gimp_Drawable_foreground_extract(ctx: Context, mode: str, mask: str) -> str:
-    """Extract the foreground of a drawable using a given trimap.
+    """),
+    ('Gimp.Drawable.foreground_extract', [('mode', str), ('mask', str)],
+     """Extract the foreground of a drawable using a given trimap.
 
     :param mode: The algorithm to use.
     :param mask: Tri-Map.
-    """
-    return call_api(ctx, 'Gimp.Drawable.foreground_extract', args=[mode, mask])
-
-@mcp.tool()
-def Gimp_Drawable_free_shadow(ctx: Context) -> str:
-    """Free the specified drawable’s shadow data (if it exists).
+    """),
+    ('Gimp.Drawable.free_shadow', [],
+     """Free the specified drawable’s shadow data (if it exists).
 
-    """
-    return call_api(ctx, 'Gimp.Drawable.free_shadow', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_get_bpp(ctx: Context) -> str:
-    """Returns the bytes per pixel.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_bpp', args=[])
+    """),
+    ('Gimp.Drawable.get_bpp', [],
+     """Returns the bytes per pixel.
 
-@mcp.tool()
-def Gimp_Drawable_get_buffer(ctx: Context) -> str:
-    """Returns a GeglBuffer of a specified drawable. The buffer can be used
+    """),
+    ('Gimp.Drawable.get_buffer', [],
+     """Returns a GeglBuffer of a specified drawable. The buffer can be used
 like any other GEGL buffer. Its data will we synced back with the core
 drawable when the buffer gets destroyed, or when gegl_buffer_flush()
 is called.
 
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_buffer', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_get_filters(ctx: Context) -> str:
-    """Returns the list of filters applied to the drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_filters', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_get_format(ctx: Context) -> str:
-    """Returns the Babl format of the drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_format', args=[])
+    """),
+    ('Gimp.Drawable.get_filters', [],
+     """Returns the list of filters applied to the drawable.
 
-@mcp.tool()
-def Gimp_Drawable_get_height(ctx: Context) -> str:
-    """Returns the height of the drawable.
+    """),
+    ('Gimp.Drawable.get_format', [],
+     """Returns the Babl format of the drawable.
 
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_height', args=[])
+    """),
+    ('Gimp.Drawable.get_height', [],
+     """Returns the height of the drawable.
 
-@mcp.tool()
-def Gimp_Drawable_get_offsets(ctx: Context, offset_x: int, offset_y: int) -> str:
-    """Returns the offsets for the drawable.
+    """),
+    ('Gimp.Drawable.get_offsets', [('offset_x', int), ('offset_y', int)],
+     """Returns the offsets for the drawable.
 
     :param offset_x: X offset of drawable.
     :param offset_y: Y offset of drawable.
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_offsets', args=[offset_x, offset_y])
-
-@mcp.tool()
-def Gimp_Drawable_get_pixel(ctx: Context, x_coord: int, y_coord: int) -> str:
-    """Gets the value of the pixel at the specified coordinates.
+    """),
+    ('Gimp.Drawable.get_pixel', [('x_coord', int), ('y_coord', int)],
+     """Gets the value of the pixel at the specified coordinates.
 
     :param x_coord: The x coordinate.
     :param y_coord: The y coordinate.
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_pixel', args=[x_coord, y_coord])
-
-@mcp.tool()
-def Gimp_Drawable_get_shadow_buffer(ctx: Context) -> str:
-    """Returns a GeglBuffer of a specified drawable’s shadow tiles. The
+    """),
+    ('Gimp.Drawable.get_shadow_buffer', [],
+     """Returns a GeglBuffer of a specified drawable’s shadow tiles. The
 buffer can be used like any other GEGL buffer. Its data will we
 synced back with the core drawable’s shadow tiles when the buffer
 gets destroyed, or when gegl_buffer_flush() is called.
 
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_shadow_buffer', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_get_sub_thumbnail(ctx: Context, src_x: int, src_y: int, src_width: int, src_height: int, dest_width: int, dest_height: int, alpha: str) -> str:
-    """Retrieves a thumbnail pixbuf for the drawable identified by
+    """),
+    ('Gimp.Drawable.get_sub_thumbnail', [('src_x', int), ('src_y', int), ('src_width', int), ('src_height', int), ('dest_width', int), ('dest_height', int), ('alpha', str)],
+     """Retrieves a thumbnail pixbuf for the drawable identified by
 drawable. The thumbnail will be not larger than the requested size.
 
     :param src_x: The x coordinate of the area.
@@ -953,12 +1077,9 @@ drawable. The thumbnail will be not larger than the requested size.
     :param dest_width: The requested thumbnail width  (<= 1024 pixels)
     :param dest_height: The requested thumbnail height (<= 1024 pixels)
     :param alpha: How to handle an alpha channel.
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_sub_thumbnail', args=[src_x, src_y, src_width, src_height, dest_width, dest_height, alpha])
-
-@mcp.tool()
-def Gimp_Drawable_get_sub_thumbnail_data(ctx: Context, src_x: int, src_y: int, src_width: int, src_height: int, dest_width: int, dest_height: int, actual_width: int, actual_height: int, bpp: int) -> str:
-    """Retrieves thumbnail data for the drawable identified by drawable.
+    """),
+    ('Gimp.Drawable.get_sub_thumbnail_data', [('src_x', int), ('src_y', int), ('src_width', int), ('src_height', int), ('dest_width', int), ('dest_height', int), ('actual_width', int), ('actual_height', int), ('bpp', int)],
+     """Retrieves thumbnail data for the drawable identified by drawable.
 The thumbnail will be not larger than the requested size.
 
     :param src_x: The x coordinate of the area.
@@ -970,23 +1091,17 @@ The thumbnail will be not larger than the requested size.
     :param actual_width: The width of the returned thumbnail.
     :param actual_height: The height of the returned thumbnail.
     :param bpp: The bytes per pixel of the returned thumbnail data.
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_sub_thumbnail_data', args=[src_x, src_y, src_width, src_height, dest_width, dest_height, actual_width, actual_height, bpp])
-
-@mcp.tool()
-def Gimp_Drawable_get_thumbnail(ctx: Context, width: int, height: int, alpha: str) -> str:
-    """Retrieves a thumbnail pixbuf for the drawable identified by
+    """),
+    ('Gimp.Drawable.get_thumbnail', [('width', int), ('height', int), ('alpha', str)],
+     """Retrieves a thumbnail pixbuf for the drawable identified by
 drawable. The thumbnail will be not larger than the requested size.
 
     :param width: The requested thumbnail width  (<= 1024 pixels)
     :param height: The requested thumbnail height (<= 1024 pixels)
     :param alpha: How to handle an alpha channel.
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_thumbnail', args=[width, height, alpha])
-
-@mcp.tool()
-def Gimp_Drawable_get_thumbnail_data(ctx: Context, width: int, height: int, actual_width: int, actual_height: int, bpp: int) -> str:
-    """Retrieves thumbnail data for the drawable identified by drawable.
+    """),
+    ('Gimp.Drawable.get_thumbnail_data', [('width', int), ('height', int), ('actual_width', int), ('actual_height', int), ('bpp', int)],
+     """Retrieves thumbnail data for the drawable identified by drawable.
 The thumbnail will be not larger than the requested size.
 
     :param width: The requested thumbnail width  (<= 1024 pixels)
@@ -994,33 +1109,21 @@ The thumbnail will be not larger than the requested size.
     :param actual_width: The resulting thumbnail’s actual width.
     :param actual_height: The resulting thumbnail’s actual height.
     :param bpp: The bytes per pixel of the returned thubmnail data.
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_thumbnail_data', args=[width, height, actual_width, actual_height, bpp])
-
-@mcp.tool()
-def Gimp_Drawable_get_thumbnail_format(ctx: Context) -> str:
-    """Returns the Babl thumbnail format of the drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_thumbnail_format', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_get_width(ctx: Context) -> str:
-    """Returns the width of the drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.get_width', args=[])
+    """),
+    ('Gimp.Drawable.get_thumbnail_format', [],
+     """Returns the Babl thumbnail format of the drawable.
 
-@mcp.tool()
-def Gimp_Drawable_has_alpha(ctx: Context) -> str:
-    """Returns TRUE if the drawable has an alpha channel.
+    """),
+    ('Gimp.Drawable.get_width', [],
+     """Returns the width of the drawable.
 
-    """
-    return call_api(ctx, 'Gimp.Drawable.has_alpha', args=[])
+    """),
+    ('Gimp.Drawable.has_alpha', [],
+     """Returns TRUE if the drawable has an alpha channel.
 
-@mcp.tool()
-def Gimp_Drawable_histogram(ctx: Context, channel: str, start_range: float, end_range: float, mean: float, std_dev: float, median: float, pixels: float, count: float, percentile: float) -> str:
-    """Returns information on the intensity histogram for the specified drawable.
+    """),
+    ('Gimp.Drawable.histogram', [('channel', str), ('start_range', float), ('end_range', float), ('mean', float), ('std_dev', float), ('median', float), ('pixels', float), ('count', float), ('percentile', float)],
+     """Returns information on the intensity histogram for the specified drawable.
 
     :param channel: The channel to query.
     :param start_range: Start of the intensity measurement range.
@@ -1031,53 +1134,35 @@ def Gimp_Drawable_histogram(ctx: Context, channel: str, start_range: float, end_
     :param pixels: Alpha-weighted pixel count for entire image.
     :param count: Alpha-weighted pixel count for range.
     :param percentile: Percentile that range falls under.
-    """
-    return call_api(ctx, 'Gimp.Drawable.histogram', args=[channel, start_range, end_range, mean, std_dev, median, pixels, count, percentile])
-
-@mcp.tool()
-def Gimp_Drawable_hue_saturation(ctx: Context, hue_range: str, hue_offset: float, lightness: float, saturation: float, overlap: float) -> str:
-    """Modify hue, lightness, and saturation in the specified drawable.
+    """),
+    ('Gimp.Drawable.hue_saturation', [('hue_range', str), ('hue_offset', float), ('lightness', float), ('saturation', float), ('overlap', float)],
+     """Modify hue, lightness, and saturation in the specified drawable.
 
     :param hue_range: Range of affected hues.
     :param hue_offset: Hue offset in degrees.
     :param lightness: Lightness modification.
     :param saturation: Saturation modification.
     :param overlap: Overlap other hue channels.
-    """
-    return call_api(ctx, 'Gimp.Drawable.hue_saturation', args=[hue_range, hue_offset, lightness, saturation, overlap])
-
-@mcp.tool()
-def Gimp_Drawable_invert(ctx: Context, linear: bool) -> str:
-    """Invert the contents of the specified drawable.
+    """),
+    ('Gimp.Drawable.invert', [('linear', bool)],
+     """Invert the contents of the specified drawable.
 
     :param linear: Whether to invert in linear space.
-    """
-    return call_api(ctx, 'Gimp.Drawable.invert', args=[linear])
-
-@mcp.tool()
-def Gimp_Drawable_is_gray(ctx: Context) -> str:
-    """Returns whether the drawable is a grayscale type.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.is_gray', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_is_indexed(ctx: Context) -> str:
-    """Returns whether the drawable is an indexed type.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.is_indexed', args=[])
+    """),
+    ('Gimp.Drawable.is_gray', [],
+     """Returns whether the drawable is a grayscale type.
 
-@mcp.tool()
-def Gimp_Drawable_is_rgb(ctx: Context) -> str:
-    """Returns whether the drawable is an RGB type.
+    """),
+    ('Gimp.Drawable.is_indexed', [],
+     """Returns whether the drawable is an indexed type.
 
-    """
-    return call_api(ctx, 'Gimp.Drawable.is_rgb', args=[])
+    """),
+    ('Gimp.Drawable.is_rgb', [],
+     """Returns whether the drawable is an RGB type.
 
-@mcp.tool()
-def Gimp_Drawable_levels(ctx: Context, channel: str, low_input: float, high_input: float, clamp_input: bool, gamma: float, low_output: float, high_output: float, clamp_output: bool) -> str:
-    """Modifies intensity levels in the specified drawable.
+    """),
+    ('Gimp.Drawable.levels', [('channel', str), ('low_input', float), ('high_input', float), ('clamp_input', bool), ('gamma', float), ('low_output', float), ('high_output', float), ('clamp_output', bool)],
+     """Modifies intensity levels in the specified drawable.
 
     :param channel: The channel to modify.
     :param low_input: Intensity of lowest input.
@@ -1087,115 +1172,67 @@ def Gimp_Drawable_levels(ctx: Context, channel: str, low_input: float, high_inpu
     :param low_output: Intensity of lowest output.
     :param high_output: Intensity of highest output.
     :param clamp_output: Clamp final output values.
-    """
-    return call_api(ctx, 'Gimp.Drawable.levels', args=[channel, low_input, high_input, clamp_input, gamma, low_output, high_output, clamp_output])
-
-@mcp.tool()
-def Gimp_Drawable_levels_stretch(ctx: Context) -> str:
-    """Automatically modifies intensity levels in the specified drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.levels_stretch', args=[])
+    """),
+    ('Gimp.Drawable.levels_stretch', [],
+     """Automatically modifies intensity levels in the specified drawable.
 
-@mcp.tool()
-def Gimp_Drawable_mask_bounds(ctx: Context, x1: int, y1: int, x2: int, y2: int) -> str:
-    """Find the bounding box of the current selection in relation to the
+    """),
+    ('Gimp.Drawable.mask_bounds', [('x1', int), ('y1', int), ('x2', int), ('y2', int)],
+     """Find the bounding box of the current selection in relation to the
 specified drawable.
 
     :param x1: X coordinate of the upper left corner of selection bounds.
     :param y1: Y coordinate of the upper left corner of selection bounds.
     :param x2: X coordinate of the lower right corner of selection bounds.
     :param y2: Y coordinate of the lower right corner of selection bounds.
-    """
-    return call_api(ctx, 'Gimp.Drawable.mask_bounds', args=[x1, y1, x2, y2])
-
-@mcp.tool()
-def Gimp_Drawable_mask_intersect(ctx: Context, x: int, y: int, width: int, height: int) -> str:
-    """Find the bounding box of the current selection in relation to the
+    """),
+    ('Gimp.Drawable.mask_intersect', [('x', int), ('y', int), ('width', int), ('height', int)],
+     """Find the bounding box of the current selection in relation to the
 specified drawable.
 
     :param x: X coordinate of the upper left corner of the intersection.
     :param y: Y coordinate of the upper left corner of the intersection.
     :param width: Width of the intersection.
     :param height: Height of the intersection.
-    """
-    return call_api(ctx, 'Gimp.Drawable.mask_intersect', args=[x, y, width, height])
-
-@mcp.tool()
-def Gimp_Drawable_merge_filter(ctx: Context, filter: str) -> str:
-    """This procedure applies the specified drawable effect on drawable
+    """),
+    ('Gimp.Drawable.merge_filter', [('filter', str)],
+     """This procedure applies the specified drawable effect on drawable
 and merge it (therefore before any non-destructive effects are computed).
 
     :param filter: The drawable filter to merge.
-    """
-    return call_api(ctx, 'Gimp.Drawable.merge_filter', args=[filter])
-
-@mcp.tool()
-def Gimp_Drawable_merge_filters(ctx: Context) -> str:
-    """Merge the layer effect filters to the specified drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.merge_filters', args=[])
-
-@mcp.tool()
-def Gimp_Drawable_merge_new_filter(ctx: Context, operation_name: str, name: str, mode: str, opacity: float, *filter_args: str) -> str:
-    """Utility function which combines gimp_drawable_filter_new()
-followed by setting arguments for the
-GimpDrawableFilterConfig returned by
-gimp_drawable_filter_get_config(), and finally applying the
-effect to drawable with gimp_drawable_merge_filter()
-
-    :param operation_name: The GEGL operation’s name.
-    :param name: The effect name which will show in undo step.
-    :param mode: The blend mode.
-    :param opacity: The opacity from 0.0 (transparent) to 1.0 (opaque).
-    :param ...: A NULL-terminated list of operation argument names
-                 and values.
-    """
-    args = [operation_name, name, mode, opacity] + list(filter_args) + [None]
-    return call_api(ctx, 'Gimp.Drawable.merge_new_filter', args=args)
+    """),
+    ('Gimp.Drawable.merge_filters', [],
+     """Merge the layer effect filters to the specified drawable.
 
-@mcp.tool()
-def Gimp_Drawable_merge_shadow(ctx: Context, undo: bool) -> str:
-    """Merge the shadow buffer with the specified drawable.
+    """),
+    ('Gimp.Drawable.merge_shadow', [('undo', bool)],
+     """Merge the shadow buffer with the specified drawable.
 
     :param undo: Push merge to undo stack?
-    """
-    return call_api(ctx, 'Gimp.Drawable.merge_shadow', args=[undo])
-
-@mcp.tool()
-def Gimp_Drawable_offset(ctx: Context, wrap_around: bool, fill_type: str, color: str, offset_x: int, offset_y: int) -> str:
-    """Offset the drawable by the specified amounts in the X and Y directions
+    """),
+    ('Gimp.Drawable.offset', [('wrap_around', bool), ('fill_type', str), ('color', str), ('offset_x', int), ('offset_y', int)],
+     """Offset the drawable by the specified amounts in the X and Y directions
 
     :param wrap_around: Wrap image around or fill vacated regions.
     :param fill_type: Fill vacated regions of drawable with background or transparent.
     :param color: Fills in the background color when fill_type is set to OFFSET-COLOR.
     :param offset_x: Offset by this amount in X direction.
     :param offset_y: Offset by this amount in Y direction.
-    """
-    return call_api(ctx, 'Gimp.Drawable.offset', args=[wrap_around, fill_type, color, offset_x, offset_y])
-
-@mcp.tool()
-def Gimp_Drawable_posterize(ctx: Context, levels: int) -> str:
-    """Posterize the specified drawable.
+    """),
+    ('Gimp.Drawable.posterize', [('levels', int)],
+     """Posterize the specified drawable.
 
     :param levels: Levels of posterization.
-    """
-    return call_api(ctx, 'Gimp.Drawable.posterize', args=[levels])
-
-@mcp.tool()
-def Gimp_Drawable_set_pixel(ctx: Context, x_coord: int, y_coord: int, color: str) -> str:
-    """Sets the value of the pixel at the specified coordinates.
+    """),
+    ('Gimp.Drawable.set_pixel', [('x_coord', int), ('y_coord', int), ('color', str)],
+     """Sets the value of the pixel at the specified coordinates.
 
     :param x_coord: The x coordinate.
     :param y_coord: The y coordinate.
     :param color: The pixel color.
-    """
-    return call_api(ctx, 'Gimp.Drawable.set_pixel', args=[x_coord, y_coord, color])
-
-@mcp.tool()
-def Gimp_Drawable_shadows_highlights(ctx: Context, shadows: float, highlights: float, whitepoint: float, radius: float, compress: float, shadows_ccorrect: float, highlights_ccorrect: float) -> str:
-    """Perform shadows and highlights correction.
+    """),
+    ('Gimp.Drawable.shadows_highlights', [('shadows', float), ('highlights', float), ('whitepoint', float), ('radius', float), ('compress', float), ('shadows_ccorrect', float), ('highlights_ccorrect', float)],
+     """Perform shadows and highlights correction.
 
     :param shadows: Adjust exposure of shadows.
     :param highlights: Adjust exposure of highlights.
@@ -1204,731 +1241,476 @@ def Gimp_Drawable_shadows_highlights(ctx: Context, shadows: float, highlights: f
     :param compress: Compress the effect on shadows/highlights and preserve midtones.
     :param shadows_ccorrect: Adjust saturation of shadows.
     :param highlights_ccorrect: Adjust saturation of highlights.
-    """
-    return call_api(ctx, 'Gimp.Drawable.shadows_highlights', args=[shadows, highlights, whitepoint, radius, compress, shadows_ccorrect, highlights_ccorrect])
-
-@mcp.tool()
-def Gimp_Drawable_threshold(ctx: Context, channel: str, low_threshold: float, high_threshold: float) -> str:
-    """Threshold the specified drawable.
+    """),
+    ('Gimp.Drawable.threshold', [('channel', str), ('low_threshold', float), ('high_threshold', float)],
+     """Threshold the specified drawable.
 
     :param channel: The channel to base the threshold on.
     :param low_threshold: The low threshold value.
     :param high_threshold: The high threshold value.
-    """
-    return call_api(ctx, 'Gimp.Drawable.threshold', args=[channel, low_threshold, high_threshold])
-
-@mcp.tool()
-def Gimp_Drawable_type(ctx: Context) -> str:
-    """Returns the drawable’s type.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.type', args=[])
+    """),
+    ('Gimp.Drawable.type', [],
+     """Returns the drawable’s type.
 
-@mcp.tool()
-def Gimp_Drawable_type_with_alpha(ctx: Context) -> str:
-    """Returns the drawable’s type with alpha.
-
-    """
-    return call_api(ctx, 'Gimp.Drawable.type_with_alpha', args=[])
+    """),
+    ('Gimp.Drawable.type_with_alpha', [],
+     """Returns the drawable’s type with alpha.
 
-@mcp.tool()
-def Gimp_Drawable_update(ctx: Context, x: int, y: int, width: int, height: int) -> str:
-    """Update the specified region of the drawable.
+    """),
+    ('Gimp.Drawable.update', [('x', int), ('y', int), ('width', int), ('height', int)],
+     """Update the specified region of the drawable.
 
     :param x: X coordinate of upper left corner of update region.
     :param y: Y coordinate of upper left corner of update region.
     :param width: Width of update region.
     :param height: Height of update region.
-    """
-    return call_api(ctx, 'Gimp.Drawable.update', args=[x, y, width, height])
-
-@mcp.tool()
-def Gimp_DrawableFilter_delete(ctx: Context) -> str:
-    """Delete a drawable filter.
-
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.delete', args=[])
-
-@mcp.tool()
-def Gimp_DrawableFilter_get_blend_mode(ctx: Context) -> str:
-    """Get the blending mode of the specified filter.
-
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.get_blend_mode', args=[])
-
-@mcp.tool()
-def Gimp_DrawableFilter_get_config(ctx: Context) -> str:
-    """Get the GimpConfig with properties that match filter‘s arguments.
-
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.get_config', args=[])
-
-@mcp.tool()
-def Gimp_DrawableFilter_get_id(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.get_id', args=[])
-
-@mcp.tool()
-def Gimp_DrawableFilter_get_name(ctx: Context) -> str:
-    """Get a drawable filter’s name.
-
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.get_name', args=[])
+    """),
+    ('Gimp.DrawableFilter.delete', [],
+     """Delete a drawable filter.
 
-@mcp.tool()
-def Gimp_DrawableFilter_get_opacity(ctx: Context) -> str:
-    """Get the opacity of the specified filter.
+    """),
+    ('Gimp.DrawableFilter.get_blend_mode', [],
+     """Get the blending mode of the specified filter.
 
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.get_opacity', args=[])
+    """),
+    ('Gimp.DrawableFilter.get_config', [],
+     """Get the GimpConfig with properties that match filter‘s arguments.
 
-@mcp.tool()
-def Gimp_DrawableFilter_get_operation_name(ctx: Context) -> str:
-    """Get a drawable filter’s operation name.
+    """),
+    ('Gimp.DrawableFilter.get_id', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.get_operation_name', args=[])
+    """),
+    ('Gimp.DrawableFilter.get_name', [],
+     """Get a drawable filter’s name.
 
-@mcp.tool()
-def Gimp_DrawableFilter_get_visible(ctx: Context) -> str:
-    """Get the visibility of the specified filter.
+    """),
+    ('Gimp.DrawableFilter.get_opacity', [],
+     """Get the opacity of the specified filter.
 
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.get_visible', args=[])
+    """),
+    ('Gimp.DrawableFilter.get_operation_name', [],
+     """Get a drawable filter’s operation name.
 
-@mcp.tool()
-def Gimp_DrawableFilter_is_valid(ctx: Context) -> str:
-    """Returns TRUE if the drawable_filter is valid.
+    """),
+    ('Gimp.DrawableFilter.get_visible', [],
+     """Get the visibility of the specified filter.
 
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.is_valid', args=[])
+    """),
+    ('Gimp.DrawableFilter.is_valid', [],
+     """Returns TRUE if the drawable_filter is valid.
 
-@mcp.tool()
-def Gimp_DrawableFilter_set_aux_input(ctx: Context, input_pad_name: str, input: str) -> str:
-    """When a filter has one or several auxiliary inputs, you can use this
+    """),
+    ('Gimp.DrawableFilter.set_aux_input', [('input_pad_name', str), ('input', str)],
+     """When a filter has one or several auxiliary inputs, you can use this
 function to set them.
 
     :param input_pad_name: Name of the filter’s input pad.
     :param input: The drawable to use as auxiliary input.
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.set_aux_input', args=[input_pad_name, input])
-
-@mcp.tool()
-def Gimp_DrawableFilter_set_blend_mode(ctx: Context, mode: str) -> str:
-    """This procedure sets the blend mode of filter.
+    """),
+    ('Gimp.DrawableFilter.set_blend_mode', [('mode', str)],
+     """This procedure sets the blend mode of filter.
 
     :param mode: Blend mode.
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.set_blend_mode', args=[mode])
-
-@mcp.tool()
-def Gimp_DrawableFilter_set_opacity(ctx: Context, opacity: float) -> str:
-    """This procedure sets the opacity of filter on a range from 0.0
+    """),
+    ('Gimp.DrawableFilter.set_opacity', [('opacity', float)],
+     """This procedure sets the opacity of filter on a range from 0.0
 (transparent) to 1.0 (opaque).
 
     :param opacity: The opacity.
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.set_opacity', args=[opacity])
-
-@mcp.tool()
-def Gimp_DrawableFilter_set_visible(ctx: Context, visible: bool) -> str:
-    """Set the visibility of the specified filter.
+    """),
+    ('Gimp.DrawableFilter.set_visible', [('visible', bool)],
+     """Set the visibility of the specified filter.
 
     :param visible: The new filter visibility.
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.set_visible', args=[visible])
-
-@mcp.tool()
-def Gimp_DrawableFilter_update(ctx: Context) -> str:
-    """Syncs the GimpConfig with properties that match filter‘s arguments.
+    """),
+    ('Gimp.DrawableFilter.update', [],
+     """Syncs the GimpConfig with properties that match filter‘s arguments.
 This procedure updates the settings of the specified filter all at
 once, including the arguments of the GimpDrawableFilterConfig
 obtained with gimp_drawable_filter_get_config() as well as the
 blend mode and opacity.
 
-    """
-    return call_api(ctx, 'Gimp.DrawableFilter.update', args=[])
-
-@mcp.tool()
-def Gimp_ExportOptions_get_image(ctx: Context, image: str) -> str:
-    """Takes an image to be exported, possibly creating a temporary copy
+    """),
+    ('Gimp.ExportOptions.get_image', [('image', str)],
+     """Takes an image to be exported, possibly creating a temporary copy
 modified according to export settings in options (such as the
 capabilities of the export format).
 
     :param image: The image.
-    """
-    return call_api(ctx, 'Gimp.ExportOptions.get_image', args=[image])
-
-@mcp.tool()
-def Gimp_ExportProcedure_get_support_comment(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.get_support_comment', args=[])
-
-@mcp.tool()
-def Gimp_ExportProcedure_get_support_exif(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.get_support_exif', args=[])
-
-@mcp.tool()
-def Gimp_ExportProcedure_get_support_iptc(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.get_support_iptc', args=[])
-
-@mcp.tool()
-def Gimp_ExportProcedure_get_support_profile(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.ExportProcedure.get_support_comment', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.get_support_profile', args=[])
+    """),
+    ('Gimp.ExportProcedure.get_support_exif', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_ExportProcedure_get_support_thumbnail(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.ExportProcedure.get_support_iptc', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.get_support_thumbnail', args=[])
+    """),
+    ('Gimp.ExportProcedure.get_support_profile', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_ExportProcedure_get_support_xmp(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.ExportProcedure.get_support_thumbnail', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.get_support_xmp', args=[])
+    """),
+    ('Gimp.ExportProcedure.get_support_xmp', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_ExportProcedure_set_capabilities(ctx: Context, capabilities: str, get_capabilities_func: str = None, get_capabilities_data: str = None, get_capabilities_data_destroy: str = None) -> str:
-    """Sets default GimpExportCapabilities for image export.
+    """),
+    ('Gimp.ExportProcedure.set_capabilities', [('capabilities', str), ('get_capabilities_func', str, None), ('get_capabilities_data', str, None), ('get_capabilities_data_destroy', str, None)],
+     """Sets default GimpExportCapabilities for image export.
 
     :param capabilities: A GimpExportCapabilities bitfield.
     :param get_capabilities_func: Callback function to update export options.
     :param get_capabilities_data: Data for get_capabilities_func.
     :param get_capabilities_data_destroy: Free function for get_capabilities_data, or NULL.
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.set_capabilities', args=[capabilities, get_capabilities_func, get_capabilities_data, get_capabilities_data_destroy])
-
-@mcp.tool()
-def Gimp_ExportProcedure_set_support_comment(ctx: Context, supports: bool) -> str:
-    """Determine whether procedure supports exporting a comment. By default,
+    """),
+    ('Gimp.ExportProcedure.set_support_comment', [('supports', bool)],
+     """Determine whether procedure supports exporting a comment. By default,
 it won’t (so there is usually no reason to run this function with
 FALSE).
 
     :param supports: Whether a comment can be stored.
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.set_support_comment', args=[supports])
-
-@mcp.tool()
-def Gimp_ExportProcedure_set_support_exif(ctx: Context, supports: bool) -> str:
-    """Determine whether procedure supports exporting Exif data. By default,
+    """),
+    ('Gimp.ExportProcedure.set_support_exif', [('supports', bool)],
+     """Determine whether procedure supports exporting Exif data. By default,
 it won’t (so there is usually no reason to run this function with
 FALSE).
 
     :param supports: Whether Exif metadata are supported.
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.set_support_exif', args=[supports])
-
-@mcp.tool()
-def Gimp_ExportProcedure_set_support_iptc(ctx: Context, supports: bool) -> str:
-    """Determine whether procedure supports exporting IPTC data. By default,
+    """),
+    ('Gimp.ExportProcedure.set_support_iptc', [('supports', bool)],
+     """Determine whether procedure supports exporting IPTC data. By default,
 it won’t (so there is usually no reason to run this function with
 FALSE).
 
     :param supports: Whether IPTC metadata are supported.
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.set_support_iptc', args=[supports])
-
-@mcp.tool()
-def Gimp_ExportProcedure_set_support_profile(ctx: Context, supports: bool) -> str:
-    """Determine whether procedure supports exporting ICC color profiles. By
+    """),
+    ('Gimp.ExportProcedure.set_support_profile', [('supports', bool)],
+     """Determine whether procedure supports exporting ICC color profiles. By
 default, it won’t (so there is usually no reason to run this function
 with FALSE).
 
     :param supports: Whether color profiles can be stored.
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.set_support_profile', args=[supports])
-
-@mcp.tool()
-def Gimp_ExportProcedure_set_support_thumbnail(ctx: Context, supports: bool) -> str:
-    """Determine whether procedure supports exporting a thumbnail. By default,
+    """),
+    ('Gimp.ExportProcedure.set_support_thumbnail', [('supports', bool)],
+     """Determine whether procedure supports exporting a thumbnail. By default,
 it won’t (so there is usually no reason to run this function with
 FALSE).
 
     :param supports: Whether a thumbnail can be stored.
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.set_support_thumbnail', args=[supports])
-
-@mcp.tool()
-def Gimp_ExportProcedure_set_support_xmp(ctx: Context, supports: bool) -> str:
-    """Determine whether procedure supports exporting XMP data. By default,
+    """),
+    ('Gimp.ExportProcedure.set_support_xmp', [('supports', bool)],
+     """Determine whether procedure supports exporting XMP data. By default,
 it won’t (so there is usually no reason to run this function with
 FALSE).
 
     :param supports: Whether XMP metadata are supported.
-    """
-    return call_api(ctx, 'Gimp.ExportProcedure.set_support_xmp', args=[supports])
-
-@mcp.tool()
-def Gimp_FileProcedure_get_extensions(ctx: Context) -> str:
-    """Returns the procedure’s extensions as set with
+    """),
+    ('Gimp.FileProcedure.get_extensions', [],
+     """Returns the procedure’s extensions as set with
 gimp_file_procedure_set_extensions().
 
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.get_extensions', args=[])
-
-@mcp.tool()
-def Gimp_FileProcedure_get_format_name(ctx: Context) -> str:
-    """Returns the procedure’s format name, as set with
+    """),
+    ('Gimp.FileProcedure.get_format_name', [],
+     """Returns the procedure’s format name, as set with
 gimp_file_procedure_set_format_name().
 
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.get_format_name', args=[])
-
-@mcp.tool()
-def Gimp_FileProcedure_get_handles_remote(ctx: Context) -> str:
-    """Returns the procedure’s ‘handles remote’ flags as set with
+    """),
+    ('Gimp.FileProcedure.get_handles_remote', [],
+     """Returns the procedure’s ‘handles remote’ flags as set with
 gimp_file_procedure_set_handles_remote().
 
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.get_handles_remote', args=[])
-
-@mcp.tool()
-def Gimp_FileProcedure_get_magics(ctx: Context) -> str:
-    """Returns the procedure’s magics as set with gimp_file_procedure_set_magics().
-
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.get_magics', args=[])
+    """),
+    ('Gimp.FileProcedure.get_magics', [],
+     """Returns the procedure’s magics as set with gimp_file_procedure_set_magics().
 
-@mcp.tool()
-def Gimp_FileProcedure_get_mime_types(ctx: Context) -> str:
-    """Returns the procedure’s mime-type as set with
+    """),
+    ('Gimp.FileProcedure.get_mime_types', [],
+     """Returns the procedure’s mime-type as set with
 gimp_file_procedure_set_mime_types().
 
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.get_mime_types', args=[])
-
-@mcp.tool()
-def Gimp_FileProcedure_get_prefixes(ctx: Context) -> str:
-    """Returns the procedure’s prefixes as set with
+    """),
+    ('Gimp.FileProcedure.get_prefixes', [],
+     """Returns the procedure’s prefixes as set with
 gimp_file_procedure_set_prefixes().
 
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.get_prefixes', args=[])
-
-@mcp.tool()
-def Gimp_FileProcedure_get_priority(ctx: Context) -> str:
-    """Returns the procedure’s priority as set with
+    """),
+    ('Gimp.FileProcedure.get_priority', [],
+     """Returns the procedure’s priority as set with
 gimp_file_procedure_set_priority().
 
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.get_priority', args=[])
-
-@mcp.tool()
-def Gimp_FileProcedure_set_extensions(ctx: Context, extensions: str) -> str:
-    """Registers the given list of extensions as something this procedure can handle.
+    """),
+    ('Gimp.FileProcedure.set_extensions', [('extensions', str)],
+     """Registers the given list of extensions as something this procedure can handle.
 
     :param extensions: A comma separated list of extensions this procedure can
              handle (i.e. “jpg,jpeg”).
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.set_extensions', args=[extensions])
-
-@mcp.tool()
-def Gimp_FileProcedure_set_format_name(ctx: Context, format_name: str) -> str:
-    """Associates a format name with a file handler procedure.
+    """),
+    ('Gimp.FileProcedure.set_format_name', [('format_name', str)],
+     """Associates a format name with a file handler procedure.
 
     :param format_name: A public-facing name for the format, e.g. “PNG”.
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.set_format_name', args=[format_name])
-
-@mcp.tool()
-def Gimp_FileProcedure_set_handles_remote(ctx: Context, handles_remote: bool) -> str:
-    """Registers a file procedure as capable of handling arbitrary remote
+    """),
+    ('Gimp.FileProcedure.set_handles_remote', [('handles_remote', bool)],
+     """Registers a file procedure as capable of handling arbitrary remote
 URIs via GIO.
 
     :param handles_remote: The procedure’s ‘handles remote’ flag.
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.set_handles_remote', args=[handles_remote])
-
-@mcp.tool()
-def Gimp_FileProcedure_set_magics(ctx: Context, magics: str) -> str:
-    """Registers the list of magic file information this procedure can handle.
+    """),
+    ('Gimp.FileProcedure.set_magics', [('magics', str)],
+     """Registers the list of magic file information this procedure can handle.
 
     :param magics: A comma-separated list of magic file information (i.e. “0,string,GIF”).
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.set_magics', args=[magics])
-
-@mcp.tool()
-def Gimp_FileProcedure_set_mime_types(ctx: Context, mime_types: str) -> str:
-    """Associates MIME types with a file handler procedure.
+    """),
+    ('Gimp.FileProcedure.set_mime_types', [('mime_types', str)],
+     """Associates MIME types with a file handler procedure.
 
     :param mime_types: A comma-separated list of MIME types, such as “image/jpeg”.
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.set_mime_types', args=[mime_types])
-
-@mcp.tool()
-def Gimp_FileProcedure_set_prefixes(ctx: Context, prefixes: str) -> str:
-    """It should almost never be necessary to register prefixes with file
+    """),
+    ('Gimp.FileProcedure.set_prefixes', [('prefixes', str)],
+     """It should almost never be necessary to register prefixes with file
 procedures, because most sorts of URIs should be handled by GIO.
 
     :param prefixes: A comma separated list of prefixes this procedure can
             handle (i.e. “http:,ftp:”).
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.set_prefixes', args=[prefixes])
-
-@mcp.tool()
-def Gimp_FileProcedure_set_priority(ctx: Context, priority: int) -> str:
-    """Sets the priority of a file handler procedure.
+    """),
+    ('Gimp.FileProcedure.set_priority', [('priority', int)],
+     """Sets the priority of a file handler procedure.
 
     :param priority: The procedure’s priority.
-    """
-    return call_api(ctx, 'Gimp.FileProcedure.set_priority', args=[priority])
-
-@mcp.tool()
-def Gimp_Font_get_pango_font_description(ctx: Context) -> str:
-    """Returns a PangoFontDescription representing font.
-
-    """
-    return call_api(ctx, 'Gimp.Font.get_pango_font_description', args=[])
+    """),
+    ('Gimp.Font.get_pango_font_description', [],
+     """Returns a PangoFontDescription representing font.
 
-@mcp.tool()
-def Gimp_Gradient_get_custom_samples(ctx: Context, num_samples: int, positions: str, reverse: bool) -> str:
-    """Sample the gradient in custom positions.
+    """),
+    ('Gimp.Gradient.get_custom_samples', [('num_samples', int), ('positions', str), ('reverse', bool)],
+     """Sample the gradient in custom positions.
 
     :param num_samples: The number of samples to take.
     :param positions: The list of positions to sample along the gradient.
     :param reverse: Use the reverse gradient.
-    """
-    return call_api(ctx, 'Gimp.Gradient.get_custom_samples', args=[num_samples, positions, reverse])
-
-@mcp.tool()
-def Gimp_Gradient_get_number_of_segments(ctx: Context) -> str:
-    """Gets the number of segments of the gradient
-
-    """
-    return call_api(ctx, 'Gimp.Gradient.get_number_of_segments', args=[])
+    """),
+    ('Gimp.Gradient.get_number_of_segments', [],
+     """Gets the number of segments of the gradient
 
-@mcp.tool()
-def Gimp_Gradient_get_uniform_samples(ctx: Context, num_samples: int, reverse: bool) -> str:
-    """Sample the gradient in uniform parts.
+    """),
+    ('Gimp.Gradient.get_uniform_samples', [('num_samples', int), ('reverse', bool)],
+     """Sample the gradient in uniform parts.
 
     :param num_samples: The number of samples to take.
     :param reverse: Use the reverse gradient.
-    """
-    return call_api(ctx, 'Gimp.Gradient.get_uniform_samples', args=[num_samples, reverse])
-
-@mcp.tool()
-def Gimp_Gradient_segment_get_blending_function(ctx: Context, segment: int, blend_func: str) -> str:
-    """Gets the gradient segment’s blending function
+    """),
+    ('Gimp.Gradient.segment_get_blending_function', [('segment', int), ('blend_func', str)],
+     """Gets the gradient segment’s blending function
 
     :param segment: The index of a segment within the gradient.
     :param blend_func: The blending function of the segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_get_blending_function', args=[segment, blend_func])
-
-@mcp.tool()
-def Gimp_Gradient_segment_get_coloring_type(ctx: Context, segment: int, coloring_type: str) -> str:
-    """Gets the gradient segment’s coloring type
+    """),
+    ('Gimp.Gradient.segment_get_coloring_type', [('segment', int), ('coloring_type', str)],
+     """Gets the gradient segment’s coloring type
 
     :param segment: The index of a segment within the gradient.
     :param coloring_type: The coloring type of the segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_get_coloring_type', args=[segment, coloring_type])
-
-@mcp.tool()
-def Gimp_Gradient_segment_get_left_color(ctx: Context, segment: int) -> str:
-    """Gets the left endpoint color of the segment
+    """),
+    ('Gimp.Gradient.segment_get_left_color', [('segment', int)],
+     """Gets the left endpoint color of the segment
 
     :param segment: The index of a segment within the gradient.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_get_left_color', args=[segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_get_left_pos(ctx: Context, segment: int, pos: float) -> str:
-    """Gets the left endpoint position of a segment
+    """),
+    ('Gimp.Gradient.segment_get_left_pos', [('segment', int), ('pos', float)],
+     """Gets the left endpoint position of a segment
 
     :param segment: The index of a segment within the gradient.
     :param pos: The return position.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_get_left_pos', args=[segment, pos])
-
-@mcp.tool()
-def Gimp_Gradient_segment_get_middle_pos(ctx: Context, segment: int, pos: float) -> str:
-    """Gets the midpoint position of the segment
+    """),
+    ('Gimp.Gradient.segment_get_middle_pos', [('segment', int), ('pos', float)],
+     """Gets the midpoint position of the segment
 
     :param segment: The index of a segment within the gradient.
     :param pos: The return position.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_get_middle_pos', args=[segment, pos])
-
-@mcp.tool()
-def Gimp_Gradient_segment_get_right_color(ctx: Context, segment: int) -> str:
-    """Gets the right endpoint color of the segment
+    """),
+    ('Gimp.Gradient.segment_get_right_color', [('segment', int)],
+     """Gets the right endpoint color of the segment
 
     :param segment: The index of a segment within the gradient.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_get_right_color', args=[segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_get_right_pos(ctx: Context, segment: int, pos: float) -> str:
-    """Gets the right endpoint position of the segment
+    """),
+    ('Gimp.Gradient.segment_get_right_pos', [('segment', int), ('pos', float)],
+     """Gets the right endpoint position of the segment
 
     :param segment: The index of a segment within the gradient.
     :param pos: The return position.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_get_right_pos', args=[segment, pos])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_blend_colors(ctx: Context, start_segment: int, end_segment: int) -> str:
-    """Blend the colors of the segment range.
+    """),
+    ('Gimp.Gradient.segment_range_blend_colors', [('start_segment', int), ('end_segment', int)],
+     """Blend the colors of the segment range.
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_blend_colors', args=[start_segment, end_segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_blend_opacity(ctx: Context, start_segment: int, end_segment: int) -> str:
-    """Blend the opacity of the segment range.
+    """),
+    ('Gimp.Gradient.segment_range_blend_opacity', [('start_segment', int), ('end_segment', int)],
+     """Blend the opacity of the segment range.
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_blend_opacity', args=[start_segment, end_segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_delete(ctx: Context, start_segment: int, end_segment: int) -> str:
-    """Delete the segment range
+    """),
+    ('Gimp.Gradient.segment_range_delete', [('start_segment', int), ('end_segment', int)],
+     """Delete the segment range
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_delete', args=[start_segment, end_segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_flip(ctx: Context, start_segment: int, end_segment: int) -> str:
-    """Flip the segment range
+    """),
+    ('Gimp.Gradient.segment_range_flip', [('start_segment', int), ('end_segment', int)],
+     """Flip the segment range
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_flip', args=[start_segment, end_segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_move(ctx: Context, start_segment: int, end_segment: int, delta: float, control_compress: bool) -> str:
-    """Move the position of an entire segment range by a delta.
+    """),
+    ('Gimp.Gradient.segment_range_move', [('start_segment', int), ('end_segment', int), ('delta', float), ('control_compress', bool)],
+     """Move the position of an entire segment range by a delta.
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
     :param delta: The delta to move the segment range.
     :param control_compress: Whether or not to compress the neighboring segments.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_move', args=[start_segment, end_segment, delta, control_compress])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_redistribute_handles(ctx: Context, start_segment: int, end_segment: int) -> str:
-    """Uniformly redistribute the segment range’s handles
+    """),
+    ('Gimp.Gradient.segment_range_redistribute_handles', [('start_segment', int), ('end_segment', int)],
+     """Uniformly redistribute the segment range’s handles
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_redistribute_handles', args=[start_segment, end_segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_replicate(ctx: Context, start_segment: int, end_segment: int, replicate_times: int) -> str:
-    """Replicate the segment range
+    """),
+    ('Gimp.Gradient.segment_range_replicate', [('start_segment', int), ('end_segment', int), ('replicate_times', int)],
+     """Replicate the segment range
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
     :param replicate_times: The number of replicas for each segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_replicate', args=[start_segment, end_segment, replicate_times])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_set_blending_function(ctx: Context, start_segment: int, end_segment: int, blending_function: str) -> str:
-    """Sets the blending function of a range of segments
+    """),
+    ('Gimp.Gradient.segment_range_set_blending_function', [('start_segment', int), ('end_segment', int), ('blending_function', str)],
+     """Sets the blending function of a range of segments
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
     :param blending_function: The blending function.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_set_blending_function', args=[start_segment, end_segment, blending_function])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_set_coloring_type(ctx: Context, start_segment: int, end_segment: int, coloring_type: str) -> str:
-    """Sets the coloring type of a range of segments
+    """),
+    ('Gimp.Gradient.segment_range_set_coloring_type', [('start_segment', int), ('end_segment', int), ('coloring_type', str)],
+     """Sets the coloring type of a range of segments
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
     :param coloring_type: The coloring type.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_set_coloring_type', args=[start_segment, end_segment, coloring_type])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_split_midpoint(ctx: Context, start_segment: int, end_segment: int) -> str:
-    """Splits each segment in the segment range at midpoint
+    """),
+    ('Gimp.Gradient.segment_range_split_midpoint', [('start_segment', int), ('end_segment', int)],
+     """Splits each segment in the segment range at midpoint
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_split_midpoint', args=[start_segment, end_segment])
-
-@mcp.tool()
-def Gimp_Gradient_segment_range_split_uniform(ctx: Context, start_segment: int, end_segment: int, split_parts: int) -> str:
-    """Splits each segment in the segment range uniformly
+    """),
+    ('Gimp.Gradient.segment_range_split_uniform', [('start_segment', int), ('end_segment', int), ('split_parts', int)],
+     """Splits each segment in the segment range uniformly
 
     :param start_segment: Index of the first segment to operate on.
     :param end_segment: Index of the last segment to operate on. If negative, the range will extend to the end segment.
     :param split_parts: The number of uniform divisions to split each segment to.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_range_split_uniform', args=[start_segment, end_segment, split_parts])
-
-@mcp.tool()
-def Gimp_Gradient_segment_set_left_color(ctx: Context, segment: int, color: str) -> str:
-    """Sets the left endpoint color of a segment
+    """),
+    ('Gimp.Gradient.segment_set_left_color', [('segment', int), ('color', str)],
+     """Sets the left endpoint color of a segment
 
     :param segment: The index of a segment within the gradient.
     :param color: The color to set.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_set_left_color', args=[segment, color])
-
-@mcp.tool()
-def Gimp_Gradient_segment_set_left_pos(ctx: Context, segment: int, pos: float, final_pos: float) -> str:
-    """Sets the left endpoint position of the segment
+    """),
+    ('Gimp.Gradient.segment_set_left_pos', [('segment', int), ('pos', float), ('final_pos', float)],
+     """Sets the left endpoint position of the segment
 
     :param segment: The index of a segment within the gradient.
     :param pos: The position to set the guidepoint to.
     :param final_pos: The return position.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_set_left_pos', args=[segment, pos, final_pos])
-
-@mcp.tool()
-def Gimp_Gradient_segment_set_middle_pos(ctx: Context, segment: int, pos: float, final_pos: float) -> str:
-    """Sets the midpoint position of the segment
+    """),
+    ('Gimp.Gradient.segment_set_middle_pos', [('segment', int), ('pos', float), ('final_pos', float)],
+     """Sets the midpoint position of the segment
 
     :param segment: The index of a segment within the gradient.
     :param pos: The position to set the guidepoint to.
     :param final_pos: The return position.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_set_middle_pos', args=[segment, pos, final_pos])
-
-@mcp.tool()
-def Gimp_Gradient_segment_set_right_color(ctx: Context, segment: int, color: str) -> str:
-    """Sets the right endpoint color of the segment
+    """),
+    ('Gimp.Gradient.segment_set_right_color', [('segment', int), ('color', str)],
+     """Sets the right endpoint color of the segment
 
     :param segment: The index of a segment within the gradient.
     :param color: The color to set.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_set_right_color', args=[segment, color])
-
-@mcp.tool()
-def Gimp_Gradient_segment_set_right_pos(ctx: Context, segment: int, pos: float, final_pos: float) -> str:
-    """Sets the right endpoint position of the segment
+    """),
+    ('Gimp.Gradient.segment_set_right_pos', [('segment', int), ('pos', float), ('final_pos', float)],
+     """Sets the right endpoint position of the segment
 
     :param segment: The index of a segment within the gradient.
     :param pos: The position to set the right endpoint to.
     :param final_pos: The return position.
-    """
-    return call_api(ctx, 'Gimp.Gradient.segment_set_right_pos', args=[segment, pos, final_pos])
-
-@mcp.tool()
-def Gimp_GroupLayer_merge(ctx: Context) -> str:
-    """Merge the passed group layer’s layers into one normal layer.
-
-    """
-    return call_api(ctx, 'Gimp.GroupLayer.merge', args=[])
+    """),
+    ('Gimp.GroupLayer.merge', [],
+     """Merge the passed group layer’s layers into one normal layer.
 
-@mcp.tool()
-def Gimp_Image_add_hguide(ctx: Context, yposition: int) -> str:
-    """Add a horizontal guide to an image.
+    """),
+    ('Gimp.Image.add_hguide', [('yposition', int)],
+     """Add a horizontal guide to an image.
 
     :param yposition: The guide’s y-offset from top of image.
-    """
-    return call_api(ctx, 'Gimp.Image.add_hguide', args=[yposition])
-
-@mcp.tool()
-def Gimp_Image_add_sample_point(ctx: Context, position_x: int, position_y: int) -> str:
-    """Add a sample point to an image.
+    """),
+    ('Gimp.Image.add_sample_point', [('position_x', int), ('position_y', int)],
+     """Add a sample point to an image.
 
     :param position_x: The sample point’s x-offset from left of image.
     :param position_y: The sample point’s y-offset from top of image.
-    """
-    return call_api(ctx, 'Gimp.Image.add_sample_point', args=[position_x, position_y])
-
-@mcp.tool()
-def Gimp_Image_add_vguide(ctx: Context, xposition: int) -> str:
-    """Add a vertical guide to an image.
+    """),
+    ('Gimp.Image.add_vguide', [('xposition', int)],
+     """Add a vertical guide to an image.
 
     :param xposition: The guide’s x-offset from left of image.
-    """
-    return call_api(ctx, 'Gimp.Image.add_vguide', args=[xposition])
-
-@mcp.tool()
-def Gimp_Image_attach_parasite(ctx: Context, parasite: str) -> str:
-    """Add a parasite to an image.
+    """),
+    ('Gimp.Image.attach_parasite', [('parasite', str)],
+     """Add a parasite to an image.
 
     :param parasite: The parasite to attach to an image.
-    """
-    return call_api(ctx, 'Gimp.Image.attach_parasite', args=[parasite])
-
-@mcp.tool()
-def Gimp_Image_autocrop(ctx: Context, drawable: str = None) -> str:
-    """Remove empty borders from the image
+    """),
+    ('Gimp.Image.autocrop', [('drawable', str, None)],
+     """Remove empty borders from the image
 
     :param drawable: Input drawable.
-    """
-    return call_api(ctx, 'Gimp.Image.autocrop', args=[drawable])
-
-@mcp.tool()
-def Gimp_Image_autocrop_selected_layers(ctx: Context, drawable: str = None) -> str:
-    """Crop the selected layers based on empty borders of the input drawable
+    """),
+    ('Gimp.Image.autocrop_selected_layers', [('drawable', str, None)],
+     """Crop the selected layers based on empty borders of the input drawable
 
     :param drawable: Input drawable.
-    """
-    return call_api(ctx, 'Gimp.Image.autocrop_selected_layers', args=[drawable])
-
-@mcp.tool()
-def Gimp_Image_clean_all(ctx: Context) -> str:
-    """Set the image dirty count to 0.
-
-    """
-    return call_api(ctx, 'Gimp.Image.clean_all', args=[])
+    """),
+    ('Gimp.Image.clean_all', [],
+     """Set the image dirty count to 0.
 
-@mcp.tool()
-def Gimp_Image_convert_color_profile(ctx: Context, profile: str, intent: str, bpc: bool) -> str:
-    """Convert the image’s layers to a color profile
+    """),
+    ('Gimp.Image.convert_color_profile', [('profile', str), ('intent', str), ('bpc', bool)],
+     """Convert the image’s layers to a color profile
 
     :param profile: The color profile to convert to.
     :param intent: Rendering intent.
     :param bpc: Black point compensation.
-    """
-    return call_api(ctx, 'Gimp.Image.convert_color_profile', args=[profile, intent, bpc])
-
-@mcp.tool()
-def Gimp_Image_convert_color_profile_from_file(ctx: Context, file: str, intent: str, bpc: bool) -> str:
-    """Convert the image’s layers to a color profile
+    """),
+    ('Gimp.Image.convert_color_profile_from_file', [('file', str), ('intent', str), ('bpc', bool)],
+     """Convert the image’s layers to a color profile
 
     :param file: The file containing the new color profile.
     :param intent: Rendering intent.
     :param bpc: Black point compensation.
-    """
-    return call_api(ctx, 'Gimp.Image.convert_color_profile_from_file', args=[file, intent, bpc])
-
-@mcp.tool()
-def Gimp_Image_convert_grayscale(ctx: Context) -> str:
-    """Convert specified image to grayscale
+    """),
+    ('Gimp.Image.convert_grayscale', [],
+     """Convert specified image to grayscale
 
-    """
-    return call_api(ctx, 'Gimp.Image.convert_grayscale', args=[])
-
-@mcp.tool()
-def Gimp_Image_convert_indexed(ctx: Context, dither_type: str, palette_type: str, num_cols: int, alpha_dither: bool, remove_unused: bool, palette: str) -> str:
-    """Convert specified image to and Indexed image
+    """),
+    ('Gimp.Image.convert_indexed', [('dither_type', str), ('palette_type', str), ('num_cols', int), ('alpha_dither', bool), ('remove_unused', bool), ('palette', str)],
+     """Convert specified image to and Indexed image
 
     :param dither_type: The dither type to use.
     :param palette_type: The type of palette to use.
@@ -1936,729 +1718,450 @@ def Gimp_Image_convert_indexed(ctx: Context, dither_type: str, palette_type: str
     :param alpha_dither: Dither transparency to fake partial opacity.
     :param remove_unused: Remove unused or duplicate color entries from final palette, ignored if (palette_type == GIMP_CONVERT_PALETTE_GENERATE).
     :param palette: The name of the custom palette to use, ignored unless (palette_type == GIMP_CONVERT_PALETTE_CUSTOM).
-    """
-    return call_api(ctx, 'Gimp.Image.convert_indexed', args=[dither_type, palette_type, num_cols, alpha_dither, remove_unused, palette])
-
-@mcp.tool()
-def Gimp_Image_convert_precision(ctx: Context, precision: str) -> str:
-    """Convert the image to the specified precision
+    """),
+    ('Gimp.Image.convert_precision', [('precision', str)],
+     """Convert the image to the specified precision
 
     :param precision: The new precision.
-    """
-    return call_api(ctx, 'Gimp.Image.convert_precision', args=[precision])
-
-@mcp.tool()
-def Gimp_Image_convert_rgb(ctx: Context) -> str:
-    """Convert specified image to RGB color
-
-    """
-    return call_api(ctx, 'Gimp.Image.convert_rgb', args=[])
+    """),
+    ('Gimp.Image.convert_rgb', [],
+     """Convert specified image to RGB color
 
-@mcp.tool()
-def Gimp_Image_crop(ctx: Context, new_width: int, new_height: int, offx: int, offy: int) -> str:
-    """Crop the image to the specified extents.
+    """),
+    ('Gimp.Image.crop', [('new_width', int), ('new_height', int), ('offx', int), ('offy', int)],
+     """Crop the image to the specified extents.
 
     :param new_width: New image width: (0 < new_width <= width).
     :param new_height: New image height: (0 < new_height <= height).
     :param offx: X offset: (0 <= offx <= (width - new_width)).
     :param offy: Y offset: (0 <= offy <= (height - new_height)).
-    """
-    return call_api(ctx, 'Gimp.Image.crop', args=[new_width, new_height, offx, offy])
-
-@mcp.tool()
-def Gimp_Image_delete(ctx: Context) -> str:
-    """Delete the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.delete', args=[])
+    """),
+    ('Gimp.Image.delete', [],
+     """Delete the specified image.
 
-@mcp.tool()
-def Gimp_Image_delete_guide(ctx: Context, guide: int) -> str:
-    """Deletes a guide from an image.
+    """),
+    ('Gimp.Image.delete_guide', [('guide', int)],
+     """Deletes a guide from an image.
 
     :param guide: The ID of the guide to be removed.
-    """
-    return call_api(ctx, 'Gimp.Image.delete_guide', args=[guide])
-
-@mcp.tool()
-def Gimp_Image_delete_sample_point(ctx: Context, sample_point: int) -> str:
-    """Deletes a sample point from an image.
+    """),
+    ('Gimp.Image.delete_sample_point', [('sample_point', int)],
+     """Deletes a sample point from an image.
 
     :param sample_point: The ID of the sample point to be removed.
-    """
-    return call_api(ctx, 'Gimp.Image.delete_sample_point', args=[sample_point])
-
-@mcp.tool()
-def Gimp_Image_detach_parasite(ctx: Context, name: str) -> str:
-    """Removes a parasite from an image.
+    """),
+    ('Gimp.Image.detach_parasite', [('name', str)],
+     """Removes a parasite from an image.
 
     :param name: The name of the parasite to detach from an image.
-    """
-    return call_api(ctx, 'Gimp.Image.detach_parasite', args=[name])
-
-@mcp.tool()
-def Gimp_Image_duplicate(ctx: Context) -> str:
-    """Duplicate the specified image
-
-    """
-    return call_api(ctx, 'Gimp.Image.duplicate', args=[])
+    """),
+    ('Gimp.Image.duplicate', [],
+     """Duplicate the specified image
 
-@mcp.tool()
-def Gimp_Image_export_path_to_file(ctx: Context, file: str, path: str = None) -> str:
-    """Save a path as an SVG file.
+    """),
+    ('Gimp.Image.export_path_to_file', [('file', str), ('path', str, None)],
+     """Save a path as an SVG file.
 
     :param file: The SVG file to create.
     :param path: The path object to export, or NULL for all in the image.
-    """
-    return call_api(ctx, 'Gimp.Image.export_path_to_file', args=[file, path])
-
-@mcp.tool()
-def Gimp_Image_export_path_to_string(ctx: Context, path: str = None) -> str:
-    """Save a path as an SVG string.
+    """),
+    ('Gimp.Image.export_path_to_string', [('path', str, None)],
+     """Save a path as an SVG string.
 
     :param path: The path object to export, or NULL for all in the image.
-    """
-    return call_api(ctx, 'Gimp.Image.export_path_to_string', args=[path])
-
-@mcp.tool()
-def Gimp_Image_find_next_guide(ctx: Context, guide: int) -> str:
-    """Find next guide on an image.
+    """),
+    ('Gimp.Image.find_next_guide', [('guide', int)],
+     """Find next guide on an image.
 
     :param guide: The ID of the current guide (0 if first invocation).
-    """
-    return call_api(ctx, 'Gimp.Image.find_next_guide', args=[guide])
-
-@mcp.tool()
-def Gimp_Image_find_next_sample_point(ctx: Context, sample_point: int) -> str:
-    """Find next sample point on an image.
+    """),
+    ('Gimp.Image.find_next_sample_point', [('sample_point', int)],
+     """Find next sample point on an image.
 
     :param sample_point: The ID of the current sample point (0 if first invocation).
-    """
-    return call_api(ctx, 'Gimp.Image.find_next_sample_point', args=[sample_point])
-
-@mcp.tool()
-def Gimp_Image_flatten(ctx: Context) -> str:
-    """Flatten all visible layers into a single layer. Discard all
+    """),
+    ('Gimp.Image.flatten', [],
+     """Flatten all visible layers into a single layer. Discard all
 invisible layers.
 
-    """
-    return call_api(ctx, 'Gimp.Image.flatten', args=[])
-
-@mcp.tool()
-def Gimp_Image_flip(ctx: Context, flip_type: str) -> str:
-    """Flips the image horizontally or vertically.
+    """),
+    ('Gimp.Image.flip', [('flip_type', str)],
+     """Flips the image horizontally or vertically.
 
     :param flip_type: Type of flip.
-    """
-    return call_api(ctx, 'Gimp.Image.flip', args=[flip_type])
+    """),
+    ('Gimp.Image.floating_sel_attached_to', [],
+     """Return the drawable the floating selection is attached to.
 
-@mcp.tool()
-def Gimp_Image_floating_sel_attached_to(ctx: Context) -> str:
-    """Return the drawable the floating selection is attached to.
+    """),
+    ('Gimp.Image.freeze_channels', [],
+     """Freeze the image’s channel list.
 
-    """
-    return call_api(ctx, 'Gimp.Image.floating_sel_attached_to', args=[])
+    """),
+    ('Gimp.Image.freeze_layers', [],
+     """Freeze the image’s layer list.
 
-@mcp.tool()
-def Gimp_Image_freeze_channels(ctx: Context) -> str:
-    """Freeze the image’s channel list.
+    """),
+    ('Gimp.Image.freeze_paths', [],
+     """Freeze the image’s path list.
 
-    """
-    return call_api(ctx, 'Gimp.Image.freeze_channels', args=[])
+    """),
+    ('Gimp.Image.get_base_type', [],
+     """Get the base type of the image.
 
-@mcp.tool()
-def Gimp_Image_freeze_layers(ctx: Context) -> str:
-    """Freeze the image’s layer list.
+    """),
+    ('Gimp.Image.get_channel_by_name', [('name', str)],
+     """Find a channel with a given name in an image.
 
-    """
-    return call_api(ctx, 'Gimp.Image.freeze_layers', args=[])
+    :param name: The name of the channel to find.
+    """),
+    ('Gimp.Image.get_channel_by_tattoo', [('tattoo', int)],
+     """Find a channel with a given tattoo in an image.
 
-@mcp.tool()
-def Gimp_Image_freeze_paths(ctx: Context) -> str:
-    """Freeze the image’s path list.
+    :param tattoo: The tattoo of the channel to find.
+    """),
+    ('Gimp.Image.get_channels', [],
+     """Returns the list of channels contained in the specified image.
 
-    """
-    return call_api(ctx, 'Gimp.Image.freeze_paths', args=[])
+    """),
+    ('Gimp.Image.get_color_profile', [],
+     """Returns the image’s color profile
 
-@mcp.tool()
-def Gimp_Image_get_base_type(ctx: Context) -> str:
-    """Get the base type of the image.
+    """),
+    ('Gimp.Image.get_component_active', [('component', str)],
+     """Returns if the specified image’s image component is active.
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_base_type', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_channel_by_name(ctx: Context, name: str) -> str:
-    """Find a channel with a given name in an image.
-
-    :param name: The name of the channel to find.
-    """
-    return call_api(ctx, 'Gimp.Image.get_channel_by_name', args=[name])
-
-@mcp.tool()
-def Gimp_Image_get_channel_by_tattoo(ctx: Context, tattoo: int) -> str:
-    """Find a channel with a given tattoo in an image.
-
-    :param tattoo: The tattoo of the channel to find.
-    """
-    return call_api(ctx, 'Gimp.Image.get_channel_by_tattoo', args=[tattoo])
-
-@mcp.tool()
-def Gimp_Image_get_channels(ctx: Context) -> str:
-    """Returns the list of channels contained in the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_channels', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_color_profile(ctx: Context) -> str:
-    """Returns the image’s color profile
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_color_profile', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_component_active(ctx: Context, component: str) -> str:
-    """Returns if the specified image’s image component is active.
-
-    :param component: The image component.
-    """
-    return call_api(ctx, 'Gimp.Image.get_component_active', args=[component])
-
-@mcp.tool()
-def Gimp_Image_get_component_visible(ctx: Context, component: str) -> str:
-    """Returns if the specified image’s image component is visible.
+    :param component: The image component.
+    """),
+    ('Gimp.Image.get_component_visible', [('component', str)],
+     """Returns if the specified image’s image component is visible.
 
     :param component: The image component.
-    """
-    return call_api(ctx, 'Gimp.Image.get_component_visible', args=[component])
-
-@mcp.tool()
-def Gimp_Image_get_default_new_layer_mode(ctx: Context) -> str:
-    """Get the default mode for newly created layers of this image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_default_new_layer_mode', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_effective_color_profile(ctx: Context) -> str:
-    """Returns the color profile that is used for the image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_effective_color_profile', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_exported_file(ctx: Context) -> str:
-    """Returns the exported file for the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_exported_file', args=[])
+    """),
+    ('Gimp.Image.get_default_new_layer_mode', [],
+     """Get the default mode for newly created layers of this image.
 
-@mcp.tool()
-def Gimp_Image_get_file(ctx: Context) -> str:
-    """Returns the file for the specified image.
+    """),
+    ('Gimp.Image.get_effective_color_profile', [],
+     """Returns the color profile that is used for the image.
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_file', args=[])
+    """),
+    ('Gimp.Image.get_exported_file', [],
+     """Returns the exported file for the specified image.
 
-@mcp.tool()
-def Gimp_Image_get_floating_sel(ctx: Context) -> str:
-    """Return the floating selection of the image.
+    """),
+    ('Gimp.Image.get_file', [],
+     """Returns the file for the specified image.
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_floating_sel', args=[])
+    """),
+    ('Gimp.Image.get_floating_sel', [],
+     """Return the floating selection of the image.
 
-@mcp.tool()
-def Gimp_Image_get_guide_orientation(ctx: Context, guide: int) -> str:
-    """Get orientation of a guide on an image.
+    """),
+    ('Gimp.Image.get_guide_orientation', [('guide', int)],
+     """Get orientation of a guide on an image.
 
     :param guide: The guide.
-    """
-    return call_api(ctx, 'Gimp.Image.get_guide_orientation', args=[guide])
-
-@mcp.tool()
-def Gimp_Image_get_guide_position(ctx: Context, guide: int) -> str:
-    """Get position of a guide on an image.
+    """),
+    ('Gimp.Image.get_guide_position', [('guide', int)],
+     """Get position of a guide on an image.
 
     :param guide: The guide.
-    """
-    return call_api(ctx, 'Gimp.Image.get_guide_position', args=[guide])
-
-@mcp.tool()
-def Gimp_Image_get_height(ctx: Context) -> str:
-    """Return the height of the image
+    """),
+    ('Gimp.Image.get_height', [],
+     """Return the height of the image
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_height', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_id(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_id', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_imported_file(ctx: Context) -> str:
-    """Returns the imported file for the specified image.
+    """),
+    ('Gimp.Image.get_id', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_imported_file', args=[])
+    """),
+    ('Gimp.Image.get_imported_file', [],
+     """Returns the imported file for the specified image.
 
-@mcp.tool()
-def Gimp_Image_get_item_position(ctx: Context, item: str) -> str:
-    """Returns the position of the item in its level of its item tree.
+    """),
+    ('Gimp.Image.get_item_position', [('item', str)],
+     """Returns the position of the item in its level of its item tree.
 
     :param item: The item.
-    """
-    return call_api(ctx, 'Gimp.Image.get_item_position', args=[item])
-
-@mcp.tool()
-def Gimp_Image_get_layer_by_name(ctx: Context, name: str) -> str:
-    """Find a layer with a given name in an image.
+    """),
+    ('Gimp.Image.get_layer_by_name', [('name', str)],
+     """Find a layer with a given name in an image.
 
     :param name: The name of the layer to find.
-    """
-    return call_api(ctx, 'Gimp.Image.get_layer_by_name', args=[name])
-
-@mcp.tool()
-def Gimp_Image_get_layer_by_tattoo(ctx: Context, tattoo: int) -> str:
-    """Find a layer with a given tattoo in an image.
+    """),
+    ('Gimp.Image.get_layer_by_tattoo', [('tattoo', int)],
+     """Find a layer with a given tattoo in an image.
 
     :param tattoo: The tattoo of the layer to find.
-    """
-    return call_api(ctx, 'Gimp.Image.get_layer_by_tattoo', args=[tattoo])
+    """),
+    ('Gimp.Image.get_layers', [],
+     """Returns the list of root layers contained in the specified image.
 
-@mcp.tool()
-def Gimp_Image_get_layers(ctx: Context) -> str:
-    """Returns the list of root layers contained in the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_layers', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_metadata(ctx: Context) -> str:
-    """Returns the image’s metadata.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_metadata', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_name(ctx: Context) -> str:
-    """Returns the specified image’s name.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_name', args=[])
+    """),
+    ('Gimp.Image.get_metadata', [],
+     """Returns the image’s metadata.
 
-@mcp.tool()
-def Gimp_Image_get_palette(ctx: Context) -> str:
-    """Returns the image’s colormap
+    """),
+    ('Gimp.Image.get_name', [],
+     """Returns the specified image’s name.
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_palette', args=[])
+    """),
+    ('Gimp.Image.get_palette', [],
+     """Returns the image’s colormap
 
-@mcp.tool()
-def Gimp_Image_get_parasite(ctx: Context, name: str) -> str:
-    """Look up a parasite in an image
+    """),
+    ('Gimp.Image.get_parasite', [('name', str)],
+     """Look up a parasite in an image
 
     :param name: The name of the parasite to find.
-    """
-    return call_api(ctx, 'Gimp.Image.get_parasite', args=[name])
-
-@mcp.tool()
-def Gimp_Image_get_parasite_list(ctx: Context) -> str:
-    """List all parasites.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_parasite_list', args=[])
+    """),
+    ('Gimp.Image.get_parasite_list', [],
+     """List all parasites.
 
-@mcp.tool()
-def Gimp_Image_get_path_by_name(ctx: Context, name: str) -> str:
-    """Find a path with a given name in an image.
+    """),
+    ('Gimp.Image.get_path_by_name', [('name', str)],
+     """Find a path with a given name in an image.
 
     :param name: The name of the path to find.
-    """
-    return call_api(ctx, 'Gimp.Image.get_path_by_name', args=[name])
-
-@mcp.tool()
-def Gimp_Image_get_path_by_tattoo(ctx: Context, tattoo: int) -> str:
-    """Find a path with a given tattoo in an image.
+    """),
+    ('Gimp.Image.get_path_by_tattoo', [('tattoo', int)],
+     """Find a path with a given tattoo in an image.
 
     :param tattoo: The tattoo of the path to find.
-    """
-    return call_api(ctx, 'Gimp.Image.get_path_by_tattoo', args=[tattoo])
+    """),
+    ('Gimp.Image.get_paths', [],
+     """Returns the list of paths contained in the specified image.
 
-@mcp.tool()
-def Gimp_Image_get_paths(ctx: Context) -> str:
-    """Returns the list of paths contained in the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_paths', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_precision(ctx: Context) -> str:
-    """Get the precision of the image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_precision', args=[])
+    """),
+    ('Gimp.Image.get_precision', [],
+     """Get the precision of the image.
 
-@mcp.tool()
-def Gimp_Image_get_resolution(ctx: Context, xresolution: float, yresolution: float) -> str:
-    """Returns the specified image’s resolution.
+    """),
+    ('Gimp.Image.get_resolution', [('xresolution', float), ('yresolution', float)],
+     """Returns the specified image’s resolution.
 
     :param xresolution: The resolution in the x-axis, in dots per inch.
     :param yresolution: The resolution in the y-axis, in dots per inch.
-    """
-    return call_api(ctx, 'Gimp.Image.get_resolution', args=[xresolution, yresolution])
-
-@mcp.tool()
-def Gimp_Image_get_sample_point_position(ctx: Context, sample_point: int, position_y: int) -> str:
-    """Get position of a sample point on an image.
+    """),
+    ('Gimp.Image.get_sample_point_position', [('sample_point', int), ('position_y', int)],
+     """Get position of a sample point on an image.
 
     :param sample_point: The guide.
     :param position_y: The sample point’s y-offset relative to top of image.
-    """
-    return call_api(ctx, 'Gimp.Image.get_sample_point_position', args=[sample_point, position_y])
-
-@mcp.tool()
-def Gimp_Image_get_selected_channels(ctx: Context) -> str:
-    """Returns the specified image’s selected channels.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_selected_channels', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_selected_drawables(ctx: Context) -> str:
-    """Get the image’s selected drawables
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_selected_drawables', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_selected_layers(ctx: Context) -> str:
-    """Returns the specified image’s selected layers.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_selected_layers', args=[])
+    """),
+    ('Gimp.Image.get_selected_channels', [],
+     """Returns the specified image’s selected channels.
 
-@mcp.tool()
-def Gimp_Image_get_selected_paths(ctx: Context) -> str:
-    """Returns the specified image’s selected paths.
+    """),
+    ('Gimp.Image.get_selected_drawables', [],
+     """Get the image’s selected drawables
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_selected_paths', args=[])
+    """),
+    ('Gimp.Image.get_selected_layers', [],
+     """Returns the specified image’s selected layers.
 
-@mcp.tool()
-def Gimp_Image_get_selection(ctx: Context) -> str:
-    """Returns the specified image’s selection.
+    """),
+    ('Gimp.Image.get_selected_paths', [],
+     """Returns the specified image’s selected paths.
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_selection', args=[])
+    """),
+    ('Gimp.Image.get_selection', [],
+     """Returns the specified image’s selection.
 
-@mcp.tool()
-def Gimp_Image_get_simulation_bpc(ctx: Context) -> str:
-    """Returns whether the image has Black Point Compensation enabled for
+    """),
+    ('Gimp.Image.get_simulation_bpc', [],
+     """Returns whether the image has Black Point Compensation enabled for
 its simulation
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_simulation_bpc', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_simulation_intent(ctx: Context) -> str:
-    """Returns the image’s simulation rendering intent
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_simulation_intent', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_simulation_profile(ctx: Context) -> str:
-    """Returns the image’s simulation color profile
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_simulation_profile', args=[])
+    """),
+    ('Gimp.Image.get_simulation_intent', [],
+     """Returns the image’s simulation rendering intent
 
-@mcp.tool()
-def Gimp_Image_get_tattoo_state(ctx: Context) -> str:
-    """Returns the tattoo state associated with the image.
+    """),
+    ('Gimp.Image.get_simulation_profile', [],
+     """Returns the image’s simulation color profile
 
-    """
-    return call_api(ctx, 'Gimp.Image.get_tattoo_state', args=[])
+    """),
+    ('Gimp.Image.get_tattoo_state', [],
+     """Returns the tattoo state associated with the image.
 
-@mcp.tool()
-def Gimp_Image_get_thumbnail(ctx: Context, width: int, height: int, alpha: str) -> str:
-    """Retrieves a thumbnail pixbuf for image.
+    """),
+    ('Gimp.Image.get_thumbnail', [('width', int), ('height', int), ('alpha', str)],
+     """Retrieves a thumbnail pixbuf for image.
 The thumbnail will be not larger than the requested size.
 
     :param width: The requested thumbnail width  (<= 1024 pixels)
     :param height: The requested thumbnail height (<= 1024 pixels)
     :param alpha: How to handle an alpha channel.
-    """
-    return call_api(ctx, 'Gimp.Image.get_thumbnail', args=[width, height, alpha])
-
-@mcp.tool()
-def Gimp_Image_get_thumbnail_data(ctx: Context, width: int, height: int, bpp: int) -> str:
-    """Get a thumbnail of an image.
+    """),
+    ('Gimp.Image.get_thumbnail_data', [('width', int), ('height', int), ('bpp', int)],
+     """Get a thumbnail of an image.
 
     :param width: The requested thumbnail width.
     :param height: The requested thumbnail height.
     :param bpp: The previews bpp.
-    """
-    return call_api(ctx, 'Gimp.Image.get_thumbnail_data', args=[width, height, bpp])
-
-@mcp.tool()
-def Gimp_Image_get_unit(ctx: Context) -> str:
-    """Returns the specified image’s unit.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_unit', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_width(ctx: Context) -> str:
-    """Return the width of the image
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_width', args=[])
-
-@mcp.tool()
-def Gimp_Image_get_xcf_file(ctx: Context) -> str:
-    """Returns the XCF file for the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.get_xcf_file', args=[])
+    """),
+    ('Gimp.Image.get_unit', [],
+     """Returns the specified image’s unit.
 
-@mcp.tool()
-def Gimp_Image_grid_get_background_color(ctx: Context) -> str:
-    """Sets the background color of an image’s grid.
+    """),
+    ('Gimp.Image.get_width', [],
+     """Return the width of the image
 
-    """
-    return call_api(ctx, 'Gimp.Image.grid_get_background_color', args=[])
+    """),
+    ('Gimp.Image.get_xcf_file', [],
+     """Returns the XCF file for the specified image.
 
-@mcp.tool()
-def Gimp_Image_grid_get_foreground_color(ctx: Context) -> str:
-    """Sets the foreground color of an image’s grid.
+    """),
+    ('Gimp.Image.grid_get_background_color', [],
+     """Sets the background color of an image’s grid.
 
-    """
-    return call_api(ctx, 'Gimp.Image.grid_get_foreground_color', args=[])
+    """),
+    ('Gimp.Image.grid_get_foreground_color', [],
+     """Sets the foreground color of an image’s grid.
 
-@mcp.tool()
-def Gimp_Image_grid_get_offset(ctx: Context, xoffset: float, yoffset: float) -> str:
-    """Gets the offset of an image’s grid.
+    """),
+    ('Gimp.Image.grid_get_offset', [('xoffset', float), ('yoffset', float)],
+     """Gets the offset of an image’s grid.
 
     :param xoffset: The image’s grid horizontal offset.
     :param yoffset: The image’s grid vertical offset.
-    """
-    return call_api(ctx, 'Gimp.Image.grid_get_offset', args=[xoffset, yoffset])
-
-@mcp.tool()
-def Gimp_Image_grid_get_spacing(ctx: Context, xspacing: float, yspacing: float) -> str:
-    """Gets the spacing of an image’s grid.
+    """),
+    ('Gimp.Image.grid_get_spacing', [('xspacing', float), ('yspacing', float)],
+     """Gets the spacing of an image’s grid.
 
     :param xspacing: The image’s grid horizontal spacing.
     :param yspacing: The image’s grid vertical spacing.
-    """
-    return call_api(ctx, 'Gimp.Image.grid_get_spacing', args=[xspacing, yspacing])
-
-@mcp.tool()
-def Gimp_Image_grid_get_style(ctx: Context) -> str:
-    """Gets the style of an image’s grid.
+    """),
+    ('Gimp.Image.grid_get_style', [],
+     """Gets the style of an image’s grid.
 
-    """
-    return call_api(ctx, 'Gimp.Image.grid_get_style', args=[])
-
-@mcp.tool()
-def Gimp_Image_grid_set_background_color(ctx: Context, bgcolor: str) -> str:
-    """Gets the background color of an image’s grid.
+    """),
+    ('Gimp.Image.grid_set_background_color', [('bgcolor', str)],
+     """Gets the background color of an image’s grid.
 
     :param bgcolor: The new background color.
-    """
-    return call_api(ctx, 'Gimp.Image.grid_set_background_color', args=[bgcolor])
-
-@mcp.tool()
-def Gimp_Image_grid_set_foreground_color(ctx: Context, fgcolor: str) -> str:
-    """Gets the foreground color of an image’s grid.
+    """),
+    ('Gimp.Image.grid_set_foreground_color', [('fgcolor', str)],
+     """Gets the foreground color of an image’s grid.
 
     :param fgcolor: The new foreground color.
-    """
-    return call_api(ctx, 'Gimp.Image.grid_set_foreground_color', args=[fgcolor])
-
-@mcp.tool()
-def Gimp_Image_grid_set_offset(ctx: Context, xoffset: float, yoffset: float) -> str:
-    """Sets the offset of an image’s grid.
+    """),
+    ('Gimp.Image.grid_set_offset', [('xoffset', float), ('yoffset', float)],
+     """Sets the offset of an image’s grid.
 
     :param xoffset: The image’s grid horizontal offset.
     :param yoffset: The image’s grid vertical offset.
-    """
-    return call_api(ctx, 'Gimp.Image.grid_set_offset', args=[xoffset, yoffset])
-
-@mcp.tool()
-def Gimp_Image_grid_set_spacing(ctx: Context, xspacing: float, yspacing: float) -> str:
-    """Sets the spacing of an image’s grid.
+    """),
+    ('Gimp.Image.grid_set_spacing', [('xspacing', float), ('yspacing', float)],
+     """Sets the spacing of an image’s grid.
 
     :param xspacing: The image’s grid horizontal spacing.
     :param yspacing: The image’s grid vertical spacing.
-    """
-    return call_api(ctx, 'Gimp.Image.grid_set_spacing', args=[xspacing, yspacing])
-
-@mcp.tool()
-def Gimp_Image_grid_set_style(ctx: Context, style: str) -> str:
-    """Sets the style unit of an image’s grid.
+    """),
+    ('Gimp.Image.grid_set_style', [('style', str)],
+     """Sets the style unit of an image’s grid.
 
     :param style: The image’s grid style.
-    """
-    return call_api(ctx, 'Gimp.Image.grid_set_style', args=[style])
-
-@mcp.tool()
-def Gimp_Image_import_paths_from_file(ctx: Context, file: str, merge: bool, scale: bool, paths: str = None) -> str:
-    """Import paths from an SVG file.
+    """),
+    ('Gimp.Image.import_paths_from_file', [('file', str), ('merge', bool), ('scale', bool), ('paths', str, None)],
+     """Import paths from an SVG file.
 
     :param file: The SVG file to import.
     :param merge: Merge paths into a single path object.
     :param scale: Scale the SVG to image dimensions.
     :param paths: The list of newly created paths.
-    """
-    return call_api(ctx, 'Gimp.Image.import_paths_from_file', args=[file, merge, scale, paths])
-
-@mcp.tool()
-def Gimp_Image_import_paths_from_string(ctx: Context, string: str, length: int, merge: bool, scale: bool, paths: str = None) -> str:
-    """Import paths from an SVG string.
+    """),
+    ('Gimp.Image.import_paths_from_string', [('string', str), ('length', int), ('merge', bool), ('scale', bool), ('paths', str, None)],
+     """Import paths from an SVG string.
 
     :param string: A string that must be a complete and valid SVG document.
     :param length: Number of bytes in string or -1 if the string is NULL terminated.
     :param merge: Merge paths into a single path object.
     :param scale: Scale the SVG to image dimensions.
     :param paths: The list of newly created paths.
-    """
-    return call_api(ctx, 'Gimp.Image.import_paths_from_string', args=[string, length, merge, scale, paths])
-
-@mcp.tool()
-def Gimp_Image_insert_channel(ctx: Context, channel: str, parent: str = None, position: int = 0) -> str:
-    """Add the specified channel to the image.
+    """),
+    ('Gimp.Image.insert_channel', [('channel', str), ('parent', str, None), ('position', int, 0)],
+     """Add the specified channel to the image.
 
     :param channel: The channel.
     :param parent: The parent channel.
     :param position: The channel position.
-    """
-    return call_api(ctx, 'Gimp.Image.insert_channel', args=[channel, parent, position])
-
-@mcp.tool()
-def Gimp_Image_insert_layer(ctx: Context, layer: str, parent: str = None, position: int = 0) -> str:
-    """Add the specified layer to the image.
+    """),
+    ('Gimp.Image.insert_layer', [('layer', str), ('parent', str, None), ('position', int, 0)],
+     """Add the specified layer to the image.
 
     :param layer: The layer.
     :param parent: The parent layer.
     :param position: The layer position.
-    """
-    return call_api(ctx, 'Gimp.Image.insert_layer', args=[layer, parent, position])
-
-@mcp.tool()
-def Gimp_Image_insert_path(ctx: Context, path: str, parent: str = None, position: int = 0) -> str:
-    """Add the specified path to the image.
+    """),
+    ('Gimp.Image.insert_path', [('path', str), ('parent', str, None), ('position', int, 0)],
+     """Add the specified path to the image.
 
     :param path: The path.
     :param parent: The parent path.
     :param position: The path position.
-    """
-    return call_api(ctx, 'Gimp.Image.insert_path', args=[path, parent, position])
-
-@mcp.tool()
-def Gimp_Image_is_dirty(ctx: Context) -> str:
-    """Checks if the image has unsaved changes.
-
-    """
-    return call_api(ctx, 'Gimp.Image.is_dirty', args=[])
-
-@mcp.tool()
-def Gimp_Image_is_valid(ctx: Context) -> str:
-    """Returns TRUE if the image is valid.
-
-    """
-    return call_api(ctx, 'Gimp.Image.is_valid', args=[])
-
-@mcp.tool()
-def Gimp_Image_list_channels(ctx: Context) -> str:
-    """Returns the list of channels contained in the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.list_channels', args=[])
-
-@mcp.tool()
-def Gimp_Image_list_layers(ctx: Context) -> str:
-    """Returns the list of layers contained in the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.list_layers', args=[])
-
-@mcp.tool()
-def Gimp_Image_list_paths(ctx: Context) -> str:
-    """Returns the list of paths contained in the specified image.
-
-    """
-    return call_api(ctx, 'Gimp.Image.list_paths', args=[])
+    """),
+    ('Gimp.Image.is_dirty', [],
+     """Checks if the image has unsaved changes.
 
-@mcp.tool()
-def Gimp_Image_list_selected_channels(ctx: Context) -> str:
-    """Returns the list of channels selected in the specified image.
+    """),
+    ('Gimp.Image.is_valid', [],
+     """Returns TRUE if the image is valid.
 
-    """
-    return call_api(ctx, 'Gimp.Image.list_selected_channels', args=[])
+    """),
+    ('Gimp.Image.list_channels', [],
+     """Returns the list of channels contained in the specified image.
 
-@mcp.tool()
-def Gimp_Image_list_selected_drawables(ctx: Context) -> str:
-    """Returns the list of drawables selected in the specified image.
+    """),
+    ('Gimp.Image.list_layers', [],
+     """Returns the list of layers contained in the specified image.
 
-    """
-    return call_api(ctx, 'Gimp.Image.list_selected_drawables', args=[])
+    """),
+    ('Gimp.Image.list_paths', [],
+     """Returns the list of paths contained in the specified image.
 
-@mcp.tool()
-def Gimp_Image_list_selected_layers(ctx: Context) -> str:
-    """Returns the list of layers selected in the specified image.
+    """),
+    ('Gimp.Image.list_selected_channels', [],
+     """Returns the list of channels selected in the specified image.
 
-    """
-    return call_api(ctx, 'Gimp.Image.list_selected_layers', args=[])
+    """),
+    ('Gimp.Image.list_selected_drawables', [],
+     """Returns the list of drawables selected in the specified image.
 
-@mcp.tool()
-def Gimp_Image_list_selected_paths(ctx: Context) -> str:
-    """Returns the list of paths selected in the specified image.
+    """),
+    ('Gimp.Image.list_selected_layers', [],
+     """Returns the list of layers selected in the specified image.
 
-    """
-    return call_api(ctx, 'Gimp.Image.list_selected_paths', args=[])
+    """),
+    ('Gimp.Image.list_selected_paths', [],
+     """Returns the list of paths selected in the specified image.
 
-@mcp.tool()
-def Gimp_Image_lower_item(ctx: Context, item: str) -> str:
-    """Lower the specified item in its level in its item tree
+    """),
+    ('Gimp.Image.lower_item', [('item', str)],
+     """Lower the specified item in its level in its item tree
 
     :param item: The item to lower.
-    """
-    return call_api(ctx, 'Gimp.Image.lower_item', args=[item])
-
-@mcp.tool()
-def Gimp_Image_lower_item_to_bottom(ctx: Context, item: str) -> str:
-    """Lower the specified item to the bottom of its level in its item tree
+    """),
+    ('Gimp.Image.lower_item_to_bottom', [('item', str)],
+     """Lower the specified item to the bottom of its level in its item tree
 
     :param item: The item to lower to bottom.
-    """
-    return call_api(ctx, 'Gimp.Image.lower_item_to_bottom', args=[item])
-
-@mcp.tool()
-def Gimp_Image_merge_down(ctx: Context, merge_layer: str, merge_type: str) -> str:
-    """Merge the layer passed and the first visible layer below.
+    """),
+    ('Gimp.Image.merge_down', [('merge_layer', str), ('merge_type', str)],
+     """Merge the layer passed and the first visible layer below.
 
     :param merge_layer: The layer to merge down from.
     :param merge_type: The type of merge.
-    """
-    return call_api(ctx, 'Gimp.Image.merge_down', args=[merge_layer, merge_type])
-
-@mcp.tool()
-def Gimp_Image_merge_visible_layers(ctx: Context, merge_type: str) -> str:
-    """Merge the visible image layers into one.
+    """),
+    ('Gimp.Image.merge_visible_layers', [('merge_type', str)],
+     """Merge the visible image layers into one.
 
     :param merge_type: The type of merge.
-    """
-    return call_api(ctx, 'Gimp.Image.merge_visible_layers', args=[merge_type])
-
-@mcp.tool()
-def Gimp_Image_metadata_save_filter(ctx: Context, mime_type: str, metadata: str, flags: str, file: str, error: str = None) -> str:
-    """Filters the metadata retrieved from the image with
+    """),
+    ('Gimp.Image.metadata_save_filter', [('mime_type', str), ('metadata', str), ('flags', str), ('file', str), ('error', str, None)],
+     """Filters the metadata retrieved from the image with
 gimp_image_metadata_save_prepare(), taking into account the
 passed flags.
 
@@ -2667,21 +2170,15 @@ passed flags.
     :param flags: Flags to specify what of the metadata to save.
     :param file: The file image was saved to or NULL if file was not saved yet.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.Image.metadata_save_filter', args=[mime_type, metadata, flags, file, error])
-
-@mcp.tool()
-def Gimp_Image_metadata_save_prepare(ctx: Context, mime_type: str, suggested_flags: str) -> str:
-    """Gets the image metadata for storing it in an exported file.
+    """),
+    ('Gimp.Image.metadata_save_prepare', [('mime_type', str), ('suggested_flags', str)],
+     """Gets the image metadata for storing it in an exported file.
 
     :param mime_type: The saved file’s mime-type.
     :param suggested_flags: Suggested default values for the metadata to export.
-    """
-    return call_api(ctx, 'Gimp.Image.metadata_save_prepare', args=[mime_type, suggested_flags])
-
-@mcp.tool()
-def Gimp_Image_pick_color(ctx: Context, drawables: str = None, x: float = 0, y: float = 0, sample_merged: bool = False, sample_average: bool = False, average_radius: float = 0.0, color: str = None) -> str:
-    """Determine the color at the given coordinates
+    """),
+    ('Gimp.Image.pick_color', [('drawables', str, None), ('x', float, 0), ('y', float, 0), ('sample_merged', bool, False), ('sample_average', bool, False), ('average_radius', float, 0.0), ('color', str, None)],
+     """Determine the color at the given coordinates
 
     :param drawables: The drawables to pick from.
     :param x: X coordinate of upper-left corner of rectangle.
@@ -2690,188 +2187,128 @@ def Gimp_Image_pick_color(ctx: Context, drawables: str = None, x: float = 0, y:
     :param sample_average: Average the color of all the pixels in a specified radius.
     :param average_radius: The radius of pixels to average.
     :param color: The return color.
-    """
-    return call_api(ctx, 'Gimp.Image.pick_color', args=[drawables, x, y, sample_merged, sample_average, average_radius, color])
-
-@mcp.tool()
-def Gimp_Image_pick_correlate_layer(ctx: Context, x: int, y: int) -> str:
-    """Find the layer visible at the specified coordinates.
+    """),
+    ('Gimp.Image.pick_correlate_layer', [('x', int), ('y', int)],
+     """Find the layer visible at the specified coordinates.
 
     :param x: The x coordinate for the pick.
     :param y: The y coordinate for the pick.
-    """
-    return call_api(ctx, 'Gimp.Image.pick_correlate_layer', args=[x, y])
-
-@mcp.tool()
-def Gimp_Image_policy_color_profile(ctx: Context, interactive: bool) -> str:
-    """Execute the color profile conversion policy.
+    """),
+    ('Gimp.Image.policy_color_profile', [('interactive', bool)],
+     """Execute the color profile conversion policy.
 
     :param interactive: Querying the user through a dialog is a possibility.
-    """
-    return call_api(ctx, 'Gimp.Image.policy_color_profile', args=[interactive])
-
-@mcp.tool()
-def Gimp_Image_policy_rotate(ctx: Context, interactive: bool) -> str:
-    """Execute the "Orientation" metadata policy.
+    """),
+    ('Gimp.Image.policy_rotate', [('interactive', bool)],
+     """Execute the "Orientation" metadata policy.
 
     :param interactive: Querying the user through a dialog is a possibility.
-    """
-    return call_api(ctx, 'Gimp.Image.policy_rotate', args=[interactive])
-
-@mcp.tool()
-def Gimp_Image_raise_item(ctx: Context, item: str) -> str:
-    """Raise the specified item in its level in its item tree
+    """),
+    ('Gimp.Image.raise_item', [('item', str)],
+     """Raise the specified item in its level in its item tree
 
     :param item: The item to raise.
-    """
-    return call_api(ctx, 'Gimp.Image.raise_item', args=[item])
-
-@mcp.tool()
-def Gimp_Image_raise_item_to_top(ctx: Context, item: str) -> str:
-    """Raise the specified item to the top of its level in its item tree
+    """),
+    ('Gimp.Image.raise_item_to_top', [('item', str)],
+     """Raise the specified item to the top of its level in its item tree
 
     :param item: The item to raise to top.
-    """
-    return call_api(ctx, 'Gimp.Image.raise_item_to_top', args=[item])
-
-@mcp.tool()
-def Gimp_Image_remove_channel(ctx: Context, channel: str) -> str:
-    """Remove the specified channel from the image.
+    """),
+    ('Gimp.Image.remove_channel', [('channel', str)],
+     """Remove the specified channel from the image.
 
     :param channel: The channel.
-    """
-    return call_api(ctx, 'Gimp.Image.remove_channel', args=[channel])
-
-@mcp.tool()
-def Gimp_Image_remove_layer(ctx: Context, layer: str) -> str:
-    """Remove the specified layer from the image.
+    """),
+    ('Gimp.Image.remove_layer', [('layer', str)],
+     """Remove the specified layer from the image.
 
     :param layer: The layer.
-    """
-    return call_api(ctx, 'Gimp.Image.remove_layer', args=[layer])
-
-@mcp.tool()
-def Gimp_Image_remove_path(ctx: Context, path: str) -> str:
-    """Remove the specified path from the image.
+    """),
+    ('Gimp.Image.remove_path', [('path', str)],
+     """Remove the specified path from the image.
 
     :param path: The path object.
-    """
-    return call_api(ctx, 'Gimp.Image.remove_path', args=[path])
-
-@mcp.tool()
-def Gimp_Image_reorder_item(ctx: Context, item: str, parent: str = None, position: int = 0) -> str:
-    """Reorder the specified item within its item tree
+    """),
+    ('Gimp.Image.reorder_item', [('item', str), ('parent', str, None), ('position', int, 0)],
+     """Reorder the specified item within its item tree
 
     :param item: The item to reorder.
     :param parent: The new parent item.
     :param position: The new position of the item.
-    """
-    return call_api(ctx, 'Gimp.Image.reorder_item', args=[item, parent, position])
-
-@mcp.tool()
-def Gimp_Image_resize(ctx: Context, new_width: int, new_height: int, offx: int, offy: int) -> str:
-    """Resize the image to the specified extents.
+    """),
+    ('Gimp.Image.resize', [('new_width', int), ('new_height', int), ('offx', int), ('offy', int)],
+     """Resize the image to the specified extents.
 
     :param new_width: New image width.
     :param new_height: New image height.
     :param offx: X offset between upper left corner of old and new images: (new - old).
     :param offy: Y offset between upper left corner of old and new images: (new - old).
-    """
-    return call_api(ctx, 'Gimp.Image.resize', args=[new_width, new_height, offx, offy])
-
-@mcp.tool()
-def Gimp_Image_resize_to_layers(ctx: Context) -> str:
-    """Resize the image to fit all layers.
-
-    """
-    return call_api(ctx, 'Gimp.Image.resize_to_layers', args=[])
+    """),
+    ('Gimp.Image.resize_to_layers', [],
+     """Resize the image to fit all layers.
 
-@mcp.tool()
-def Gimp_Image_rotate(ctx: Context, rotate_type: str) -> str:
-    """Rotates the image by the specified degrees.
+    """),
+    ('Gimp.Image.rotate', [('rotate_type', str)],
+     """Rotates the image by the specified degrees.
 
     :param rotate_type: Angle of rotation.
-    """
-    return call_api(ctx, 'Gimp.Image.rotate', args=[rotate_type])
-
-@mcp.tool()
-def Gimp_Image_scale(ctx: Context, new_width: int, new_height: int) -> str:
-    """Scale the image using the default interpolation method.
+    """),
+    ('Gimp.Image.scale', [('new_width', int), ('new_height', int)],
+     """Scale the image using the default interpolation method.
 
     :param new_width: New image width.
     :param new_height: New image height.
-    """
-    return call_api(ctx, 'Gimp.Image.scale', args=[new_width, new_height])
-
-@mcp.tool()
-def Gimp_Image_select_color(ctx: Context, operation: str, drawable: str, color: str) -> str:
-    """Create a selection by selecting all pixels (in the specified
+    """),
+    ('Gimp.Image.select_color', [('operation', str), ('drawable', str), ('color', str)],
+     """Create a selection by selecting all pixels (in the specified
 drawable) with the same (or similar) color to that specified.
 
     :param operation: The selection operation.
     :param drawable: The affected drawable.
     :param color: The color to select.
-    """
-    return call_api(ctx, 'Gimp.Image.select_color', args=[operation, drawable, color])
-
-@mcp.tool()
-def Gimp_Image_select_contiguous_color(ctx: Context, operation: str, drawable: str, x: float, y: float) -> str:
-    """Create a selection by selecting all pixels around specified
+    """),
+    ('Gimp.Image.select_contiguous_color', [('operation', str), ('drawable', str), ('x', float), ('y', float)],
+     """Create a selection by selecting all pixels around specified
 coordinates with the same (or similar) color to that at the coordinates.
 
     :param operation: The selection operation.
     :param drawable: The affected drawable.
     :param x: X coordinate of initial seed fill point: (image coordinates).
     :param y: Y coordinate of initial seed fill point: (image coordinates).
-    """
-    return call_api(ctx, 'Gimp.Image.select_contiguous_color', args=[operation, drawable, x, y])
-
-@mcp.tool()
-def Gimp_Image_select_ellipse(ctx: Context, operation: str, x: float, y: float, width: float, height: float) -> str:
-    """Create an elliptical selection over the specified image.
+    """),
+    ('Gimp.Image.select_ellipse', [('operation', str), ('x', float), ('y', float), ('width', float), ('height', float)],
+     """Create an elliptical selection over the specified image.
 
     :param operation: The selection operation.
     :param x: X coordinate of upper-left corner of ellipse bounding box.
     :param y: Y coordinate of upper-left corner of ellipse bounding box.
     :param width: The width of the ellipse.
     :param height: The height of the ellipse.
-    """
-    return call_api(ctx, 'Gimp.Image.select_ellipse', args=[operation, x, y, width, height])
-
-@mcp.tool()
-def Gimp_Image_select_item(ctx: Context, operation: str, item: str) -> str:
-    """Transforms the specified item into a selection
+    """),
+    ('Gimp.Image.select_item', [('operation', str), ('item', str)],
+     """Transforms the specified item into a selection
 
     :param operation: The desired operation with current selection.
     :param item: The item to render to the selection.
-    """
-    return call_api(ctx, 'Gimp.Image.select_item', args=[operation, item])
-
-@mcp.tool()
-def Gimp_Image_select_polygon(ctx: Context, operation: str, num_segs: int, segs: str) -> str:
-    """Create a polygonal selection over the specified image.
+    """),
+    ('Gimp.Image.select_polygon', [('operation', str), ('num_segs', int), ('segs', str)],
+     """Create a polygonal selection over the specified image.
 
     :param operation: The selection operation.
     :param num_segs: Number of points (count 1 coordinate as two points).
     :param segs: Array of points: { p1.x, p1.y, p2.x, p2.y, …, pn.x, pn.y}.
-    """
-    return call_api(ctx, 'Gimp.Image.select_polygon', args=[operation, num_segs, segs])
-
-@mcp.tool()
-def Gimp_Image_select_rectangle(ctx: Context, operation: str, x: float, y: float, width: float, height: float) -> str:
-    """Create a rectangular selection over the specified image;
+    """),
+    ('Gimp.Image.select_rectangle', [('operation', str), ('x', float), ('y', float), ('width', float), ('height', float)],
+     """Create a rectangular selection over the specified image;
 
     :param operation: The selection operation.
     :param x: X coordinate of upper-left corner of rectangle.
     :param y: Y coordinate of upper-left corner of rectangle.
     :param width: The width of the rectangle.
     :param height: The height of the rectangle.
-    """
-    return call_api(ctx, 'Gimp.Image.select_rectangle', args=[operation, x, y, width, height])
-
-@mcp.tool()
-def Gimp_Image_select_round_rectangle(ctx: Context, operation: str, x: float, y: float, width: float, height: float, corner_radius_x: float, corner_radius_y: float) -> str:
-    """Create a rectangular selection with round corners over the specified image;
+    """),
+    ('Gimp.Image.select_round_rectangle', [('operation', str), ('x', float), ('y', float), ('width', float), ('height', float), ('corner_radius_x', float), ('corner_radius_y', float)],
+     """Create a rectangular selection with round corners over the specified image;
 
     :param operation: The selection operation.
     :param x: X coordinate of upper-left corner of rectangle.
@@ -2880,522 +2317,318 @@ def Gimp_Image_select_round_rectangle(ctx: Context, operation: str, x: float, y:
     :param height: The height of the rectangle.
     :param corner_radius_x: The corner radius in X direction.
     :param corner_radius_y: The corner radius in Y direction.
-    """
-    return call_api(ctx, 'Gimp.Image.select_round_rectangle', args=[operation, x, y, width, height, corner_radius_x, corner_radius_y])
-
-@mcp.tool()
-def Gimp_Image_set_color_profile(ctx: Context, profile: str = None) -> str:
-    """Sets the image’s color profile
+    """),
+    ('Gimp.Image.set_color_profile', [('profile', str, None)],
+     """Sets the image’s color profile
 
     :param profile: A GimpColorProfile, or NULL.
-    """
-    return call_api(ctx, 'Gimp.Image.set_color_profile', args=[profile])
-
-@mcp.tool()
-def Gimp_Image_set_color_profile_from_file(ctx: Context, file: str) -> str:
-    """Sets the image’s color profile from an ICC file
+    """),
+    ('Gimp.Image.set_color_profile_from_file', [('file', str)],
+     """Sets the image’s color profile from an ICC file
 
     :param file: The file containing the new color profile.
-    """
-    return call_api(ctx, 'Gimp.Image.set_color_profile_from_file', args=[file])
-
-@mcp.tool()
-def Gimp_Image_set_component_active(ctx: Context, component: str, active: bool) -> str:
-    """Sets if the specified image’s image component is active.
+    """),
+    ('Gimp.Image.set_component_active', [('component', str), ('active', bool)],
+     """Sets if the specified image’s image component is active.
 
     :param component: The image component.
     :param active: Component is active.
-    """
-    return call_api(ctx, 'Gimp.Image.set_component_active', args=[component, active])
-
-@mcp.tool()
-def Gimp_Image_set_component_visible(ctx: Context, component: str, visible: bool) -> str:
-    """Sets if the specified image’s image component is visible.
+    """),
+    ('Gimp.Image.set_component_visible', [('component', str), ('visible', bool)],
+     """Sets if the specified image’s image component is visible.
 
     :param component: The image component.
     :param visible: Component is visible.
-    """
-    return call_api(ctx, 'Gimp.Image.set_component_visible', args=[component, visible])
-
-@mcp.tool()
-def Gimp_Image_set_file(ctx: Context, file: str) -> str:
-    """Sets the specified XCF image’s file.
+    """),
+    ('Gimp.Image.set_file', [('file', str)],
+     """Sets the specified XCF image’s file.
 
     :param file: The new image file.
-    """
-    return call_api(ctx, 'Gimp.Image.set_file', args=[file])
-
-@mcp.tool()
-def Gimp_Image_set_metadata(ctx: Context, metadata: str) -> str:
-    """Set the image’s metadata.
+    """),
+    ('Gimp.Image.set_metadata', [('metadata', str)],
+     """Set the image’s metadata.
 
     :param metadata: The exif/ptc/xmp metadata.
-    """
-    return call_api(ctx, 'Gimp.Image.set_metadata', args=[metadata])
-
-@mcp.tool()
-def Gimp_Image_set_palette(ctx: Context, new_palette: str) -> str:
-    """Set the image’s colormap to a copy of palette
+    """),
+    ('Gimp.Image.set_palette', [('new_palette', str)],
+     """Set the image’s colormap to a copy of palette
 
     :param new_palette: The palette to copy from.
-    """
-    return call_api(ctx, 'Gimp.Image.set_palette', args=[new_palette])
-
-@mcp.tool()
-def Gimp_Image_set_resolution(ctx: Context, xresolution: float, yresolution: float) -> str:
-    """Sets the specified image’s resolution.
+    """),
+    ('Gimp.Image.set_resolution', [('xresolution', float), ('yresolution', float)],
+     """Sets the specified image’s resolution.
 
     :param xresolution: The new image resolution in the x-axis, in dots per inch.
     :param yresolution: The new image resolution in the y-axis, in dots per inch.
-    """
-    return call_api(ctx, 'Gimp.Image.set_resolution', args=[xresolution, yresolution])
-
-@mcp.tool()
-def Gimp_Image_set_selected_channels(ctx: Context, channels: str = None) -> str:
-    """Sets the specified image’s selected channels.
+    """),
+    ('Gimp.Image.set_selected_channels', [('channels', str, None)],
+     """Sets the specified image’s selected channels.
 
     :param channels: The list of channels to select.
-    """
-    return call_api(ctx, 'Gimp.Image.set_selected_channels', args=[channels])
-
-@mcp.tool()
-def Gimp_Image_set_selected_layers(ctx: Context, layers: str = None) -> str:
-    """Sets the specified image’s selected layers.
+    """),
+    ('Gimp.Image.set_selected_layers', [('layers', str, None)],
+     """Sets the specified image’s selected layers.
 
     :param layers: The list of layers to select.
-    """
-    return call_api(ctx, 'Gimp.Image.set_selected_layers', args=[layers])
-
-@mcp.tool()
-def Gimp_Image_set_selected_paths(ctx: Context, paths: str = None) -> str:
-    """Sets the specified image’s selected paths.
+    """),
+    ('Gimp.Image.set_selected_paths', [('paths', str, None)],
+     """Sets the specified image’s selected paths.
 
     :param paths: The list of paths to select.
-    """
-    return call_api(ctx, 'Gimp.Image.set_selected_paths', args=[paths])
-
-@mcp.tool()
-def Gimp_Image_set_simulation_bpc(ctx: Context, bpc: bool) -> str:
-    """Sets whether the image has Black Point Compensation enabled for its simulation
+    """),
+    ('Gimp.Image.set_simulation_bpc', [('bpc', bool)],
+     """Sets whether the image has Black Point Compensation enabled for its simulation
 
     :param bpc: The Black Point Compensation status.
-    """
-    return call_api(ctx, 'Gimp.Image.set_simulation_bpc', args=[bpc])
-
-@mcp.tool()
-def Gimp_Image_set_simulation_intent(ctx: Context, intent: str) -> str:
-    """Sets the image’s simulation rendering intent
+    """),
+    ('Gimp.Image.set_simulation_intent', [('intent', str)],
+     """Sets the image’s simulation rendering intent
 
     :param intent: A GimpColorRenderingIntent.
-    """
-    return call_api(ctx, 'Gimp.Image.set_simulation_intent', args=[intent])
-
-@mcp.tool()
-def Gimp_Image_set_simulation_profile(ctx: Context, profile: str = None) -> str:
-    """Sets the image’s simulation color profile
+    """),
+    ('Gimp.Image.set_simulation_profile', [('profile', str, None)],
+     """Sets the image’s simulation color profile
 
     :param profile: A GimpColorProfile, or NULL.
-    """
-    return call_api(ctx, 'Gimp.Image.set_simulation_profile', args=[profile])
-
-@mcp.tool()
-def Gimp_Image_set_simulation_profile_from_file(ctx: Context, file: str) -> str:
-    """Sets the image’s simulation color profile from an ICC file
+    """),
+    ('Gimp.Image.set_simulation_profile_from_file', [('file', str)],
+     """Sets the image’s simulation color profile from an ICC file
 
     :param file: The file containing the new simulation color profile.
-    """
-    return call_api(ctx, 'Gimp.Image.set_simulation_profile_from_file', args=[file])
-
-@mcp.tool()
-def Gimp_Image_set_tattoo_state(ctx: Context, tattoo_state: int) -> str:
-    """Set the tattoo state associated with the image.
+    """),
+    ('Gimp.Image.set_tattoo_state', [('tattoo_state', int)],
+     """Set the tattoo state associated with the image.
 
     :param tattoo_state: The new image tattoo state.
-    """
-    return call_api(ctx, 'Gimp.Image.set_tattoo_state', args=[tattoo_state])
-
-@mcp.tool()
-def Gimp_Image_set_unit(ctx: Context, unit: str) -> str:
-    """Sets the specified image’s unit.
+    """),
+    ('Gimp.Image.set_unit', [('unit', str)],
+     """Sets the specified image’s unit.
 
     :param unit: The new image unit.
-    """
-    return call_api(ctx, 'Gimp.Image.set_unit', args=[unit])
-
-@mcp.tool()
-def Gimp_Image_take_selected_channels(ctx: Context, channels: str) -> str:
-    """The channels are set as the selected channels in the image. Any previous
+    """),
+    ('Gimp.Image.take_selected_channels', [('channels', str)],
+     """The channels are set as the selected channels in the image. Any previous
 selected layers or channels are unselected. An exception is a previously
 existing floating selection, in which case this procedure will return an
 execution error.
 
     :param channels: The list of channels to select.
-    """
-    return call_api(ctx, 'Gimp.Image.take_selected_channels', args=[channels])
-
-@mcp.tool()
-def Gimp_Image_take_selected_layers(ctx: Context, layers: str) -> str:
-    """The layers are set as the selected layers in the image. Any previous
+    """),
+    ('Gimp.Image.take_selected_layers', [('layers', str)],
+     """The layers are set as the selected layers in the image. Any previous
 selected layers or channels are unselected. An exception is a previously
 existing floating selection, in which case this procedure will return an
 execution error.
 
     :param layers: The list of layers to select.
-    """
-    return call_api(ctx, 'Gimp.Image.take_selected_layers', args=[layers])
-
-@mcp.tool()
-def Gimp_Image_take_selected_paths(ctx: Context, paths: str) -> str:
-    """The paths are set as the selected paths in the image. Any previous
+    """),
+    ('Gimp.Image.take_selected_paths', [('paths', str)],
+     """The paths are set as the selected paths in the image. Any previous
 selected paths are unselected.
 
     :param paths: The list of paths to select.
-    """
-    return call_api(ctx, 'Gimp.Image.take_selected_paths', args=[paths])
-
-@mcp.tool()
-def Gimp_Image_thaw_channels(ctx: Context) -> str:
-    """Thaw the image’s channel list.
-
-    """
-    return call_api(ctx, 'Gimp.Image.thaw_channels', args=[])
-
-@mcp.tool()
-def Gimp_Image_thaw_layers(ctx: Context) -> str:
-    """Thaw the image’s layer list.
-
-    """
-    return call_api(ctx, 'Gimp.Image.thaw_layers', args=[])
-
-@mcp.tool()
-def Gimp_Image_thaw_paths(ctx: Context) -> str:
-    """Thaw the image’s path list.
-
-    """
-    return call_api(ctx, 'Gimp.Image.thaw_paths', args=[])
-
-@mcp.tool()
-def Gimp_Image_undo_disable(ctx: Context) -> str:
-    """Disable the image’s undo stack.
-
-    """
-    return call_api(ctx, 'Gimp.Image.undo_disable', args=[])
-
-@mcp.tool()
-def Gimp_Image_undo_enable(ctx: Context) -> str:
-    """Enable the image’s undo stack.
-
-    """
-    return call_api(ctx, 'Gimp.Image.undo_enable', args=[])
-
-@mcp.tool()
-def Gimp_Image_undo_freeze(ctx: Context) -> str:
-    """Freeze the image’s undo stack.
-
-    """
-    return call_api(ctx, 'Gimp.Image.undo_freeze', args=[])
+    """),
+    ('Gimp.Image.thaw_channels', [],
+     """Thaw the image’s channel list.
 
-@mcp.tool()
-def Gimp_Image_undo_group_end(ctx: Context) -> str:
-    """Finish a group undo.
+    """),
+    ('Gimp.Image.thaw_layers', [],
+     """Thaw the image’s layer list.
 
-    """
-    return call_api(ctx, 'Gimp.Image.undo_group_end', args=[])
+    """),
+    ('Gimp.Image.thaw_paths', [],
+     """Thaw the image’s path list.
 
-@mcp.tool()
-def Gimp_Image_undo_group_start(ctx: Context) -> str:
-    """Starts a group undo.
+    """),
+    ('Gimp.Image.undo_disable', [],
+     """Disable the image’s undo stack.
 
-    """
-    return call_api(ctx, 'Gimp.Image.undo_group_start', args=[])
+    """),
+    ('Gimp.Image.undo_enable', [],
+     """Enable the image’s undo stack.
 
-@mcp.tool()
-def Gimp_Image_undo_is_enabled(ctx: Context) -> str:
-    """Check if the image’s undo stack is enabled.
+    """),
+    ('Gimp.Image.undo_freeze', [],
+     """Freeze the image’s undo stack.
 
-    """
-    return call_api(ctx, 'Gimp.Image.undo_is_enabled', args=[])
+    """),
+    ('Gimp.Image.undo_group_end', [],
+     """Finish a group undo.
 
-@mcp.tool()
-def Gimp_Image_undo_thaw(ctx: Context) -> str:
-    """Thaw the image’s undo stack.
+    """),
+    ('Gimp.Image.undo_group_start', [],
+     """Starts a group undo.
 
-    """
-    return call_api(ctx, 'Gimp.Image.undo_thaw', args=[])
+    """),
+    ('Gimp.Image.undo_is_enabled', [],
+     """Check if the image’s undo stack is enabled.
 
-@mcp.tool()
-def Gimp_Image_unset_active_channel(ctx: Context) -> str:
-    """Unsets the active channel in the specified image.
+    """),
+    ('Gimp.Image.undo_thaw', [],
+     """Thaw the image’s undo stack.
 
-    """
-    return call_api(ctx, 'Gimp.Image.unset_active_channel', args=[])
+    """),
+    ('Gimp.Image.unset_active_channel', [],
+     """Unsets the active channel in the specified image.
 
-@mcp.tool()
-def Gimp_Item_attach_parasite(ctx: Context, parasite: str) -> str:
-    """Add a parasite to an item.
+    """),
+    ('Gimp.Item.attach_parasite', [('parasite', str)],
+     """Add a parasite to an item.
 
     :param parasite: The parasite to attach to the item.
-    """
-    return call_api(ctx, 'Gimp.Item.attach_parasite', args=[parasite])
-
-@mcp.tool()
-def Gimp_Item_delete(ctx: Context) -> str:
-    """Delete a item.
-
-    """
-    return call_api(ctx, 'Gimp.Item.delete', args=[])
+    """),
+    ('Gimp.Item.delete', [],
+     """Delete a item.
 
-@mcp.tool()
-def Gimp_Item_detach_parasite(ctx: Context, name: str) -> str:
-    """Removes a parasite from an item.
+    """),
+    ('Gimp.Item.detach_parasite', [('name', str)],
+     """Removes a parasite from an item.
 
     :param name: The name of the parasite to detach from the item.
-    """
-    return call_api(ctx, 'Gimp.Item.detach_parasite', args=[name])
-
-@mcp.tool()
-def Gimp_Item_get_children(ctx: Context) -> str:
-    """Returns the item’s list of children.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_children', args=[])
-
-@mcp.tool()
-def Gimp_Item_get_color_tag(ctx: Context) -> str:
-    """Get the color tag of the specified item.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_color_tag', args=[])
-
-@mcp.tool()
-def Gimp_Item_get_expanded(ctx: Context) -> str:
-    """Returns whether the item is expanded.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_expanded', args=[])
-
-@mcp.tool()
-def Gimp_Item_get_id(ctx: Context) -> str:
-    """mostly internal data and not reusable across sessions.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_id', args=[])
-
-@mcp.tool()
-def Gimp_Item_get_image(ctx: Context) -> str:
-    """Returns the item’s image.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_image', args=[])
+    """),
+    ('Gimp.Item.get_children', [],
+     """Returns the item’s list of children.
 
-@mcp.tool()
-def Gimp_Item_get_lock_content(ctx: Context) -> str:
-    """Get the ‘lock content’ state of the specified item.
+    """),
+    ('Gimp.Item.get_color_tag', [],
+     """Get the color tag of the specified item.
 
-    """
-    return call_api(ctx, 'Gimp.Item.get_lock_content', args=[])
+    """),
+    ('Gimp.Item.get_expanded', [],
+     """Returns whether the item is expanded.
 
-@mcp.tool()
-def Gimp_Item_get_lock_position(ctx: Context) -> str:
-    """Get the ‘lock position’ state of the specified item.
+    """),
+    ('Gimp.Item.get_id', [],
+     """mostly internal data and not reusable across sessions.
 
-    """
-    return call_api(ctx, 'Gimp.Item.get_lock_position', args=[])
+    """),
+    ('Gimp.Item.get_image', [],
+     """Returns the item’s image.
 
-@mcp.tool()
-def Gimp_Item_get_lock_visibility(ctx: Context) -> str:
-    """Get the ‘lock visibility’ state of the specified item.
+    """),
+    ('Gimp.Item.get_lock_content', [],
+     """Get the ‘lock content’ state of the specified item.
 
-    """
-    return call_api(ctx, 'Gimp.Item.get_lock_visibility', args=[])
+    """),
+    ('Gimp.Item.get_lock_position', [],
+     """Get the ‘lock position’ state of the specified item.
 
-@mcp.tool()
-def Gimp_Item_get_name(ctx: Context) -> str:
-    """Get the name of the specified item.
+    """),
+    ('Gimp.Item.get_lock_visibility', [],
+     """Get the ‘lock visibility’ state of the specified item.
 
-    """
-    return call_api(ctx, 'Gimp.Item.get_name', args=[])
+    """),
+    ('Gimp.Item.get_name', [],
+     """Get the name of the specified item.
 
-@mcp.tool()
-def Gimp_Item_get_parasite(ctx: Context, name: str) -> str:
-    """Look up a parasite in an item
+    """),
+    ('Gimp.Item.get_parasite', [('name', str)],
+     """Look up a parasite in an item
 
     :param name: The name of the parasite to find.
-    """
-    return call_api(ctx, 'Gimp.Item.get_parasite', args=[name])
-
-@mcp.tool()
-def Gimp_Item_get_parasite_list(ctx: Context) -> str:
-    """List all parasites.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_parasite_list', args=[])
-
-@mcp.tool()
-def Gimp_Item_get_parent(ctx: Context) -> str:
-    """Returns the item’s parent item.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_parent', args=[])
-
-@mcp.tool()
-def Gimp_Item_get_tattoo(ctx: Context) -> str:
-    """Get the tattoo of the specified item.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_tattoo', args=[])
-
-@mcp.tool()
-def Gimp_Item_get_visible(ctx: Context) -> str:
-    """Get the visibility of the specified item.
-
-    """
-    return call_api(ctx, 'Gimp.Item.get_visible', args=[])
-
-@mcp.tool()
-def Gimp_Item_is_channel(ctx: Context) -> str:
-    """Returns whether the item is a channel.
-
-    """
-    return call_api(ctx, 'Gimp.Item.is_channel', args=[])
-
-@mcp.tool()
-def Gimp_Item_is_drawable(ctx: Context) -> str:
-    """Returns whether the item is a drawable.
-
-    """
-    return call_api(ctx, 'Gimp.Item.is_drawable', args=[])
-
-@mcp.tool()
-def Gimp_Item_is_group(ctx: Context) -> str:
-    """Returns whether the item is a group item.
-
-    """
-    return call_api(ctx, 'Gimp.Item.is_group', args=[])
-
-@mcp.tool()
-def Gimp_Item_is_group_layer(ctx: Context) -> str:
-    """Returns whether the item is a group layer.
-
-    """
-    return call_api(ctx, 'Gimp.Item.is_group_layer', args=[])
+    """),
+    ('Gimp.Item.get_parasite_list', [],
+     """List all parasites.
 
-@mcp.tool()
-def Gimp_Item_is_layer(ctx: Context) -> str:
-    """Returns whether the item is a layer.
+    """),
+    ('Gimp.Item.get_parent', [],
+     """Returns the item’s parent item.
 
-    """
-    return call_api(ctx, 'Gimp.Item.is_layer', args=[])
+    """),
+    ('Gimp.Item.get_tattoo', [],
+     """Get the tattoo of the specified item.
 
-@mcp.tool()
-def Gimp_Item_is_layer_mask(ctx: Context) -> str:
-    """Returns whether the item is a layer mask.
+    """),
+    ('Gimp.Item.get_visible', [],
+     """Get the visibility of the specified item.
 
-    """
-    return call_api(ctx, 'Gimp.Item.is_layer_mask', args=[])
+    """),
+    ('Gimp.Item.is_channel', [],
+     """Returns whether the item is a channel.
 
-@mcp.tool()
-def Gimp_Item_is_path(ctx: Context) -> str:
-    """Returns whether the item is a path.
+    """),
+    ('Gimp.Item.is_drawable', [],
+     """Returns whether the item is a drawable.
 
-    """
-    return call_api(ctx, 'Gimp.Item.is_path', args=[])
+    """),
+    ('Gimp.Item.is_group', [],
+     """Returns whether the item is a group item.
 
-@mcp.tool()
-def Gimp_Item_is_selection(ctx: Context) -> str:
-    """Returns whether the item is a selection.
+    """),
+    ('Gimp.Item.is_group_layer', [],
+     """Returns whether the item is a group layer.
 
-    """
-    return call_api(ctx, 'Gimp.Item.is_selection', args=[])
+    """),
+    ('Gimp.Item.is_layer', [],
+     """Returns whether the item is a layer.
 
-@mcp.tool()
-def Gimp_Item_is_text_layer(ctx: Context) -> str:
-    """Returns whether the item is a text layer.
+    """),
+    ('Gimp.Item.is_layer_mask', [],
+     """Returns whether the item is a layer mask.
 
-    """
-    return call_api(ctx, 'Gimp.Item.is_text_layer', args=[])
+    """),
+    ('Gimp.Item.is_path', [],
+     """Returns whether the item is a path.
 
-@mcp.tool()
-def Gimp_Item_is_valid(ctx: Context) -> str:
-    """Returns TRUE if the item is valid.
+    """),
+    ('Gimp.Item.is_selection', [],
+     """Returns whether the item is a selection.
 
-    """
-    return call_api(ctx, 'Gimp.Item.is_valid', args=[])
+    """),
+    ('Gimp.Item.is_text_layer', [],
+     """Returns whether the item is a text layer.
 
-@mcp.tool()
-def Gimp_Item_list_children(ctx: Context) -> str:
-    """Returns the item’s list of children.
+    """),
+    ('Gimp.Item.is_valid', [],
+     """Returns TRUE if the item is valid.
 
-    """
-    return call_api(ctx, 'Gimp.Item.list_children', args=[])
+    """),
+    ('Gimp.Item.list_children', [],
+     """Returns the item’s list of children.
 
-@mcp.tool()
-def Gimp_Item_set_color_tag(ctx: Context, color_tag: str) -> str:
-    """Set the color tag of the specified item.
+    """),
+    ('Gimp.Item.set_color_tag', [('color_tag', str)],
+     """Set the color tag of the specified item.
 
     :param color_tag: The new item color tag.
-    """
-    return call_api(ctx, 'Gimp.Item.set_color_tag', args=[color_tag])
-
-@mcp.tool()
-def Gimp_Item_set_expanded(ctx: Context, expanded: bool) -> str:
-    """Sets the expanded state of the item.
+    """),
+    ('Gimp.Item.set_expanded', [('expanded', bool)],
+     """Sets the expanded state of the item.
 
     :param expanded: TRUE to expand the item, FALSE to collapse the item.
-    """
-    return call_api(ctx, 'Gimp.Item.set_expanded', args=[expanded])
-
-@mcp.tool()
-def Gimp_Item_set_lock_content(ctx: Context, lock_content: bool) -> str:
-    """Set the ‘lock content’ state of the specified item.
+    """),
+    ('Gimp.Item.set_lock_content', [('lock_content', bool)],
+     """Set the ‘lock content’ state of the specified item.
 
     :param lock_content: The new item ‘lock content’ state.
-    """
-    return call_api(ctx, 'Gimp.Item.set_lock_content', args=[lock_content])
-
-@mcp.tool()
-def Gimp_Item_set_lock_position(ctx: Context, lock_position: bool) -> str:
-    """Set the ‘lock position’ state of the specified item.
+    """),
+    ('Gimp.Item.set_lock_position', [('lock_position', bool)],
+     """Set the ‘lock position’ state of the specified item.
 
     :param lock_position: The new item ‘lock position’ state.
-    """
-    return call_api(ctx, 'Gimp.Item.set_lock_position', args=[lock_position])
-
-@mcp.tool()
-def Gimp_Item_set_lock_visibility(ctx: Context, lock_visibility: bool) -> str:
-    """Set the ‘lock visibility’ state of the specified item.
+    """),
+    ('Gimp.Item.set_lock_visibility', [('lock_visibility', bool)],
+     """Set the ‘lock visibility’ state of the specified item.
 
     :param lock_visibility: The new item ‘lock visibility’ state.
-    """
-    return call_api(ctx, 'Gimp.Item.set_lock_visibility', args=[lock_visibility])
-
-@mcp.tool()
-def Gimp_Item_set_name(ctx: Context, name: str) -> str:
-    """Set the name of the specified item.
+    """),
+    ('Gimp.Item.set_name', [('name', str)],
+     """Set the name of the specified item.
 
     :param name: The new item name.
-    """
-    return call_api(ctx, 'Gimp.Item.set_name', args=[name])
-
-@mcp.tool()
-def Gimp_Item_set_tattoo(ctx: Context, tattoo: int) -> str:
-    """Set the tattoo of the specified item.
+    """),
+    ('Gimp.Item.set_tattoo', [('tattoo', int)],
+     """Set the tattoo of the specified item.
 
     :param tattoo: The new item tattoo.
-    """
-    return call_api(ctx, 'Gimp.Item.set_tattoo', args=[tattoo])
-
-@mcp.tool()
-def Gimp_Item_set_visible(ctx: Context, visible: bool) -> str:
-    """Set the visibility of the specified item.
+    """),
+    ('Gimp.Item.set_visible', [('visible', bool)],
+     """Set the visibility of the specified item.
 
     :param visible: The new item visibility.
-    """
-    return call_api(ctx, 'Gimp.Item.set_visible', args=[visible])
-
-@mcp.tool()
-def Gimp_Item_transform_2d(ctx: Context, source_x: float, source_y: float, scale_x: float, scale_y: float, angle: float, dest_x: float, dest_y: float) -> str:
-    """Transform the specified item in 2d.
+    """),
+    ('Gimp.Item.transform_2d', [('source_x', float), ('source_y', float), ('scale_x', float), ('scale_y', float), ('angle', float), ('dest_x', float), ('dest_y', float)],
+     """Transform the specified item in 2d.
 
     :param source_x: X coordinate of the transformation center.
     :param source_y: Y coordinate of the transformation center.
@@ -3404,33 +2637,24 @@ def Gimp_Item_transform_2d(ctx: Context, source_x: float, source_y: float, scale
     :param angle: The angle of rotation (radians).
     :param dest_x: X coordinate of where the center goes.
     :param dest_y: Y coordinate of where the center goes.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_2d', args=[source_x, source_y, scale_x, scale_y, angle, dest_x, dest_y])
-
-@mcp.tool()
-def Gimp_Item_transform_flip(ctx: Context, x0: float, y0: float, x1: float, y1: float) -> str:
-    """Flip the specified item around a given line.
+    """),
+    ('Gimp.Item.transform_flip', [('x0', float), ('y0', float), ('x1', float), ('y1', float)],
+     """Flip the specified item around a given line.
 
     :param x0: Horz. coord. of one end of axis.
     :param y0: Vert. coord. of one end of axis.
     :param x1: Horz. coord. of other end of axis.
     :param y1: Vert. coord. of other end of axis.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_flip', args=[x0, y0, x1, y1])
-
-@mcp.tool()
-def Gimp_Item_transform_flip_simple(ctx: Context, flip_type: str, auto_center: bool, axis: float) -> str:
-    """Flip the specified item either vertically or horizontally.
+    """),
+    ('Gimp.Item.transform_flip_simple', [('flip_type', str), ('auto_center', bool), ('axis', float)],
+     """Flip the specified item either vertically or horizontally.
 
     :param flip_type: Type of flip.
     :param auto_center: Whether to automatically position the axis in the selection center.
     :param axis: Coord. of flip axis.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_flip_simple', args=[flip_type, auto_center, axis])
-
-@mcp.tool()
-def Gimp_Item_transform_matrix(ctx: Context, coeff_0_0: float, coeff_0_1: float, coeff_0_2: float, coeff_1_0: float, coeff_1_1: float, coeff_1_2: float, coeff_2_0: float, coeff_2_1: float, coeff_2_2: float) -> str:
-    """Transform the specified item in 2d.
+    """),
+    ('Gimp.Item.transform_matrix', [('coeff_0_0', float), ('coeff_0_1', float), ('coeff_0_2', float), ('coeff_1_0', float), ('coeff_1_1', float), ('coeff_1_2', float), ('coeff_2_0', float), ('coeff_2_1', float), ('coeff_2_2', float)],
+     """Transform the specified item in 2d.
 
     :param coeff_0_0: Coefficient (0,0) of the transformation matrix.
     :param coeff_0_1: Coefficient (0,1) of the transformation matrix.
@@ -3441,12 +2665,9 @@ def Gimp_Item_transform_matrix(ctx: Context, coeff_0_0: float, coeff_0_1: float,
     :param coeff_2_0: Coefficient (2,0) of the transformation matrix.
     :param coeff_2_1: Coefficient (2,1) of the transformation matrix.
     :param coeff_2_2: Coefficient (2,2) of the transformation matrix.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_matrix', args=[coeff_0_0, coeff_0_1, coeff_0_2, coeff_1_0, coeff_1_1, coeff_1_2, coeff_2_0, coeff_2_1, coeff_2_2])
-
-@mcp.tool()
-def Gimp_Item_transform_perspective(ctx: Context, x0: float, y0: float, x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> str:
-    """Perform a possibly non-affine transformation on the specified item.
+    """),
+    ('Gimp.Item.transform_perspective', [('x0', float), ('y0', float), ('x1', float), ('y1', float), ('x2', float), ('y2', float), ('x3', float), ('y3', float)],
+     """Perform a possibly non-affine transformation on the specified item.
 
     :param x0: The new x coordinate of upper-left corner of original bounding box.
     :param y0: The new y coordinate of upper-left corner of original bounding box.
@@ -3456,398 +2677,254 @@ def Gimp_Item_transform_perspective(ctx: Context, x0: float, y0: float, x1: floa
     :param y2: The new y coordinate of lower-left corner of original bounding box.
     :param x3: The new x coordinate of lower-right corner of original bounding box.
     :param y3: The new y coordinate of lower-right corner of original bounding box.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_perspective', args=[x0, y0, x1, y1, x2, y2, x3, y3])
-
-@mcp.tool()
-def Gimp_Item_transform_rotate(ctx: Context, angle: float, auto_center: bool, center_x: float, center_y: float) -> str:
-    """Rotate the specified item about given coordinates through the
-specified angle.
+    """),
+    ('Gimp.Item.transform_rotate', [('angle', float), ('auto_center', bool), ('center_x', float), ('center_y', float)],
+     """Rotate the specified item about given coordinates through the
+specified angle.
 
     :param angle: The angle of rotation (radians).
     :param auto_center: Whether to automatically rotate around the selection center.
     :param center_x: The hor. coordinate of the center of rotation.
     :param center_y: The vert. coordinate of the center of rotation.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_rotate', args=[angle, auto_center, center_x, center_y])
-
-@mcp.tool()
-def Gimp_Item_transform_rotate_simple(ctx: Context, rotate_type: str, auto_center: bool, center_x: float, center_y: float) -> str:
-    """Rotate the specified item about given coordinates through the
+    """),
+    ('Gimp.Item.transform_rotate_simple', [('rotate_type', str), ('auto_center', bool), ('center_x', float), ('center_y', float)],
+     """Rotate the specified item about given coordinates through the
 specified angle.
 
     :param rotate_type: Type of rotation.
     :param auto_center: Whether to automatically rotate around the selection center.
     :param center_x: The hor. coordinate of the center of rotation.
     :param center_y: The vert. coordinate of the center of rotation.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_rotate_simple', args=[rotate_type, auto_center, center_x, center_y])
-
-@mcp.tool()
-def Gimp_Item_transform_scale(ctx: Context, x0: float, y0: float, x1: float, y1: float) -> str:
-    """Scale the specified item.
+    """),
+    ('Gimp.Item.transform_scale', [('x0', float), ('y0', float), ('x1', float), ('y1', float)],
+     """Scale the specified item.
 
     :param x0: The new x coordinate of the upper-left corner of the scaled region.
     :param y0: The new y coordinate of the upper-left corner of the scaled region.
     :param x1: The new x coordinate of the lower-right corner of the scaled region.
     :param y1: The new y coordinate of the lower-right corner of the scaled region.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_scale', args=[x0, y0, x1, y1])
-
-@mcp.tool()
-def Gimp_Item_transform_shear(ctx: Context, shear_type: str, magnitude: float) -> str:
-    """Shear the specified item about its center by the specified magnitude.
+    """),
+    ('Gimp.Item.transform_shear', [('shear_type', str), ('magnitude', float)],
+     """Shear the specified item about its center by the specified magnitude.
 
     :param shear_type: Type of shear.
     :param magnitude: The magnitude of the shear.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_shear', args=[shear_type, magnitude])
-
-@mcp.tool()
-def Gimp_Item_transform_translate(ctx: Context, off_x: float, off_y: float) -> str:
-    """Translate the item by the specified offsets.
+    """),
+    ('Gimp.Item.transform_translate', [('off_x', float), ('off_y', float)],
+     """Translate the item by the specified offsets.
 
     :param off_x: Offset in x direction.
     :param off_y: Offset in y direction.
-    """
-    return call_api(ctx, 'Gimp.Item.transform_translate', args=[off_x, off_y])
+    """),
+    ('Gimp.Layer.add_alpha', [],
+     """Add an alpha channel to the layer if it doesn’t already have one.
 
-@mcp.tool()
-def Gimp_Layer_add_alpha(ctx: Context) -> str:
-    """Add an alpha channel to the layer if it doesn’t already have one.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.add_alpha', args=[])
-
-@mcp.tool()
-def Gimp_Layer_add_mask(ctx: Context, mask: str) -> str:
-    """Add a layer mask to the specified layer.
+    """),
+    ('Gimp.Layer.add_mask', [('mask', str)],
+     """Add a layer mask to the specified layer.
 
     :param mask: The mask to add to the layer.
-    """
-    return call_api(ctx, 'Gimp.Layer.add_mask', args=[mask])
-
-@mcp.tool()
-def Gimp_Layer_copy(ctx: Context) -> str:
-    """Copy a layer.
+    """),
+    ('Gimp.Layer.copy', [],
+     """Copy a layer.
 
-    """
-    return call_api(ctx, 'Gimp.Layer.copy', args=[])
-
-@mcp.tool()
-def Gimp_Layer_create_mask(ctx: Context, mask_type: str) -> str:
-    """Create a layer mask for the specified layer.
+    """),
+    ('Gimp.Layer.create_mask', [('mask_type', str)],
+     """Create a layer mask for the specified layer.
 
     :param mask_type: The type of mask.
-    """
-    return call_api(ctx, 'Gimp.Layer.create_mask', args=[mask_type])
-
-@mcp.tool()
-def Gimp_Layer_flatten(ctx: Context) -> str:
-    """Remove the alpha channel from the layer if it has one.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.flatten', args=[])
+    """),
+    ('Gimp.Layer.flatten', [],
+     """Remove the alpha channel from the layer if it has one.
 
-@mcp.tool()
-def Gimp_Layer_get_apply_mask(ctx: Context) -> str:
-    """Get the apply mask setting of the specified layer.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.get_apply_mask', args=[])
-
-@mcp.tool()
-def Gimp_Layer_get_blend_space(ctx: Context) -> str:
-    """Get the blend space of the specified layer.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.get_blend_space', args=[])
-
-@mcp.tool()
-def Gimp_Layer_get_composite_mode(ctx: Context) -> str:
-    """Get the composite mode of the specified layer.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.get_composite_mode', args=[])
-
-@mcp.tool()
-def Gimp_Layer_get_composite_space(ctx: Context) -> str:
-    """Get the composite space of the specified layer.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.get_composite_space', args=[])
-
-@mcp.tool()
-def Gimp_Layer_get_edit_mask(ctx: Context) -> str:
-    """Get the edit mask setting of the specified layer.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.get_edit_mask', args=[])
-
-@mcp.tool()
-def Gimp_Layer_get_lock_alpha(ctx: Context) -> str:
-    """Get the lock alpha channel setting of the specified layer.
-
-    """
-    return call_api(ctx, 'Gimp.Layer.get_lock_alpha', args=[])
+    """),
+    ('Gimp.Layer.get_apply_mask', [],
+     """Get the apply mask setting of the specified layer.
 
-@mcp.tool()
-def Gimp_Layer_get_mask(ctx: Context) -> str:
-    """Get the specified layer’s mask if it exists.
+    """),
+    ('Gimp.Layer.get_blend_space', [],
+     """Get the blend space of the specified layer.
 
-    """
-    return call_api(ctx, 'Gimp.Layer.get_mask', args=[])
+    """),
+    ('Gimp.Layer.get_composite_mode', [],
+     """Get the composite mode of the specified layer.
 
-@mcp.tool()
-def Gimp_Layer_get_mode(ctx: Context) -> str:
-    """Get the combination mode of the specified layer.
+    """),
+    ('Gimp.Layer.get_composite_space', [],
+     """Get the composite space of the specified layer.
 
-    """
-    return call_api(ctx, 'Gimp.Layer.get_mode', args=[])
+    """),
+    ('Gimp.Layer.get_edit_mask', [],
+     """Get the edit mask setting of the specified layer.
 
-@mcp.tool()
-def Gimp_Layer_get_opacity(ctx: Context) -> str:
-    """Get the opacity of the specified layer.
+    """),
+    ('Gimp.Layer.get_lock_alpha', [],
+     """Get the lock alpha channel setting of the specified layer.
 
-    """
-    return call_api(ctx, 'Gimp.Layer.get_opacity', args=[])
+    """),
+    ('Gimp.Layer.get_mask', [],
+     """Get the specified layer’s mask if it exists.
 
-@mcp.tool()
-def Gimp_Layer_get_show_mask(ctx: Context) -> str:
-    """Get the show mask setting of the specified layer.
+    """),
+    ('Gimp.Layer.get_mode', [],
+     """Get the combination mode of the specified layer.
 
-    """
-    return call_api(ctx, 'Gimp.Layer.get_show_mask', args=[])
+    """),
+    ('Gimp.Layer.get_opacity', [],
+     """Get the opacity of the specified layer.
 
-@mcp.tool()
-def Gimp_Layer_is_floating_sel(ctx: Context) -> str:
-    """Is the specified layer a floating selection?
+    """),
+    ('Gimp.Layer.get_show_mask', [],
+     """Get the show mask setting of the specified layer.
 
-    """
-    return call_api(ctx, 'Gimp.Layer.is_floating_sel', args=[])
+    """),
+    ('Gimp.Layer.is_floating_sel', [],
+     """Is the specified layer a floating selection?
 
-@mcp.tool()
-def Gimp_Layer_remove_mask(ctx: Context, mode: str) -> str:
-    """Remove the specified layer mask from the layer.
+    """),
+    ('Gimp.Layer.remove_mask', [('mode', str)],
+     """Remove the specified layer mask from the layer.
 
     :param mode: Removal mode.
-    """
-    return call_api(ctx, 'Gimp.Layer.remove_mask', args=[mode])
-
-@mcp.tool()
-def Gimp_Layer_resize(ctx: Context, new_width: int, new_height: int, offx: int, offy: int) -> str:
-    """Resize the layer to the specified extents.
+    """),
+    ('Gimp.Layer.resize', [('new_width', int), ('new_height', int), ('offx', int), ('offy', int)],
+     """Resize the layer to the specified extents.
 
     :param new_width: New layer width.
     :param new_height: New layer height.
     :param offx: X offset between upper left corner of old and new layers: (old - new).
     :param offy: Y offset between upper left corner of old and new layers: (old - new).
-    """
-    return call_api(ctx, 'Gimp.Layer.resize', args=[new_width, new_height, offx, offy])
-
-@mcp.tool()
-def Gimp_Layer_resize_to_image_size(ctx: Context) -> str:
-    """Resize a layer to the image size.
+    """),
+    ('Gimp.Layer.resize_to_image_size', [],
+     """Resize a layer to the image size.
 
-    """
-    return call_api(ctx, 'Gimp.Layer.resize_to_image_size', args=[])
-
-@mcp.tool()
-def Gimp_Layer_scale(ctx: Context, new_width: int, new_height: int, local_origin: bool) -> str:
-    """Scale the layer using the default interpolation method.
+    """),
+    ('Gimp.Layer.scale', [('new_width', int), ('new_height', int), ('local_origin', bool)],
+     """Scale the layer using the default interpolation method.
 
     :param new_width: New layer width.
     :param new_height: New layer height.
     :param local_origin: Use a local origin (as opposed to the image origin).
-    """
-    return call_api(ctx, 'Gimp.Layer.scale', args=[new_width, new_height, local_origin])
-
-@mcp.tool()
-def Gimp_Layer_set_apply_mask(ctx: Context, apply_mask: bool) -> str:
-    """Set the apply mask setting of the specified layer.
+    """),
+    ('Gimp.Layer.set_apply_mask', [('apply_mask', bool)],
+     """Set the apply mask setting of the specified layer.
 
     :param apply_mask: The new layer’s apply mask setting.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_apply_mask', args=[apply_mask])
-
-@mcp.tool()
-def Gimp_Layer_set_blend_space(ctx: Context, blend_space: str) -> str:
-    """Set the blend space of the specified layer.
+    """),
+    ('Gimp.Layer.set_blend_space', [('blend_space', str)],
+     """Set the blend space of the specified layer.
 
     :param blend_space: The new layer blend space.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_blend_space', args=[blend_space])
-
-@mcp.tool()
-def Gimp_Layer_set_composite_mode(ctx: Context, composite_mode: str) -> str:
-    """Set the composite mode of the specified layer.
+    """),
+    ('Gimp.Layer.set_composite_mode', [('composite_mode', str)],
+     """Set the composite mode of the specified layer.
 
     :param composite_mode: The new layer composite mode.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_composite_mode', args=[composite_mode])
-
-@mcp.tool()
-def Gimp_Layer_set_composite_space(ctx: Context, composite_space: str) -> str:
-    """Set the composite space of the specified layer.
+    """),
+    ('Gimp.Layer.set_composite_space', [('composite_space', str)],
+     """Set the composite space of the specified layer.
 
     :param composite_space: The new layer composite space.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_composite_space', args=[composite_space])
-
-@mcp.tool()
-def Gimp_Layer_set_edit_mask(ctx: Context, edit_mask: bool) -> str:
-    """Set the edit mask setting of the specified layer.
+    """),
+    ('Gimp.Layer.set_edit_mask', [('edit_mask', bool)],
+     """Set the edit mask setting of the specified layer.
 
     :param edit_mask: The new layer’s edit mask setting.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_edit_mask', args=[edit_mask])
-
-@mcp.tool()
-def Gimp_Layer_set_lock_alpha(ctx: Context, lock_alpha: bool) -> str:
-    """Set the lock alpha channel setting of the specified layer.
+    """),
+    ('Gimp.Layer.set_lock_alpha', [('lock_alpha', bool)],
+     """Set the lock alpha channel setting of the specified layer.
 
     :param lock_alpha: The new layer’s lock alpha channel setting.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_lock_alpha', args=[lock_alpha])
-
-@mcp.tool()
-def Gimp_Layer_set_mode(ctx: Context, mode: str) -> str:
-    """Set the combination mode of the specified layer.
+    """),
+    ('Gimp.Layer.set_mode', [('mode', str)],
+     """Set the combination mode of the specified layer.
 
     :param mode: The new layer combination mode.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_mode', args=[mode])
-
-@mcp.tool()
-def Gimp_Layer_set_offsets(ctx: Context, offx: int, offy: int) -> str:
-    """Set the layer offsets.
+    """),
+    ('Gimp.Layer.set_offsets', [('offx', int), ('offy', int)],
+     """Set the layer offsets.
 
     :param offx: Offset in x direction.
     :param offy: Offset in y direction.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_offsets', args=[offx, offy])
-
-@mcp.tool()
-def Gimp_Layer_set_opacity(ctx: Context, opacity: float) -> str:
-    """Set the opacity of the specified layer.
+    """),
+    ('Gimp.Layer.set_opacity', [('opacity', float)],
+     """Set the opacity of the specified layer.
 
     :param opacity: The new layer opacity.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_opacity', args=[opacity])
-
-@mcp.tool()
-def Gimp_Layer_set_show_mask(ctx: Context, show_mask: bool) -> str:
-    """Set the show mask setting of the specified layer.
+    """),
+    ('Gimp.Layer.set_show_mask', [('show_mask', bool)],
+     """Set the show mask setting of the specified layer.
 
     :param show_mask: The new layer’s show mask setting.
-    """
-    return call_api(ctx, 'Gimp.Layer.set_show_mask', args=[show_mask])
-
-@mcp.tool()
-def Gimp_LoadProcedure_get_handles_raw(ctx: Context) -> str:
-    """Returns the procedure’s ‘handles raw’ flag as set with
+    """),
+    ('Gimp.LoadProcedure.get_handles_raw', [],
+     """Returns the procedure’s ‘handles raw’ flag as set with
 gimp_load_procedure_set_handles_raw().
 
-    """
-    return call_api(ctx, 'Gimp.LoadProcedure.get_handles_raw', args=[])
-
-@mcp.tool()
-def Gimp_LoadProcedure_get_thumbnail_loader(ctx: Context) -> str:
-    """Returns the procedure’s thumbnail loader procedure as set with
+    """),
+    ('Gimp.LoadProcedure.get_thumbnail_loader', [],
+     """Returns the procedure’s thumbnail loader procedure as set with
 gimp_load_procedure_set_thumbnail_loader().
 
-    """
-    return call_api(ctx, 'Gimp.LoadProcedure.get_thumbnail_loader', args=[])
-
-@mcp.tool()
-def Gimp_LoadProcedure_set_handles_raw(ctx: Context, handles_raw: bool) -> str:
-    """Registers a load procedure as capable of handling raw digital camera loads.
+    """),
+    ('Gimp.LoadProcedure.set_handles_raw', [('handles_raw', bool)],
+     """Registers a load procedure as capable of handling raw digital camera loads.
 
     :param handles_raw: The procedure’s handles raw flag.
-    """
-    return call_api(ctx, 'Gimp.LoadProcedure.set_handles_raw', args=[handles_raw])
-
-@mcp.tool()
-def Gimp_LoadProcedure_set_thumbnail_loader(ctx: Context, thumbnail_proc: str) -> str:
-    """Associates a thumbnail loader with a file load procedure.
+    """),
+    ('Gimp.LoadProcedure.set_thumbnail_loader', [('thumbnail_proc', str)],
+     """Associates a thumbnail loader with a file load procedure.
 
     :param thumbnail_proc: The name of the thumbnail load procedure.
-    """
-    return call_api(ctx, 'Gimp.LoadProcedure.set_thumbnail_loader', args=[thumbnail_proc])
-
-@mcp.tool()
-def Gimp_Metadata_add_xmp_history(ctx: Context, state_status: str) -> str:
-    """Type: gchar*
+    """),
+    ('Gimp.Metadata.add_xmp_history', [('state_status', str)],
+     """Type: gchar*
 
     :param state_status: No description available.
-    """
-    return call_api(ctx, 'Gimp.Metadata.add_xmp_history', args=[state_status])
-
-@mcp.tool()
-def Gimp_Metadata_duplicate(ctx: Context) -> str:
-    """Duplicates a GimpMetadata instance.
-
-    """
-    return call_api(ctx, 'Gimp.Metadata.duplicate', args=[])
+    """),
+    ('Gimp.Metadata.duplicate', [],
+     """Duplicates a GimpMetadata instance.
 
-@mcp.tool()
-def Gimp_Metadata_get_colorspace(ctx: Context) -> str:
-    """Returns values based on Exif.Photo.ColorSpace, Xmp.exif.ColorSpace,
+    """),
+    ('Gimp.Metadata.get_colorspace', [],
+     """Returns values based on Exif.Photo.ColorSpace, Xmp.exif.ColorSpace,
 Exif.Iop.InteroperabilityIndex, Exif.Nikon3.ColorSpace,
 Exif.Canon.ColorSpace of metadata.
 
-    """
-    return call_api(ctx, 'Gimp.Metadata.get_colorspace', args=[])
-
-@mcp.tool()
-def Gimp_Metadata_get_resolution(ctx: Context, xres: float = None, yres: float = None, unit: str = None) -> str:
-    """Returns values based on Exif.Image.XResolution,
+    """),
+    ('Gimp.Metadata.get_resolution', [('xres', float, None), ('yres', float, None), ('unit', str, None)],
+     """Returns values based on Exif.Image.XResolution,
 Exif.Image.YResolution and Exif.Image.ResolutionUnit of metadata.
 
     :param xres: Return location for the X Resolution, in ppi.
     :param yres: Return location for the Y Resolution, in ppi.
     :param unit: Return location for the unit unit.
-    """
-    return call_api(ctx, 'Gimp.Metadata.get_resolution', args=[xres, yres, unit])
-
-@mcp.tool()
-def Gimp_Metadata_save_to_file(ctx: Context, file: str, error: str = None) -> str:
-    """Saves metadata to file.
+    """),
+    ('Gimp.Metadata.save_to_file', [('file', str), ('error', str, None)],
+     """Saves metadata to file.
 
     :param file: The file to save the metadata to.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.Metadata.save_to_file', args=[file, error])
-
-@mcp.tool()
-def Gimp_Metadata_serialize(ctx: Context) -> str:
-    """Serializes metadata into an XML string that can later be deserialized
+    """),
+    ('Gimp.Metadata.serialize', [],
+     """Serializes metadata into an XML string that can later be deserialized
 using gimp_metadata_deserialize().
 
-    """
-    return call_api(ctx, 'Gimp.Metadata.serialize', args=[])
-
-@mcp.tool()
-def Gimp_Metadata_set_bits_per_sample(ctx: Context, bits_per_sample: int) -> str:
-    """Sets Exif.Image.BitsPerSample on metadata.
+    """),
+    ('Gimp.Metadata.set_bits_per_sample', [('bits_per_sample', int)],
+     """Sets Exif.Image.BitsPerSample on metadata.
 
     :param bits_per_sample: Bits per pixel, per component.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_bits_per_sample', args=[bits_per_sample])
-
-@mcp.tool()
-def Gimp_Metadata_set_colorspace(ctx: Context, colorspace: str) -> str:
-    """Sets Exif.Photo.ColorSpace, Xmp.exif.ColorSpace,
+    """),
+    ('Gimp.Metadata.set_colorspace', [('colorspace', str)],
+     """Sets Exif.Photo.ColorSpace, Xmp.exif.ColorSpace,
 Exif.Iop.InteroperabilityIndex, Exif.Nikon3.ColorSpace,
 Exif.Canon.ColorSpace of metadata.
 
     :param colorspace: The color space.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_colorspace', args=[colorspace])
-
-@mcp.tool()
-def Gimp_Metadata_set_creation_date(ctx: Context, datetime: str) -> str:
-    """Sets Iptc.Application2.DateCreated, Iptc.Application2.TimeCreated,
+    """),
+    ('Gimp.Metadata.set_creation_date', [('datetime', str)],
+     """Sets Iptc.Application2.DateCreated, Iptc.Application2.TimeCreated,
 Exif.Image.DateTime, Exif.Image.DateTimeOriginal,
 Exif.Photo.DateTimeOriginal, Exif.Photo.DateTimeDigitized,
 Exif.Photo.OffsetTime, Exif.Photo.OffsetTimeOriginal,
@@ -3855,221 +2932,143 @@ Exif.Photo.OffsetTimeDigitized, Xmp.xmp.CreateDate, Xmp.xmp.ModifyDate,
 Xmp.xmp.MetadataDate, Xmp.photoshop.DateCreated of metadata.
 
     :param datetime: A GDateTime value.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_creation_date', args=[datetime])
-
-@mcp.tool()
-def Gimp_Metadata_set_from_exif(ctx: Context, exif_data: str, exif_data_length: int, error: str = None) -> str:
-    """Sets the tags from a piece of Exif data on metadata.
+    """),
+    ('Gimp.Metadata.set_from_exif', [('exif_data', str), ('exif_data_length', int), ('error', str, None)],
+     """Sets the tags from a piece of Exif data on metadata.
 
     :param exif_data: The blob of Exif data to set.
     :param exif_data_length: Length of exif_data, in bytes.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_from_exif', args=[exif_data, exif_data_length, error])
-
-@mcp.tool()
-def Gimp_Metadata_set_from_iptc(ctx: Context, iptc_data: str, iptc_data_length: int, error: str = None) -> str:
-    """Sets the tags from a piece of IPTC data on metadata.
+    """),
+    ('Gimp.Metadata.set_from_iptc', [('iptc_data', str), ('iptc_data_length', int), ('error', str, None)],
+     """Sets the tags from a piece of IPTC data on metadata.
 
     :param iptc_data: The blob of Iptc data to set.
     :param iptc_data_length: Length of iptc_data, in bytes.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_from_iptc', args=[iptc_data, iptc_data_length, error])
-
-@mcp.tool()
-def Gimp_Metadata_set_from_xmp(ctx: Context, xmp_data: str, xmp_data_length: int, error: str = None) -> str:
-    """Sets the tags from a piece of XMP data on metadata.
+    """),
+    ('Gimp.Metadata.set_from_xmp', [('xmp_data', str), ('xmp_data_length', int), ('error', str, None)],
+     """Sets the tags from a piece of XMP data on metadata.
 
     :param xmp_data: The blob of XMP data to set.
     :param xmp_data_length: Length of xmp_data, in bytes.
     :param error: No description available.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_from_xmp', args=[xmp_data, xmp_data_length, error])
-
-@mcp.tool()
-def Gimp_Metadata_set_pixel_size(ctx: Context, width: int, height: int) -> str:
-    """Sets Exif.Image.ImageWidth and Exif.Image.ImageLength on metadata.
+    """),
+    ('Gimp.Metadata.set_pixel_size', [('width', int), ('height', int)],
+     """Sets Exif.Image.ImageWidth and Exif.Image.ImageLength on metadata.
 If already present, also sets Exif.Photo.PixelXDimension and Exif.Photo.PixelYDimension.
 
     :param width: Width in pixels.
     :param height: Height in pixels.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_pixel_size', args=[width, height])
-
-@mcp.tool()
-def Gimp_Metadata_set_resolution(ctx: Context, xres: float, yres: float, unit: str) -> str:
-    """Sets Exif.Image.XResolution, Exif.Image.YResolution and
+    """),
+    ('Gimp.Metadata.set_resolution', [('xres', float), ('yres', float), ('unit', str)],
+     """Sets Exif.Image.XResolution, Exif.Image.YResolution and
 Exif.Image.ResolutionUnit of metadata.
 
     :param xres: The image’s X Resolution, in ppi.
     :param yres: The image’s Y Resolution, in ppi.
     :param unit: The image’s unit.
-    """
-    return call_api(ctx, 'Gimp.Metadata.set_resolution', args=[xres, yres, unit])
+    """),
+    ('Gimp.Module.get_auto_load', [],
+     """Returns whether this module in automatically loaded at startup.
 
-@mcp.tool()
-def Gimp_Module_get_auto_load(ctx: Context) -> str:
-    """Returns whether this module in automatically loaded at startup.
-
-    """
-    return call_api(ctx, 'Gimp.Module.get_auto_load', args=[])
-
-@mcp.tool()
-def Gimp_Module_get_file(ctx: Context) -> str:
-    """Returns GFile of the module,
-
-    """
-    return call_api(ctx, 'Gimp.Module.get_file', args=[])
-
-@mcp.tool()
-def Gimp_Module_get_info(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Module.get_info', args=[])
-
-@mcp.tool()
-def Gimp_Module_get_last_error(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Module.get_last_error', args=[])
-
-@mcp.tool()
-def Gimp_Module_get_state(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Module.get_file', [],
+     """Returns GFile of the module,
 
-    """
-    return call_api(ctx, 'Gimp.Module.get_state', args=[])
+    """),
+    ('Gimp.Module.get_info', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Module_is_loaded(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Module.get_last_error', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Module.is_loaded', args=[])
+    """),
+    ('Gimp.Module.get_state', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Module_is_on_disk(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Module.is_loaded', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Module.is_on_disk', args=[])
+    """),
+    ('Gimp.Module.is_on_disk', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Module_query_module(ctx: Context) -> str:
-    """Queries the module without actually registering any of the types it
+    """),
+    ('Gimp.Module.query_module', [],
+     """Queries the module without actually registering any of the types it
 may implement. After successful query, gimp_module_get_info() can be
 used to get further about the module.
 
-    """
-    return call_api(ctx, 'Gimp.Module.query_module', args=[])
-
-@mcp.tool()
-def Gimp_Module_set_auto_load(ctx: Context, auto_load: bool) -> str:
-    """Sets the auto_load property of the module.
+    """),
+    ('Gimp.Module.set_auto_load', [('auto_load', bool)],
+     """Sets the auto_load property of the module.
 
     :param auto_load: Pass FALSE to exclude this module from auto-loading.
-    """
-    return call_api(ctx, 'Gimp.Module.set_auto_load', args=[auto_load])
-
-@mcp.tool()
-def Gimp_ModuleDB_get_load_inhibit(ctx: Context) -> str:
-    """Return the #G_SEARCHPATH_SEPARATOR delimited list of module filenames
+    """),
+    ('Gimp.ModuleDB.get_load_inhibit', [],
+     """Return the #G_SEARCHPATH_SEPARATOR delimited list of module filenames
 which are excluded from auto-loading.
 
-    """
-    return call_api(ctx, 'Gimp.ModuleDB.get_load_inhibit', args=[])
-
-@mcp.tool()
-def Gimp_ModuleDB_get_verbose(ctx: Context) -> str:
-    """Returns the ‘verbose’ setting of db.
-
-    """
-    return call_api(ctx, 'Gimp.ModuleDB.get_verbose', args=[])
+    """),
+    ('Gimp.ModuleDB.get_verbose', [],
+     """Returns the ‘verbose’ setting of db.
 
-@mcp.tool()
-def Gimp_ModuleDB_load(ctx: Context, module_path: str) -> str:
-    """Scans the directories contained in module_path and creates a
+    """),
+    ('Gimp.ModuleDB.load', [('module_path', str)],
+     """Scans the directories contained in module_path and creates a
 GimpModule instance for every loadable module contained in the directories.
 
     :param module_path: A #G_SEARCHPATH_SEPARATOR delimited list of directories
               to load modules from.
-    """
-    return call_api(ctx, 'Gimp.ModuleDB.load', args=[module_path])
-
-@mcp.tool()
-def Gimp_ModuleDB_refresh(ctx: Context, module_path: str) -> str:
-    """Does the same as gimp_module_db_load(), plus removes all GimpModule
+    """),
+    ('Gimp.ModuleDB.refresh', [('module_path', str)],
+     """Does the same as gimp_module_db_load(), plus removes all GimpModule
 instances whose modules have been deleted from disk.
 
     :param module_path: A #G_SEARCHPATH_SEPARATOR delimited list of directories
               to load modules from.
-    """
-    return call_api(ctx, 'Gimp.ModuleDB.refresh', args=[module_path])
-
-@mcp.tool()
-def Gimp_ModuleDB_set_load_inhibit(ctx: Context, load_inhibit: str) -> str:
-    """Sets the load_inhibit flag for all GimpModule‘s which are kept
+    """),
+    ('Gimp.ModuleDB.set_load_inhibit', [('load_inhibit', str)],
+     """Sets the load_inhibit flag for all GimpModule‘s which are kept
 by db (using gimp_module_set_load_inhibit()).
 
     :param load_inhibit: A #G_SEARCHPATH_SEPARATOR delimited list of module
                filenames to exclude from auto-loading.
-    """
-    return call_api(ctx, 'Gimp.ModuleDB.set_load_inhibit', args=[load_inhibit])
-
-@mcp.tool()
-def Gimp_ModuleDB_set_verbose(ctx: Context, verbose: bool) -> str:
-    """Sets the ‘verbose’ setting of db.
+    """),
+    ('Gimp.ModuleDB.set_verbose', [('verbose', bool)],
+     """Sets the ‘verbose’ setting of db.
 
     :param verbose: The new ‘verbose’ setting.
-    """
-    return call_api(ctx, 'Gimp.ModuleDB.set_verbose', args=[verbose])
-
-@mcp.tool()
-def Gimp_PDB_dump_to_file(ctx: Context, file: str) -> str:
-    """Dumps the current contents of the procedural database
+    """),
+    ('Gimp.PDB.dump_to_file', [('file', str)],
+     """Dumps the current contents of the procedural database
 
     :param file: The dump file.
-    """
-    return call_api(ctx, 'Gimp.PDB.dump_to_file', args=[file])
+    """),
+    ('Gimp.PDB.get_last_error', [],
+     """Retrieves the error message from the last procedure call.
 
-@mcp.tool()
-def Gimp_PDB_get_last_error(ctx: Context) -> str:
-    """Retrieves the error message from the last procedure call.
-
-    """
-    return call_api(ctx, 'Gimp.PDB.get_last_error', args=[])
-
-@mcp.tool()
-def Gimp_PDB_get_last_status(ctx: Context) -> str:
-    """Retrieves the status from the last procedure call.
-
-    """
-    return call_api(ctx, 'Gimp.PDB.get_last_status', args=[])
+    """),
+    ('Gimp.PDB.get_last_status', [],
+     """Retrieves the status from the last procedure call.
 
-@mcp.tool()
-def Gimp_PDB_lookup_procedure(ctx: Context, procedure_name: str) -> str:
-    """This function returns the GimpProcedure which is registered
+    """),
+    ('Gimp.PDB.lookup_procedure', [('procedure_name', str)],
+     """This function returns the GimpProcedure which is registered
 with procedure_name if it exists, or returns NULL otherwise.
 
     :param procedure_name: A procedure name.
-    """
-    return call_api(ctx, 'Gimp.PDB.lookup_procedure', args=[procedure_name])
-
-@mcp.tool()
-def Gimp_PDB_procedure_exists(ctx: Context, procedure_name: str) -> str:
-    """This function checks if a procedure exists in the procedural database.
+    """),
+    ('Gimp.PDB.procedure_exists', [('procedure_name', str)],
+     """This function checks if a procedure exists in the procedural database.
 
     :param procedure_name: A procedure name.
-    """
-    return call_api(ctx, 'Gimp.PDB.procedure_exists', args=[procedure_name])
-
-@mcp.tool()
-def Gimp_PDB_query_procedures(ctx: Context, name: str, blurb: str, help: str, help_id: str, authors: str, copyright: str, date: str, proc_type: str) -> str:
-    """Queries the procedural database for its contents using regular
+    """),
+    ('Gimp.PDB.query_procedures', [('name', str), ('blurb', str), ('help', str), ('help_id', str), ('authors', str), ('copyright', str), ('date', str), ('proc_type', str)],
+     """Queries the procedural database for its contents using regular
 expression matching.
 
     :param name: The regex for procedure name.
@@ -4080,136 +3079,91 @@ expression matching.
     :param copyright: The regex for procedure copyright.
     :param date: The regex for procedure date.
     :param proc_type: The regex for procedure type: { ‘Internal GIMP procedure’, ‘GIMP Plug-in’, ‘GIMP Extension’, ‘Temporary Procedure’ }.
-    """
-    return call_api(ctx, 'Gimp.PDB.query_procedures', args=[name, blurb, help, help_id, authors, copyright, date, proc_type])
-
-@mcp.tool()
-def Gimp_PDB_temp_procedure_name(ctx: Context) -> str:
-    """Generates a unique temporary PDB name.
-
-    """
-    return call_api(ctx, 'Gimp.PDB.temp_procedure_name', args=[])
+    """),
+    ('Gimp.PDB.temp_procedure_name', [],
+     """Generates a unique temporary PDB name.
 
-@mcp.tool()
-def Gimp_Palette_add_entry(ctx: Context, entry_name: str = None, color: str = None, entry_num: int = 0) -> str:
-    """Appends an entry to the palette.
+    """),
+    ('Gimp.Palette.add_entry', [('entry_name', str, None), ('color', str, None), ('entry_num', int, 0)],
+     """Appends an entry to the palette.
 
     :param entry_name: A name for the entry.
     :param color: The color for the added entry.
     :param entry_num: The index of the added entry.
-    """
-    return call_api(ctx, 'Gimp.Palette.add_entry', args=[entry_name, color, entry_num])
-
-@mcp.tool()
-def Gimp_Palette_delete_entry(ctx: Context, entry_num: int) -> str:
-    """Deletes an entry from the palette.
+    """),
+    ('Gimp.Palette.delete_entry', [('entry_num', int)],
+     """Deletes an entry from the palette.
 
     :param entry_num: The index of the entry to delete.
-    """
-    return call_api(ctx, 'Gimp.Palette.delete_entry', args=[entry_num])
+    """),
+    ('Gimp.Palette.get_color_count', [],
+     """Get the count of colors in the palette.
 
-@mcp.tool()
-def Gimp_Palette_get_color_count(ctx: Context) -> str:
-    """Get the count of colors in the palette.
-
-    """
-    return call_api(ctx, 'Gimp.Palette.get_color_count', args=[])
-
-@mcp.tool()
-def Gimp_Palette_get_colormap(ctx: Context, format: str, num_colors: int = None, num_bytes: int = None) -> str:
-    """This procedure returns a palette’s colormap as an array of bytes with
+    """),
+    ('Gimp.Palette.get_colormap', [('format', str), ('num_colors', int, None), ('num_bytes', int, None)],
+     """This procedure returns a palette’s colormap as an array of bytes with
 all colors converted to a given Babl format.
 
     :param format: The desired color format.
     :param num_colors: The number of colors in the palette.
     :param num_bytes: The byte-size of the returned value.
-    """
-    return call_api(ctx, 'Gimp.Palette.get_colormap', args=[format, num_colors, num_bytes])
-
-@mcp.tool()
-def Gimp_Palette_get_colors(ctx: Context) -> str:
-    """Gets colors in the palette.
+    """),
+    ('Gimp.Palette.get_colors', [],
+     """Gets colors in the palette.
 
-    """
-    return call_api(ctx, 'Gimp.Palette.get_colors', args=[])
-
-@mcp.tool()
-def Gimp_Palette_get_columns(ctx: Context) -> str:
-    """Gets the number of columns used to display the palette
-
-    """
-    return call_api(ctx, 'Gimp.Palette.get_columns', args=[])
+    """),
+    ('Gimp.Palette.get_columns', [],
+     """Gets the number of columns used to display the palette
 
-@mcp.tool()
-def Gimp_Palette_get_entry_color(ctx: Context, entry_num: int) -> str:
-    """Gets the color of an entry in the palette.
+    """),
+    ('Gimp.Palette.get_entry_color', [('entry_num', int)],
+     """Gets the color of an entry in the palette.
 
     :param entry_num: The index of the entry to get the color of.
-    """
-    return call_api(ctx, 'Gimp.Palette.get_entry_color', args=[entry_num])
-
-@mcp.tool()
-def Gimp_Palette_get_entry_name(ctx: Context, entry_num: int, entry_name: str) -> str:
-    """Gets the name of an entry in the palette.
+    """),
+    ('Gimp.Palette.get_entry_name', [('entry_num', int), ('entry_name', str)],
+     """Gets the name of an entry in the palette.
 
     :param entry_num: The entry to get.
     :param entry_name: The name of the entry.
-    """
-    return call_api(ctx, 'Gimp.Palette.get_entry_name', args=[entry_num, entry_name])
-
-@mcp.tool()
-def Gimp_Palette_set_colormap(ctx: Context, format: str, colormap: int, num_bytes: int) -> str:
-    """This procedure sets the entries in the specified palette in one go,
+    """),
+    ('Gimp.Palette.set_colormap', [('format', str), ('colormap', int), ('num_bytes', int)],
+     """This procedure sets the entries in the specified palette in one go,
 though they must all be in the same format.
 
     :param format: The desired color format.
 colormap (array length=num_bytes): The new colormap values.
     :param colormap: No description available.
     :param num_bytes: The byte-size of colormap.
-    """
-    return call_api(ctx, 'Gimp.Palette.set_colormap', args=[format, colormap, num_bytes])
-
-@mcp.tool()
-def Gimp_Palette_set_columns(ctx: Context, columns: int) -> str:
-    """Sets the number of columns used to display the palette
+    """),
+    ('Gimp.Palette.set_columns', [('columns', int)],
+     """Sets the number of columns used to display the palette
 
     :param columns: The new number of columns.
-    """
-    return call_api(ctx, 'Gimp.Palette.set_columns', args=[columns])
-
-@mcp.tool()
-def Gimp_Palette_set_entry_color(ctx: Context, entry_num: int, color: str) -> str:
-    """Sets the color of an entry in the palette.
+    """),
+    ('Gimp.Palette.set_entry_color', [('entry_num', int), ('color', str)],
+     """Sets the color of an entry in the palette.
 
     :param entry_num: The entry to get.
     :param color: The new color.
-    """
-    return call_api(ctx, 'Gimp.Palette.set_entry_color', args=[entry_num, color])
-
-@mcp.tool()
-def Gimp_Palette_set_entry_name(ctx: Context, entry_num: int, entry_name: str = None) -> str:
-    """Sets the name of an entry in the palette.
+    """),
+    ('Gimp.Palette.set_entry_name', [('entry_num', int), ('entry_name', str, None)],
+     """Sets the name of an entry in the palette.
 
     :param entry_num: The entry to get.
     :param entry_name: The new name.
-    """
-    return call_api(ctx, 'Gimp.Palette.set_entry_name', args=[entry_num, entry_name])
-
-@mcp.tool()
-def Gimp_Path_bezier_stroke_conicto(ctx: Context, stroke_id: int, x0: float, y0: float, x1: float, y1: float) -> str:
-    """Extends a bezier stroke with a conic bezier spline.
+    """),
+    ('Gimp.Path.bezier_stroke_conicto', [('stroke_id', int), ('x0', float), ('y0', float), ('x1', float), ('y1', float)],
+     """Extends a bezier stroke with a conic bezier spline.
 
     :param stroke_id: The stroke ID.
     :param x0: The x-coordinate of the control point.
     :param y0: The y-coordinate of the control point.
     :param x1: The x-coordinate of the end point.
     :param y1: The y-coordinate of the end point.
-    """
-    return call_api(ctx, 'Gimp.Path.bezier_stroke_conicto', args=[stroke_id, x0, y0, x1, y1])
-
-@mcp.tool()
-def Gimp_Path_bezier_stroke_cubicto(ctx: Context, stroke_id: int, x0: float, y0: float, x1: float, y1: float, x2: float, y2: float) -> str:
-    """Extends a bezier stroke with a cubic bezier spline.
+    """),
+    ('Gimp.Path.bezier_stroke_cubicto', [('stroke_id', int), ('x0', float), ('y0', float), ('x1', float), ('y1', float), ('x2', float), ('y2', float)],
+     """Extends a bezier stroke with a cubic bezier spline.
 
     :param stroke_id: The stroke ID.
     :param x0: The x-coordinate of the first control point.
@@ -4218,105 +3172,72 @@ def Gimp_Path_bezier_stroke_cubicto(ctx: Context, stroke_id: int, x0: float, y0:
     :param y1: The y-coordinate of the second control point.
     :param x2: The x-coordinate of the end point.
     :param y2: The y-coordinate of the end point.
-    """
-    return call_api(ctx, 'Gimp.Path.bezier_stroke_cubicto', args=[stroke_id, x0, y0, x1, y1, x2, y2])
-
-@mcp.tool()
-def Gimp_Path_bezier_stroke_lineto(ctx: Context, stroke_id: int, x0: float, y0: float) -> str:
-    """Extends a bezier stroke with a lineto.
+    """),
+    ('Gimp.Path.bezier_stroke_lineto', [('stroke_id', int), ('x0', float), ('y0', float)],
+     """Extends a bezier stroke with a lineto.
 
     :param stroke_id: The stroke ID.
     :param x0: The x-coordinate of the lineto.
     :param y0: The y-coordinate of the lineto.
-    """
-    return call_api(ctx, 'Gimp.Path.bezier_stroke_lineto', args=[stroke_id, x0, y0])
-
-@mcp.tool()
-def Gimp_Path_bezier_stroke_new_ellipse(ctx: Context, x0: float, y0: float, radius_x: float, radius_y: float, angle: float) -> str:
-    """Adds a bezier stroke describing an ellipse the path object.
+    """),
+    ('Gimp.Path.bezier_stroke_new_ellipse', [('x0', float), ('y0', float), ('radius_x', float), ('radius_y', float), ('angle', float)],
+     """Adds a bezier stroke describing an ellipse the path object.
 
     :param x0: The x-coordinate of the center.
     :param y0: The y-coordinate of the center.
     :param radius_x: The radius in x direction.
     :param radius_y: The radius in y direction.
     :param angle: The angle the x-axis of the ellipse (radians, counterclockwise).
-    """
-    return call_api(ctx, 'Gimp.Path.bezier_stroke_new_ellipse', args=[x0, y0, radius_x, radius_y, angle])
-
-@mcp.tool()
-def Gimp_Path_bezier_stroke_new_moveto(ctx: Context, x0: float, y0: float) -> str:
-    """Adds a bezier stroke with a single moveto to the path object.
+    """),
+    ('Gimp.Path.bezier_stroke_new_moveto', [('x0', float), ('y0', float)],
+     """Adds a bezier stroke with a single moveto to the path object.
 
     :param x0: The x-coordinate of the moveto.
     :param y0: The y-coordinate of the moveto.
-    """
-    return call_api(ctx, 'Gimp.Path.bezier_stroke_new_moveto', args=[x0, y0])
-
-@mcp.tool()
-def Gimp_Path_copy(ctx: Context) -> str:
-    """Copy a path object.
-
-    """
-    return call_api(ctx, 'Gimp.Path.copy', args=[])
+    """),
+    ('Gimp.Path.copy', [],
+     """Copy a path object.
 
-@mcp.tool()
-def Gimp_Path_get_strokes(ctx: Context, num_strokes: int) -> str:
-    """List the strokes associated with the passed path.
+    """),
+    ('Gimp.Path.get_strokes', [('num_strokes', int)],
+     """List the strokes associated with the passed path.
 
     :param num_strokes: The number of strokes returned.
-    """
-    return call_api(ctx, 'Gimp.Path.get_strokes', args=[num_strokes])
-
-@mcp.tool()
-def Gimp_Path_remove_stroke(ctx: Context, stroke_id: int) -> str:
-    """Remove the stroke from a path object.
+    """),
+    ('Gimp.Path.remove_stroke', [('stroke_id', int)],
+     """Remove the stroke from a path object.
 
     :param stroke_id: The stroke ID.
-    """
-    return call_api(ctx, 'Gimp.Path.remove_stroke', args=[stroke_id])
-
-@mcp.tool()
-def Gimp_Path_stroke_close(ctx: Context, stroke_id: int) -> str:
-    """Closes the specified stroke.
+    """),
+    ('Gimp.Path.stroke_close', [('stroke_id', int)],
+     """Closes the specified stroke.
 
     :param stroke_id: The stroke ID.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_close', args=[stroke_id])
-
-@mcp.tool()
-def Gimp_Path_stroke_flip(ctx: Context, stroke_id: int, flip_type: str, axis: float) -> str:
-    """Flips the given stroke.
+    """),
+    ('Gimp.Path.stroke_flip', [('stroke_id', int), ('flip_type', str), ('axis', float)],
+     """Flips the given stroke.
 
     :param stroke_id: The stroke ID.
     :param flip_type: Flip orientation, either vertical or horizontal.
     :param axis: Axis coordinate about which to flip, in pixels.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_flip', args=[stroke_id, flip_type, axis])
-
-@mcp.tool()
-def Gimp_Path_stroke_flip_free(ctx: Context, stroke_id: int, x1: float, y1: float, x2: float, y2: float) -> str:
-    """Flips the given stroke about an arbitrary axis.
+    """),
+    ('Gimp.Path.stroke_flip_free', [('stroke_id', int), ('x1', float), ('y1', float), ('x2', float), ('y2', float)],
+     """Flips the given stroke about an arbitrary axis.
 
     :param stroke_id: The stroke ID.
     :param x1: X coordinate of the first point of the flipping axis.
     :param y1: Y coordinate of the first point of the flipping axis.
     :param x2: X coordinate of the second point of the flipping axis.
     :param y2: Y coordinate of the second point of the flipping axis.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_flip_free', args=[stroke_id, x1, y1, x2, y2])
-
-@mcp.tool()
-def Gimp_Path_stroke_get_length(ctx: Context, stroke_id: int, precision: float) -> str:
-    """Measure the length of the given stroke.
+    """),
+    ('Gimp.Path.stroke_get_length', [('stroke_id', int), ('precision', float)],
+     """Measure the length of the given stroke.
 
     :param stroke_id: The stroke ID.
     :param precision: The precision used for approximating straight portions of the stroke.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_get_length', args=[stroke_id, precision])
-
-@mcp.tool()
-def Gimp_Path_stroke_get_point_at_dist(ctx: Context, stroke_id: int, dist: float, precision: float, x_point: float, y_point: float, slope: float, valid: bool) -> str:
-    """Get point at a specified distance along the stroke.
+    """),
+    ('Gimp.Path.stroke_get_point_at_dist', [('stroke_id', int), ('dist', float), ('precision', float), ('x_point', float), ('y_point', float), ('slope', float), ('valid', bool)],
+     """Get point at a specified distance along the stroke.
 
     :param stroke_id: The stroke ID.
     :param dist: The given distance.
@@ -4325,84 +3246,60 @@ def Gimp_Path_stroke_get_point_at_dist(ctx: Context, stroke_id: int, dist: float
     :param y_point: The y position of the point.
     :param slope: The slope (dy / dx) at the specified point.
     :param valid: Indicator for the validity of the returned data.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_get_point_at_dist', args=[stroke_id, dist, precision, x_point, y_point, slope, valid])
-
-@mcp.tool()
-def Gimp_Path_stroke_get_points(ctx: Context, stroke_id: int, num_points: int, controlpoints: str, closed: bool) -> str:
-    """Returns the control points of a stroke.
+    """),
+    ('Gimp.Path.stroke_get_points', [('stroke_id', int), ('num_points', int), ('controlpoints', str), ('closed', bool)],
+     """Returns the control points of a stroke.
 
     :param stroke_id: The stroke ID.
     :param num_points: The number of floats returned.
     :param controlpoints: List of the control points for the stroke (x0, y0, x1, y1, …).
     :param closed: Whether the stroke is closed or not.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_get_points', args=[stroke_id, num_points, controlpoints, closed])
-
-@mcp.tool()
-def Gimp_Path_stroke_interpolate(ctx: Context, stroke_id: int, precision: float, num_coords: int, closed: bool) -> str:
-    """Returns polygonal approximation of the stroke.
+    """),
+    ('Gimp.Path.stroke_interpolate', [('stroke_id', int), ('precision', float), ('num_coords', int), ('closed', bool)],
+     """Returns polygonal approximation of the stroke.
 
     :param stroke_id: The stroke ID.
     :param precision: The precision used for the approximation.
     :param num_coords: The number of floats returned.
     :param closed: Whether the stroke is closed or not.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_interpolate', args=[stroke_id, precision, num_coords, closed])
-
-@mcp.tool()
-def Gimp_Path_stroke_new_from_points(ctx: Context, type: str, num_points: int, controlpoints: str, closed: bool) -> str:
-    """Adds a stroke of a given type to the path object.
+    """),
+    ('Gimp.Path.stroke_new_from_points', [('type', str), ('num_points', int), ('controlpoints', str), ('closed', bool)],
+     """Adds a stroke of a given type to the path object.
 
     :param type: Type of the stroke (always GIMP_PATH_STROKE_TYPE_BEZIER for now).
     :param num_points: The number of elements in the array, i.e. the number of controlpoints in the stroke * 2 (x- and y-coordinate).
     :param controlpoints: List of the x- and y-coordinates of the control points.
     :param closed: Whether the stroke is to be closed or not.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_new_from_points', args=[type, num_points, controlpoints, closed])
-
-@mcp.tool()
-def Gimp_Path_stroke_reverse(ctx: Context, stroke_id: int) -> str:
-    """Reverses the specified stroke.
+    """),
+    ('Gimp.Path.stroke_reverse', [('stroke_id', int)],
+     """Reverses the specified stroke.
 
     :param stroke_id: The stroke ID.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_reverse', args=[stroke_id])
-
-@mcp.tool()
-def Gimp_Path_stroke_rotate(ctx: Context, stroke_id: int, center_x: float, center_y: float, angle: float) -> str:
-    """Rotates the given stroke.
+    """),
+    ('Gimp.Path.stroke_rotate', [('stroke_id', int), ('center_x', float), ('center_y', float), ('angle', float)],
+     """Rotates the given stroke.
 
     :param stroke_id: The stroke ID.
     :param center_x: X coordinate of the rotation center.
     :param center_y: Y coordinate of the rotation center.
     :param angle: Angle to rotate about.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_rotate', args=[stroke_id, center_x, center_y, angle])
-
-@mcp.tool()
-def Gimp_Path_stroke_scale(ctx: Context, stroke_id: int, scale_x: float, scale_y: float) -> str:
-    """Scales the given stroke.
+    """),
+    ('Gimp.Path.stroke_scale', [('stroke_id', int), ('scale_x', float), ('scale_y', float)],
+     """Scales the given stroke.
 
     :param stroke_id: The stroke ID.
     :param scale_x: Scale factor in x direction.
     :param scale_y: Scale factor in y direction.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_scale', args=[stroke_id, scale_x, scale_y])
-
-@mcp.tool()
-def Gimp_Path_stroke_translate(ctx: Context, stroke_id: int, off_x: float, off_y: float) -> str:
-    """Translate the given stroke.
+    """),
+    ('Gimp.Path.stroke_translate', [('stroke_id', int), ('off_x', float), ('off_y', float)],
+     """Translate the given stroke.
 
     :param stroke_id: The stroke ID.
     :param off_x: Offset in x direction.
     :param off_y: Offset in y direction.
-    """
-    return call_api(ctx, 'Gimp.Path.stroke_translate', args=[stroke_id, off_x, off_y])
-
-@mcp.tool()
-def Gimp_Pattern_get_buffer(ctx: Context, max_width: int, max_height: int, format: str) -> str:
-    """Gets pixel data of the pattern within the bounding box specified by max_width
+    """),
+    ('Gimp.Pattern.get_buffer', [('max_width', int), ('max_height', int), ('format', str)],
+     """Gets pixel data of the pattern within the bounding box specified by max_width
 and max_height. The data will be scaled down so that it fits within this
 size without changing its ratio. If the pattern is smaller than this size to
 begin with, it will not be scaled up.
@@ -4410,142 +3307,97 @@ begin with, it will not be scaled up.
     :param max_width: A maximum width for the returned buffer.
     :param max_height: A maximum height for the returned buffer.
     :param format: An optional Babl format.
-    """
-    return call_api(ctx, 'Gimp.Pattern.get_buffer', args=[max_width, max_height, format])
-
-@mcp.tool()
-def Gimp_Pattern_get_info(ctx: Context, width: int, height: int, bpp: int) -> str:
-    """Gets information about the pattern.
+    """),
+    ('Gimp.Pattern.get_info', [('width', int), ('height', int), ('bpp', int)],
+     """Gets information about the pattern.
 
     :param width: The pattern width.
     :param height: The pattern height.
     :param bpp: The pattern bpp.
-    """
-    return call_api(ctx, 'Gimp.Pattern.get_info', args=[width, height, bpp])
-
-@mcp.tool()
-def Gimp_PlugIn_add_menu_branch(ctx: Context, menu_path: str, menu_label: str) -> str:
-    """Add a new sub-menu to the GIMP menus.
+    """),
+    ('Gimp.PlugIn.add_menu_branch', [('menu_path', str), ('menu_label', str)],
+     """Add a new sub-menu to the GIMP menus.
 
     :param menu_path: The sub-menu’s menu path.
     :param menu_label: The menu label of the sub-menu.
-    """
-    return call_api(ctx, 'Gimp.PlugIn.add_menu_branch', args=[menu_path, menu_label])
-
-@mcp.tool()
-def Gimp_PlugIn_add_temp_procedure(ctx: Context, procedure: str) -> str:
-    """This function adds a temporary procedure to plug_in. It is usually
+    """),
+    ('Gimp.PlugIn.add_temp_procedure', [('procedure', str)],
+     """This function adds a temporary procedure to plug_in. It is usually
 called from a GIMP_PDB_PROC_TYPE_PERSISTENT procedure’s
 Gimp.ProcedureClass.run.
 
     :param procedure: A GimpProcedure of type GIMP_PDB_PROC_TYPE_TEMPORARY.
-    """
-    return call_api(ctx, 'Gimp.PlugIn.add_temp_procedure', args=[procedure])
-
-@mcp.tool()
-def Gimp_PlugIn_get_pdb_error_handler(ctx: Context) -> str:
-    """Retrieves the active error handler for procedure calls.
+    """),
+    ('Gimp.PlugIn.get_pdb_error_handler', [],
+     """Retrieves the active error handler for procedure calls.
 
-    """
-    return call_api(ctx, 'Gimp.PlugIn.get_pdb_error_handler', args=[])
-
-@mcp.tool()
-def Gimp_PlugIn_get_temp_procedure(ctx: Context, procedure_name: str) -> str:
-    """This function retrieves a temporary procedure from plug_in by the
+    """),
+    ('Gimp.PlugIn.get_temp_procedure', [('procedure_name', str)],
+     """This function retrieves a temporary procedure from plug_in by the
 procedure’s procedure_name.
 
     :param procedure_name: The name of a GimpProcedure added to plug_in.
-    """
-    return call_api(ctx, 'Gimp.PlugIn.get_temp_procedure', args=[procedure_name])
-
-@mcp.tool()
-def Gimp_PlugIn_get_temp_procedures(ctx: Context) -> str:
-    """This function retrieves the list of temporary procedure of plug_in as
+    """),
+    ('Gimp.PlugIn.get_temp_procedures', [],
+     """This function retrieves the list of temporary procedure of plug_in as
 added with gimp_plug_in_add_temp_procedure().
 
-    """
-    return call_api(ctx, 'Gimp.PlugIn.get_temp_procedures', args=[])
-
-@mcp.tool()
-def Gimp_PlugIn_persistent_enable(ctx: Context) -> str:
-    """Enables asynchronous processing of messages from the main GIMP application.
-
-    """
-    return call_api(ctx, 'Gimp.PlugIn.persistent_enable', args=[])
+    """),
+    ('Gimp.PlugIn.persistent_enable', [],
+     """Enables asynchronous processing of messages from the main GIMP application.
 
-@mcp.tool()
-def Gimp_PlugIn_persistent_process(ctx: Context, timeout: int) -> str:
-    """Processes one message sent by GIMP and returns.
+    """),
+    ('Gimp.PlugIn.persistent_process', [('timeout', int)],
+     """Processes one message sent by GIMP and returns.
 
     :param timeout: The timeout (in ms) to use for the select() call.
-    """
-    return call_api(ctx, 'Gimp.PlugIn.persistent_process', args=[timeout])
-
-@mcp.tool()
-def Gimp_PlugIn_remove_temp_procedure(ctx: Context, procedure_name: str) -> str:
-    """This function removes a temporary procedure from plug_in by the
+    """),
+    ('Gimp.PlugIn.remove_temp_procedure', [('procedure_name', str)],
+     """This function removes a temporary procedure from plug_in by the
 procedure’s procedure_name.
 
     :param procedure_name: The name of a GimpProcedure added to plug_in.
-    """
-    return call_api(ctx, 'Gimp.PlugIn.remove_temp_procedure', args=[procedure_name])
-
-@mcp.tool()
-def Gimp_PlugIn_set_help_domain(ctx: Context, domain_name: str, domain_uri: str) -> str:
-    """Set a help domain and path for the plug_in.
+    """),
+    ('Gimp.PlugIn.set_help_domain', [('domain_name', str), ('domain_uri', str)],
+     """Set a help domain and path for the plug_in.
 
     :param domain_name: The XML namespace of the plug-in’s help pages.
     :param domain_uri: The root URI of the plug-in’s help pages.
-    """
-    return call_api(ctx, 'Gimp.PlugIn.set_help_domain', args=[domain_name, domain_uri])
-
-@mcp.tool()
-def Gimp_PlugIn_set_pdb_error_handler(ctx: Context, handler: str) -> str:
-    """Sets an error handler for procedure calls.
+    """),
+    ('Gimp.PlugIn.set_pdb_error_handler', [('handler', str)],
+     """Sets an error handler for procedure calls.
 
     :param handler: Who is responsible for handling procedure call errors.
-    """
-    return call_api(ctx, 'Gimp.PlugIn.set_pdb_error_handler', args=[handler])
-
-@mcp.tool()
-def Gimp_Procedure_add_boolean_argument(ctx: Context, name: str, nick: str, blurb: str = None, value: bool = False, flags: str = None) -> str:
-    """Add a new boolean argument to procedure.
+    """),
+    ('Gimp.Procedure.add_boolean_argument', [('name', str), ('nick', str), ('blurb', str, None), ('value', bool, False), ('flags', str, None)],
+     """Add a new boolean argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_boolean_argument', args=[name, nick, blurb, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_boolean_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, value: bool = False, flags: str = None) -> str:
-    """Add a new boolean auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_boolean_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('value', bool, False), ('flags', str, None)],
+     """Add a new boolean auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_boolean_aux_argument', args=[name, nick, blurb, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_boolean_return_value(ctx: Context, name: str, nick: str, blurb: str = None, value: bool = False, flags: str = None) -> str:
-    """Add a new boolean return value to procedure.
+    """),
+    ('Gimp.Procedure.add_boolean_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('value', bool, False), ('flags', str, None)],
+     """Add a new boolean return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_boolean_return_value', args=[name, nick, blurb, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_brush_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = None, default_value: str = None, default_to_context: bool= False, flags: str = None) -> str:
-    """Add a new GimpBrush argument to procedure.
+    """),
+    ('Gimp.Procedure.add_brush_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, None), ('default_value', str, None), ('default_to_context', bool, False), ('flags', str, None)],
+     """Add a new GimpBrush argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4554,12 +3406,9 @@ def Gimp_Procedure_add_brush_argument(ctx: Context, name: str, nick: str, blurb:
     :param default_value: Default value.
     :param default_to_context: Use the context’s brush as default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_brush_argument', args=[name, nick, blurb, none_ok, default_value, default_to_context, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_brush_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, default_value: str = None, default_to_context: bool= False, flags: str = None) -> str:
-    """Add a new GimpBrush auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_brush_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('default_value', str, None), ('default_to_context', bool, False), ('flags', str, None)],
+     """Add a new GimpBrush auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4567,92 +3416,68 @@ def Gimp_Procedure_add_brush_aux_argument(ctx: Context, name: str, nick: str, bl
     :param default_value: Default value.
     :param default_to_context: Use the context’s brush as default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_brush_aux_argument', args=[name, nick, blurb, default_value, default_to_context, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_brush_return_value(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = None) -> str:
-    """Add a new GimpBrush return value to procedure.
+    """),
+    ('Gimp.Procedure.add_brush_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, None)],
+     """Add a new GimpBrush return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_brush_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_bytes_argument(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = None) -> str:
-    """Add a new GBytes argument to procedure.
+    """),
+    ('Gimp.Procedure.add_bytes_argument', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, None)],
+     """Add a new GBytes argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_bytes_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_bytes_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = None) -> str:
-    """Add a new GBytes auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_bytes_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, None)],
+     """Add a new GBytes auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_bytes_aux_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_bytes_return_value(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = None) -> str:
-    """Add a new GBytes return value to procedure.
+    """),
+    ('Gimp.Procedure.add_bytes_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, None)],
+     """Add a new GBytes return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_bytes_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_channel_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = None) -> str:
-    """Add a new GimpChannel argument to procedure.
+    """),
+    ('Gimp.Procedure.add_channel_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, None)],
+     """Add a new GimpChannel argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_channel_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_channel_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = None) -> str:
-    """Add a new GimpChannel auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_channel_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, None)],
+     """Add a new GimpChannel auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_channel_aux_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_channel_return_value(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = None) -> str:
-    """Add a new GimpChannel return value to procedure.
+    """),
+    ('Gimp.Procedure.add_channel_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, None)],
+     """Add a new GimpChannel return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_channel_return_value', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_choice_argument(ctx: Context, name: str, nick: str, choice: str = "", value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GimpChoice argument to procedure.
+    """),
+    ('Gimp.Procedure.add_choice_argument', [('name', str), ('nick', str), ('choice', str, ""), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GimpChoice argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4660,12 +3485,9 @@ def Gimp_Procedure_add_choice_argument(ctx: Context, name: str, nick: str, choic
     :param choice: The GimpChoice.
     :param value: The default value for GimpChoice.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_choice_argument', args=[name, nick, blurb, choice, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_choice_aux_argument(ctx: Context, name: str, nick: str, choice: str = "", value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GimpChoice auxiliary argument to procedure.
+    """, ['name', 'nick', 'blurb', 'choice', 'value', 'flags']),
+    ('Gimp.Procedure.add_choice_aux_argument', [('name', str), ('nick', str), ('choice', str, ""), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GimpChoice auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4673,12 +3495,9 @@ def Gimp_Procedure_add_choice_aux_argument(ctx: Context, name: str, nick: str, c
     :param choice: The GimpChoice.
     :param value: The default value for GimpChoice.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_choice_aux_argument', args=[name, nick, blurb, choice, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_choice_return_value(ctx: Context, name: str, nick: str, choice: str = "", value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GimpChoice return value to procedure.
+    """, ['name', 'nick', 'blurb', 'choice', 'value', 'flags']),
+    ('Gimp.Procedure.add_choice_return_value', [('name', str), ('nick', str), ('choice', str, ""), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GimpChoice return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4686,12 +3505,9 @@ def Gimp_Procedure_add_choice_return_value(ctx: Context, name: str, nick: str, c
     :param choice: The GimpChoice.
     :param value: The default value for GimpChoice.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_choice_return_value', args=[name, nick, blurb, choice, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_color_argument(ctx: Context, name: str, nick: str, has_alpha: bool = False, value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GeglColor argument to procedure.
+    """, ['name', 'nick', 'blurb', 'choice', 'value', 'flags']),
+    ('Gimp.Procedure.add_color_argument', [('name', str), ('nick', str), ('has_alpha', bool, False), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GeglColor argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4699,12 +3515,9 @@ def Gimp_Procedure_add_color_argument(ctx: Context, name: str, nick: str, has_al
     :param has_alpha: Whether the argument has transparency.
     :param value: The default GeglColor value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_color_argument', args=[name, nick, blurb, has_alpha, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_color_aux_argument(ctx: Context, name: str, nick: str, has_alpha: bool = False, value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GeglColor auxiliary argument to procedure.
+    """, ['name', 'nick', 'blurb', 'has_alpha', 'value', 'flags']),
+    ('Gimp.Procedure.add_color_aux_argument', [('name', str), ('nick', str), ('has_alpha', bool, False), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GeglColor auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4712,12 +3525,9 @@ def Gimp_Procedure_add_color_aux_argument(ctx: Context, name: str, nick: str, ha
     :param has_alpha: Whether the argument has transparency.
     :param value: The default GeglColor value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_color_aux_argument', args=[name, nick, blurb, has_alpha, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_color_from_string_argument(ctx: Context, name: str, nick: str, has_alpha: bool = False, value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GeglColor argument to procedure from a string representation.
+    """, ['name', 'nick', 'blurb', 'has_alpha', 'value', 'flags']),
+    ('Gimp.Procedure.add_color_from_string_argument', [('name', str), ('nick', str), ('has_alpha', bool, False), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GeglColor argument to procedure from a string representation.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4725,12 +3535,9 @@ def Gimp_Procedure_add_color_from_string_argument(ctx: Context, name: str, nick:
     :param has_alpha: Whether the argument has transparency.
     :param value: The default GeglColor value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_color_from_string_argument', args=[name, nick, blurb, has_alpha, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_color_from_string_aux_argument(ctx: Context, name: str, nick: str, has_alpha: bool = False, value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GeglColor auxiliary argument to procedure from a string representation.
+    """, ['name', 'nick', 'blurb', 'has_alpha', 'value', 'flags']),
+    ('Gimp.Procedure.add_color_from_string_aux_argument', [('name', str), ('nick', str), ('has_alpha', bool, False), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GeglColor auxiliary argument to procedure from a string representation.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4738,12 +3545,9 @@ def Gimp_Procedure_add_color_from_string_aux_argument(ctx: Context, name: str, n
     :param has_alpha: Whether the argument has transparency.
     :param value: The default GeglColor value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_color_from_string_aux_argument', args=[name, nick, blurb, has_alpha, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_color_from_string_return_value(ctx: Context, name: str, nick: str, has_alpha: bool = False, value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GeglColor return value to procedure from a string representation.
+    """, ['name', 'nick', 'blurb', 'has_alpha', 'value', 'flags']),
+    ('Gimp.Procedure.add_color_from_string_return_value', [('name', str), ('nick', str), ('has_alpha', bool, False), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GeglColor return value to procedure from a string representation.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4751,12 +3555,9 @@ def Gimp_Procedure_add_color_from_string_return_value(ctx: Context, name: str, n
     :param has_alpha: Whether the argument has transparency.
     :param value: The default GeglColor value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_color_from_string_return_value', args=[name, nick, blurb, has_alpha, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_color_return_value(ctx: Context, name: str, nick: str, has_alpha: bool = False, value: str = "", flags: str = "", blurb: str = None) -> str:
-    """Add a new GeglColor return value to procedure.
+    """, ['name', 'nick', 'blurb', 'has_alpha', 'value', 'flags']),
+    ('Gimp.Procedure.add_color_return_value', [('name', str), ('nick', str), ('has_alpha', bool, False), ('value', str, ""), ('flags', str, ""), ('blurb', str, None)],
+     """Add a new GeglColor return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4764,84 +3565,63 @@ def Gimp_Procedure_add_color_return_value(ctx: Context, name: str, nick: str, ha
     :param has_alpha: Whether the argument has transparency.
     :param value: The default GeglColor value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_color_return_value', args=[name, nick, blurb, has_alpha, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_core_object_array_argument(ctx: Context, name: str, nick: str, blurb: str = None, object_type: str = "", flags: str = "") -> str:
-    """Add a new object array argument to procedure.
+    """, ['name', 'nick', 'blurb', 'has_alpha', 'value', 'flags']),
+    ('Gimp.Procedure.add_core_object_array_argument', [('name', str), ('nick', str), ('blurb', str, None), ('object_type', str, ""), ('flags', str, "")],
+     """Add a new object array argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param object_type: The type of object stored in the array.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_core_object_array_argument', args=[name, nick, blurb, object_type, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_core_object_array_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, object_type: str = "", flags: str = "") -> str:
-    """Add a new object array auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_core_object_array_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('object_type', str, ""), ('flags', str, "")],
+     """Add a new object array auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param object_type: The type of object stored in the array.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_core_object_array_aux_argument', args=[name, nick, blurb, object_type, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_core_object_array_return_value(ctx: Context, name: str, nick: str, blurb: str = None, object_type: str = "", flags: str = "") -> str:
-    """Add a new object array return value to procedure.
+    """),
+    ('Gimp.Procedure.add_core_object_array_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('object_type', str, ""), ('flags', str, "")],
+     """Add a new object array return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param object_type: The type of object stored in the array.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_core_object_array_return_value', args=[name, nick, blurb, object_type, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_display_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpDisplay argument to procedure.
+    """),
+    ('Gimp.Procedure.add_display_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpDisplay argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_display_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_display_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpDisplay auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_display_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpDisplay auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_display_aux_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_display_return_value(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpDisplay return value to procedure.
+    """),
+    ('Gimp.Procedure.add_display_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpDisplay return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_display_return_value', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_double_argument(ctx: Context, name: str, nick: str, blurb: str = None, min: float = 0.0, max: float = 0.0, value: float = 0.0, flags: str = "") -> str:
-    """Add a new floating-point in double precision argument to procedure.
+    """),
+    ('Gimp.Procedure.add_double_argument', [('name', str), ('nick', str), ('blurb', str, None), ('min', float, 0.0), ('max', float, 0.0), ('value', float, 0.0), ('flags', str, "")],
+     """Add a new floating-point in double precision argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4850,45 +3630,33 @@ def Gimp_Procedure_add_double_argument(ctx: Context, name: str, nick: str, blurb
     :param max: The maximum value for this argument.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_double_argument', args=[name, nick, blurb, min, max, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_double_array_argument(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = "") -> str:
-    """Add a new double array argument to procedure.
+    """),
+    ('Gimp.Procedure.add_double_array_argument', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, "")],
+     """Add a new double array argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_double_array_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_double_array_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = "") -> str:
-    """Add a new double array auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_double_array_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, "")],
+     """Add a new double array auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_double_array_aux_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_double_array_return_value(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = "") -> str:
-    """Add a new double array return value to procedure.
+    """),
+    ('Gimp.Procedure.add_double_array_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, "")],
+     """Add a new double array return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_double_array_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_double_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, min: float = 0.0, max: float = 0.0, value: float = 0.0, flags: str = "") -> str:
-    """Add a new floating-point in double precision auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_double_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('min', float, 0.0), ('max', float, 0.0), ('value', float, 0.0), ('flags', str, "")],
+     """Add a new floating-point in double precision auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4897,12 +3665,9 @@ def Gimp_Procedure_add_double_aux_argument(ctx: Context, name: str, nick: str, b
     :param max: The maximum value for this argument.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_double_aux_argument', args=[name, nick, blurb, min, max, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_double_return_value(ctx: Context, name: str, nick: str, blurb: str = None, min: float = 0.0, max: float = 0.0, value: float = 0.0, flags: str = "") -> str:
-    """Add a new floating-point in double precision return value to procedure.
+    """),
+    ('Gimp.Procedure.add_double_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('min', float, 0.0), ('max', float, 0.0), ('value', float, 0.0), ('flags', str, "")],
+     """Add a new floating-point in double precision return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4911,48 +3676,36 @@ def Gimp_Procedure_add_double_return_value(ctx: Context, name: str, nick: str, b
     :param max: The maximum value for this argument.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_double_return_value', args=[name, nick, blurb, min, max, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_drawable_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpDrawable argument to procedure.
+    """),
+    ('Gimp.Procedure.add_drawable_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpDrawable argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_drawable_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_drawable_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpDrawable auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_drawable_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpDrawable auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_drawable_aux_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_drawable_return_value(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpDrawable return value to procedure.
+    """),
+    ('Gimp.Procedure.add_drawable_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpDrawable return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_drawable_return_value', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_enum_argument(ctx: Context, name: str, nick: str, blurb: str = None, enum_type: str = "", value: int = 0, flags: str = "") -> str:
-    """Add a new enum argument to procedure.
+    """),
+    ('Gimp.Procedure.add_enum_argument', [('name', str), ('nick', str), ('blurb', str, None), ('enum_type', str, ""), ('value', int, 0), ('flags', str, "")],
+     """Add a new enum argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4960,12 +3713,9 @@ def Gimp_Procedure_add_enum_argument(ctx: Context, name: str, nick: str, blurb:
     :param enum_type: The GType for this argument.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_enum_argument', args=[name, nick, blurb, enum_type, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_enum_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, enum_type: str = "", value: int = 0, flags: str = "") -> str:
-    """Add a new enum auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_enum_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('enum_type', str, ""), ('value', int, 0), ('flags', str, "")],
+     """Add a new enum auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4973,12 +3723,9 @@ def Gimp_Procedure_add_enum_aux_argument(ctx: Context, name: str, nick: str, blu
     :param enum_type: The GType for this argument.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_enum_aux_argument', args=[name, nick, blurb, enum_type, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_enum_return_value(ctx: Context, name: str, nick: str, blurb: str = None, enum_type: str = "", value: int = 0, flags: str = "") -> str:
-    """Add a new enum return value to procedure.
+    """),
+    ('Gimp.Procedure.add_enum_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('enum_type', str, ""), ('value', int, 0), ('flags', str, "")],
+     """Add a new enum return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -4986,12 +3733,9 @@ def Gimp_Procedure_add_enum_return_value(ctx: Context, name: str, nick: str, blu
     :param enum_type: The GType for this argument.
     :param value: The default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_enum_return_value', args=[name, nick, blurb, enum_type, value, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_file_argument(ctx: Context, name: str, nick: str, blurb: str = None, action: str = "", none_ok: bool = False, default_file: str = "", flags: str = "") -> str:
-    """Add a new GFile argument to procedure.
+    """),
+    ('Gimp.Procedure.add_file_argument', [('name', str), ('nick', str), ('blurb', str, None), ('action', str, ""), ('none_ok', bool, False), ('default_file', str, ""), ('flags', str, "")],
+     """Add a new GFile argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5000,12 +3744,9 @@ def Gimp_Procedure_add_file_argument(ctx: Context, name: str, nick: str, blurb:
     :param none_ok: Whether NULL is allowed.
     :param default_file: File to use if none is assigned.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_file_argument', args=[name, nick, blurb, action, none_ok, default_file, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_file_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, action: str = "", none_ok: bool = False, default_file: str = "", flags: str = "") -> str:
-    """Add a new GFile auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_file_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('action', str, ""), ('none_ok', bool, False), ('default_file', str, ""), ('flags', str, "")],
+     """Add a new GFile auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5014,23 +3755,17 @@ def Gimp_Procedure_add_file_aux_argument(ctx: Context, name: str, nick: str, blu
     :param none_ok: Whether NULL is allowed.
     :param default_file: File to use if none is assigned.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_file_aux_argument', args=[name, nick, blurb, action, none_ok, default_file, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_file_return_value(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = "") -> str:
-    """Add a new GFile return value to procedure.
+    """),
+    ('Gimp.Procedure.add_file_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, "")],
+     """Add a new GFile return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_file_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_font_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, default_value: str = "", default_to_context: bool = False, flags: str = "") -> str:
-    """Add a new GimpFont argument to procedure.
+    """),
+    ('Gimp.Procedure.add_font_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('default_value', str, ""), ('default_to_context', bool, False), ('flags', str, "")],
+     """Add a new GimpFont argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5039,12 +3774,9 @@ def Gimp_Procedure_add_font_argument(ctx: Context, name: str, nick: str, blurb:
     :param default_value: Default value.
     :param default_to_context: Use the context’s font as default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_font_argument', args=[name, nick, blurb, none_ok, default_value, default_to_context, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_font_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, default_value: str = "", default_to_context: bool = False, flags: str = "") -> str:
-    """Add a new GimpFont auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_font_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('default_value', str, ""), ('default_to_context', bool, False), ('flags', str, "")],
+     """Add a new GimpFont auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5052,23 +3784,17 @@ def Gimp_Procedure_add_font_aux_argument(ctx: Context, name: str, nick: str, blu
     :param default_value: Default value.
     :param default_to_context: Use the context’s font as default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_font_aux_argument', args=[name, nick, blurb, default_value, default_to_context, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_font_return_value(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = "") -> str:
-    """Add a new GimpFont return value to procedure.
+    """),
+    ('Gimp.Procedure.add_font_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, "")],
+     """Add a new GimpFont return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_font_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_gradient_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, default_value: str = "", default_to_context: bool = False, flags: str = "") -> str:
-    """Add a new GimpGradient argument to procedure.
+    """),
+    ('Gimp.Procedure.add_gradient_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('default_value', str, ""), ('default_to_context', bool, False), ('flags', str, "")],
+     """Add a new GimpGradient argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5077,12 +3803,9 @@ def Gimp_Procedure_add_gradient_argument(ctx: Context, name: str, nick: str, blu
     :param default_value: Default value.
     :param default_to_context: Use the context’s gradient as default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_gradient_argument', args=[name, nick, blurb, none_ok, default_value, default_to_context, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_gradient_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, default_value: str = "", default_to_context: bool = False, flags: str = "") -> str:
-    """Add a new GimpGradient auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_gradient_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('default_value', str, ""), ('default_to_context', bool, False), ('flags', str, "")],
+     """Add a new GimpGradient auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5090,128 +3813,95 @@ def Gimp_Procedure_add_gradient_aux_argument(ctx: Context, name: str, nick: str,
     :param default_value: Default value.
     :param default_to_context: Use the context’s gradient as default value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_gradient_aux_argument', args=[name, nick, blurb, default_value, default_to_context, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_gradient_return_value(ctx: Context, name: str, nick: str, blurb: str = None, flags: str = "") -> str:
-    """Add a new GimpGradient return value to procedure.
+    """),
+    ('Gimp.Procedure.add_gradient_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('flags', str, "")],
+     """Add a new GimpGradient return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_gradient_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_group_layer_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpGroupLayer argument to procedure.
+    """),
+    ('Gimp.Procedure.add_group_layer_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpGroupLayer argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_group_layer_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_group_layer_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpGroupLayer auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_group_layer_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpGroupLayer auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_group_layer_aux_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_group_layer_return_value(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpGroupLayer return value to procedure.
+    """),
+    ('Gimp.Procedure.add_group_layer_return_value', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpGroupLayer return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_group_layer_return_value', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_image_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = "") -> str:
-    """Add a new GimpImage argument to procedure.
+    """),
+    ('Gimp.Procedure.add_image_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, "")],
+     """Add a new GimpImage argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_image_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_image_aux_argument(ctx: Context, name: str, nick: str, blurb: str = None, none_ok: bool = False, flags: str = None) -> str:
-    """Add a new GimpImage auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_image_aux_argument', [('name', str), ('nick', str), ('blurb', str, None), ('none_ok', bool, False), ('flags', str, None)],
+     """Add a new GimpImage auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param blurb: A more detailed help description.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_image_aux_argument', args=[name, nick, blurb, none_ok, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_image_return_value(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpImage return value to procedure.
+    """),
+    ('Gimp.Procedure.add_image_return_value', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpImage return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_image_return_value', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_int32_array_argument(ctx: Context, name: str, nick: str, flags: str = None, blurb: str = None) -> str:
-    """Add a new integer array argument to procedure.
+    """),
+    ('Gimp.Procedure.add_int32_array_argument', [('name', str), ('nick', str), ('flags', str, None), ('blurb', str, None)],
+     """Add a new integer array argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_int32_array_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_int32_array_aux_argument(ctx: Context, name: str, nick: str, flags: str = None, blurb: str = None) -> str:
-    """Add a new integer array auxiliary argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_int32_array_aux_argument', [('name', str), ('nick', str), ('flags', str, None), ('blurb', str, None)],
+     """Add a new integer array auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_int32_array_aux_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_int32_array_return_value(ctx: Context, name: str, nick: str, flags: str = None, blurb: str = None) -> str:
-    """Add a new integer array return value to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_int32_array_return_value', [('name', str), ('nick', str), ('flags', str, None), ('blurb', str, None)],
+     """Add a new integer array return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_int32_array_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_int_argument(ctx: Context, name: str, nick: str, min: int, max: int, value: int, flags: str, blurb: str = None) -> str:
-    """Add a new integer argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_int_argument', [('name', str), ('nick', str), ('min', int), ('max', int), ('value', int), ('flags', str), ('blurb', str, None)],
+     """Add a new integer argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5220,12 +3910,9 @@ def Gimp_Procedure_add_int_argument(ctx: Context, name: str, nick: str, min: int
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_int_argument', args=[name, nick, min, max, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_int_aux_argument(ctx: Context, name: str, nick: str, min: int, max: int, value: int, flags: str, blurb: str = None) -> str:
-    """Add a new integer auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_int_aux_argument', [('name', str), ('nick', str), ('min', int), ('max', int), ('value', int), ('flags', str), ('blurb', str, None)],
+     """Add a new integer auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5234,12 +3921,9 @@ def Gimp_Procedure_add_int_aux_argument(ctx: Context, name: str, nick: str, min:
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_int_aux_argument', args=[name, nick, min, max, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_int_return_value(ctx: Context, name: str, nick: str, min: int, max: int, value: int, flags: str, blurb: str = None) -> str:
-    """Add a new integer return value to procedure.
+    """),
+    ('Gimp.Procedure.add_int_return_value', [('name', str), ('nick', str), ('min', int), ('max', int), ('value', int), ('flags', str), ('blurb', str, None)],
+     """Add a new integer return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5248,129 +3932,96 @@ def Gimp_Procedure_add_int_return_value(ctx: Context, name: str, nick: str, min:
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_int_return_value', args=[name, nick, min, max, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_item_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpItem argument to procedure.
+    """),
+    ('Gimp.Procedure.add_item_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpItem argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_item_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_item_aux_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpItem auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_item_aux_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpItem auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_item_aux_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_item_return_value(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpItem return value to procedure.
+    """),
+    ('Gimp.Procedure.add_item_return_value', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpItem return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_item_return_value', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_layer_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpLayer argument to procedure.
+    """),
+    ('Gimp.Procedure.add_layer_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpLayer argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_layer_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_layer_aux_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpLayer auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_layer_aux_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpLayer auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_layer_aux_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_layer_mask_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpLayerMask argument to procedure.
+    """),
+    ('Gimp.Procedure.add_layer_mask_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpLayerMask argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_layer_mask_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_layer_mask_aux_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpLayerMask auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_layer_mask_aux_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpLayerMask auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_layer_mask_aux_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_layer_mask_return_value(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpLayerMask return value to procedure.
+    """),
+    ('Gimp.Procedure.add_layer_mask_return_value', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpLayerMask return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_layer_mask_return_value', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_layer_return_value(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpLayer return value to procedure.
+    """),
+    ('Gimp.Procedure.add_layer_return_value', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpLayer return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_layer_return_value', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_menu_path(ctx: Context, menu_path: str) -> str:
-    """Adds a menu path to the procedure. Only procedures which have a menu
+    """),
+    ('Gimp.Procedure.add_menu_path', [('menu_path', str)],
+     """Adds a menu path to the procedure. Only procedures which have a menu
 label can add a menu path.
 
     :param menu_path: The procedure‘s additional menu path.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_menu_path', args=[menu_path])
-
-@mcp.tool()
-def Gimp_Procedure_add_palette_argument(ctx: Context, name: str, nick: str, none_ok: bool = None, default_to_context: bool = False, default_value: str = None, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpPalette argument to procedure.
+    """),
+    ('Gimp.Procedure.add_palette_argument', [('name', str), ('nick', str), ('none_ok', bool, None), ('default_to_context', bool, False), ('default_value', str, None), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpPalette argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5379,12 +4030,9 @@ def Gimp_Procedure_add_palette_argument(ctx: Context, name: str, nick: str, none
     :param default_value: Default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_palette_argument', args=[name, nick, none_ok, default_to_context, default_value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_palette_aux_argument(ctx: Context, name: str, nick: str, default_to_context: bool = False, default_value: str = None, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpPalette auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_palette_aux_argument', [('name', str), ('nick', str), ('default_to_context', bool, False), ('default_value', str, None), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpPalette auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5392,128 +4040,95 @@ def Gimp_Procedure_add_palette_aux_argument(ctx: Context, name: str, nick: str,
     :param default_value: Default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_palette_aux_argument', args=[name, nick, default_to_context, default_value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_palette_return_value(ctx: Context, name: str, nick: str, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpPalette return value to procedure.
+    """),
+    ('Gimp.Procedure.add_palette_return_value', [('name', str), ('nick', str), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpPalette return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_palette_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_param_argument(ctx: Context, name: str, nick: str, param_type: str, flags: str, blurb: str = None) -> str:
-    """Add a new param argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_param_argument', [('name', str), ('nick', str), ('param_type', str), ('flags', str), ('blurb', str, None)],
+     """Add a new param argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param param_type: The GPParamType for this argument.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_param_argument', args=[name, nick, param_type, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_param_aux_argument(ctx: Context, name: str, nick: str, param_type: str, flags: str, blurb: str = None) -> str:
-    """Add a new param auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_param_aux_argument', [('name', str), ('nick', str), ('param_type', str), ('flags', str), ('blurb', str, None)],
+     """Add a new param auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param param_type: The GPParamType for this argument.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_param_aux_argument', args=[name, nick, param_type, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_param_return_value(ctx: Context, name: str, nick: str, param_type: str, flags: str, blurb: str = None) -> str:
-    """Add a new param return value to procedure.
+    """),
+    ('Gimp.Procedure.add_param_return_value', [('name', str), ('nick', str), ('param_type', str), ('flags', str), ('blurb', str, None)],
+     """Add a new param return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param param_type: The GPParamType for this argument.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_param_return_value', args=[name, nick, param_type, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_parasite_argument(ctx: Context, name: str, nick: str, flags: str, blurb: str = None) -> str:
-    """Add a new GimpParasite argument to procedure.
+    """),
+    ('Gimp.Procedure.add_parasite_argument', [('name', str), ('nick', str), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpParasite argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_parasite_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_parasite_aux_argument(ctx: Context, name: str, nick: str, flags: str, blurb: str = None) -> str:
-    """Add a new GimpParasite auxiliary argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_parasite_aux_argument', [('name', str), ('nick', str), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpParasite auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_parasite_aux_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_parasite_return_value(ctx: Context, name: str, nick: str, flags: str, blurb: str = None) -> str:
-    """Add a new GimpParasite return value to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_parasite_return_value', [('name', str), ('nick', str), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpParasite return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_parasite_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_path_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpPath argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_path_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpPath argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_path_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_path_aux_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpPath auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_path_aux_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpPath auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_path_aux_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_path_return_value(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpPath return value to procedure.
+    """),
+    ('Gimp.Procedure.add_path_return_value', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpPath return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_path_return_value', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_pattern_argument(ctx: Context, name: str, nick: str, none_ok: bool = None, default_to_context: bool = False, default_value: str = None, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpPattern argument to procedure.
+    """),
+    ('Gimp.Procedure.add_pattern_argument', [('name', str), ('nick', str), ('none_ok', bool, None), ('default_to_context', bool, False), ('default_value', str, None), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpPattern argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5522,12 +4137,9 @@ def Gimp_Procedure_add_pattern_argument(ctx: Context, name: str, nick: str, none
     :param default_value: Default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_pattern_argument', args=[name, nick, none_ok, default_to_context, default_value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_pattern_aux_argument(ctx: Context, name: str, nick: str, default_to_context: bool = False, default_value: str = None, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpPattern auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_pattern_aux_argument', [('name', str), ('nick', str), ('default_to_context', bool, False), ('default_value', str, None), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpPattern auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5535,23 +4147,17 @@ def Gimp_Procedure_add_pattern_aux_argument(ctx: Context, name: str, nick: str,
     :param default_value: Default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_pattern_aux_argument', args=[name, nick, default_to_context, default_value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_pattern_return_value(ctx: Context, name: str, nick: str, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpPattern return value to procedure.
+    """),
+    ('Gimp.Procedure.add_pattern_return_value', [('name', str), ('nick', str), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpPattern return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_pattern_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_resource_argument(ctx: Context, name: str, nick: str, none_ok: bool = None, default_value: str = None, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpResource argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_resource_argument', [('name', str), ('nick', str), ('none_ok', bool, None), ('default_value', str, None), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpResource argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5559,176 +4165,131 @@ def Gimp_Procedure_add_resource_argument(ctx: Context, name: str, nick: str, non
     :param default_value: Default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_resource_argument', args=[name, nick, none_ok, default_value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_resource_aux_argument(ctx: Context, name: str, nick: str, default_value: str = None, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpResource auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_resource_aux_argument', [('name', str), ('nick', str), ('default_value', str, None), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpResource auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param default_value: Default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_resource_aux_argument', args=[name, nick, default_value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_resource_return_value(ctx: Context, name: str, nick: str, flags: str = None, blurb: str = None) -> str:
-    """Add a new GimpResource return value to procedure.
+    """),
+    ('Gimp.Procedure.add_resource_return_value', [('name', str), ('nick', str), ('flags', str, None), ('blurb', str, None)],
+     """Add a new GimpResource return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_resource_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_selection_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpSelection argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_selection_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpSelection argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_selection_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_selection_aux_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpSelection auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_selection_aux_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpSelection auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_selection_aux_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_selection_return_value(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpSelection return value to procedure.
+    """),
+    ('Gimp.Procedure.add_selection_return_value', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpSelection return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_selection_return_value', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_string_argument(ctx: Context, name: str, nick: str, value: str, flags: str, blurb: str = None) -> str:
-    """Add a new string argument to procedure.
+    """),
+    ('Gimp.Procedure.add_string_argument', [('name', str), ('nick', str), ('value', str), ('flags', str), ('blurb', str, None)],
+     """Add a new string argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_string_argument', args=[name, nick, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_string_array_argument(ctx: Context, name: str, nick: str, flags: str, blurb: str = None) -> str:
-    """Add a new string array argument to procedure.
+    """),
+    ('Gimp.Procedure.add_string_array_argument', [('name', str), ('nick', str), ('flags', str), ('blurb', str, None)],
+     """Add a new string array argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_string_array_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_string_array_aux_argument(ctx: Context, name: str, nick: str, flags: str, blurb: str = None) -> str:
-    """Add a new string array auxiliary argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_string_array_aux_argument', [('name', str), ('nick', str), ('flags', str), ('blurb', str, None)],
+     """Add a new string array auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_string_array_aux_argument', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_string_array_return_value(ctx: Context, name: str, nick: str, flags: str, blurb: str = None) -> str:
-    """Add a new string array return value to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_string_array_return_value', [('name', str), ('nick', str), ('flags', str), ('blurb', str, None)],
+     """Add a new string array return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_string_array_return_value', args=[name, nick, blurb, flags])
-
-@mcp.tool()
-def Gimp_Procedure_add_string_aux_argument(ctx: Context, name: str, nick: str, value: str, flags: str, blurb: str = None) -> str:
-    """Add a new string auxiliary argument to procedure.
+    """, ['name', 'nick', 'blurb', 'flags']),
+    ('Gimp.Procedure.add_string_aux_argument', [('name', str), ('nick', str), ('value', str), ('flags', str), ('blurb', str, None)],
+     """Add a new string auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_string_aux_argument', args=[name, nick, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_string_return_value(ctx: Context, name: str, nick: str, value: str, flags: str, blurb: str = None) -> str:
-    """Add a new string return value to procedure.
+    """),
+    ('Gimp.Procedure.add_string_return_value', [('name', str), ('nick', str), ('value', str), ('flags', str), ('blurb', str, None)],
+     """Add a new string return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_string_return_value', args=[name, nick, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_text_layer_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpTextLayer argument to procedure.
+    """),
+    ('Gimp.Procedure.add_text_layer_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpTextLayer argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_text_layer_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_text_layer_aux_argument(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpTextLayer auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_text_layer_aux_argument', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpTextLayer auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_text_layer_aux_argument', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_text_layer_return_value(ctx: Context, name: str, nick: str, none_ok: bool, flags: str, blurb: str = None) -> str:
-    """Add a new GimpTextLayer return value to procedure.
+    """),
+    ('Gimp.Procedure.add_text_layer_return_value', [('name', str), ('nick', str), ('none_ok', bool), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpTextLayer return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
     :param none_ok: Whether no is a valid value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_text_layer_return_value', args=[name, nick, none_ok, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_uint_argument(ctx: Context, name: str, nick: str, min: int, max: int, value: int, flags: str, blurb: str = None) -> str:
-    """Add a new unsigned integer argument to procedure.
+    """),
+    ('Gimp.Procedure.add_uint_argument', [('name', str), ('nick', str), ('min', int), ('max', int), ('value', int), ('flags', str), ('blurb', str, None)],
+     """Add a new unsigned integer argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5737,12 +4298,9 @@ def Gimp_Procedure_add_uint_argument(ctx: Context, name: str, nick: str, min: in
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_uint_argument', args=[name, nick, min, max, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_uint_aux_argument(ctx: Context, name: str, nick: str, min: int, max: int, value: int, flags: str, blurb: str = None) -> str:
-    """Add a new unsigned integer auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_uint_aux_argument', [('name', str), ('nick', str), ('min', int), ('max', int), ('value', int), ('flags', str), ('blurb', str, None)],
+     """Add a new unsigned integer auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5751,12 +4309,9 @@ def Gimp_Procedure_add_uint_aux_argument(ctx: Context, name: str, nick: str, min
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_uint_aux_argument', args=[name, nick, min, max, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_uint_return_value(ctx: Context, name: str, nick: str, min: int, max: int, value: int, flags: str, blurb: str = None) -> str:
-    """Add a new unsigned integer return value to procedure.
+    """),
+    ('Gimp.Procedure.add_uint_return_value', [('name', str), ('nick', str), ('min', int), ('max', int), ('value', int), ('flags', str), ('blurb', str, None)],
+     """Add a new unsigned integer return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5765,12 +4320,9 @@ def Gimp_Procedure_add_uint_return_value(ctx: Context, name: str, nick: str, min
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_uint_return_value', args=[name, nick, min, max, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_unit_argument(ctx: Context, name: str, nick: str, show_pixels: bool, show_percent: bool, value: str, flags: str, blurb: str = None) -> str:
-    """Add a new GimpUnit argument to procedure.
+    """),
+    ('Gimp.Procedure.add_unit_argument', [('name', str), ('nick', str), ('show_pixels', bool), ('show_percent', bool), ('value', str), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpUnit argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5779,12 +4331,9 @@ def Gimp_Procedure_add_unit_argument(ctx: Context, name: str, nick: str, show_pi
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_unit_argument', args=[name, nick, show_pixels, show_percent, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_unit_aux_argument(ctx: Context, name: str, nick: str, show_pixels: bool, show_percent: bool, value: str, flags: str, blurb: str = None) -> str:
-    """Add a new GimpUnit auxiliary argument to procedure.
+    """),
+    ('Gimp.Procedure.add_unit_aux_argument', [('name', str), ('nick', str), ('show_pixels', bool), ('show_percent', bool), ('value', str), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpUnit auxiliary argument to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5793,12 +4342,9 @@ def Gimp_Procedure_add_unit_aux_argument(ctx: Context, name: str, nick: str, sho
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_unit_aux_argument', args=[name, nick, show_pixels, show_percent, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_add_unit_return_value(ctx: Context, name: str, nick: str, show_pixels: bool, show_percent: bool, value: str, flags: str, blurb: str = None) -> str:
-    """Add a new GimpUnit return value to procedure.
+    """),
+    ('Gimp.Procedure.add_unit_return_value', [('name', str), ('nick', str), ('show_pixels', bool), ('show_percent', bool), ('value', str), ('flags', str), ('blurb', str, None)],
+     """Add a new GimpUnit return value to procedure.
 
     :param name: The name of the argument to be created.
     :param nick: The label used in GimpProcedureDialog.
@@ -5807,393 +4353,239 @@ def Gimp_Procedure_add_unit_return_value(ctx: Context, name: str, nick: str, sho
     :param value: The default value.
     :param flags: Argument flags.
     :param blurb: A more detailed help description.
-    """
-    return call_api(ctx, 'Gimp.Procedure.add_unit_return_value', args=[name, nick, show_pixels, show_percent, value, flags, blurb])
-
-@mcp.tool()
-def Gimp_Procedure_create_config(ctx: Context) -> str:
-    """Create a GimpConfig with properties that match procedure‘s arguments, to be
+    """),
+    ('Gimp.Procedure.create_config', [],
+     """Create a GimpConfig with properties that match procedure‘s arguments, to be
 used in gimp_procedure_run_config() method.
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.create_config', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_find_argument(ctx: Context, name: str) -> str:
-    """Searches the procedure‘s arguments for a GParamSpec called name.
+    """),
+    ('Gimp.Procedure.find_argument', [('name', str)],
+     """Searches the procedure‘s arguments for a GParamSpec called name.
 
     :param name: An argument name.
-    """
-    return call_api(ctx, 'Gimp.Procedure.find_argument', args=[name])
-
-@mcp.tool()
-def Gimp_Procedure_find_aux_argument(ctx: Context, name: str) -> str:
-    """Searches the procedure‘s auxiliary arguments for a GParamSpec
+    """),
+    ('Gimp.Procedure.find_aux_argument', [('name', str)],
+     """Searches the procedure‘s auxiliary arguments for a GParamSpec
 called name.
 
     :param name: An auxiliary argument name.
-    """
-    return call_api(ctx, 'Gimp.Procedure.find_aux_argument', args=[name])
-
-@mcp.tool()
-def Gimp_Procedure_find_return_value(ctx: Context, name: str) -> str:
-    """Searches the procedure‘s return values for a GParamSpec called
+    """),
+    ('Gimp.Procedure.find_return_value', [('name', str)],
+     """Searches the procedure‘s return values for a GParamSpec called
 name.
 
     :param name: A return value name.
-    """
-    return call_api(ctx, 'Gimp.Procedure.find_return_value', args=[name])
-
-@mcp.tool()
-def Gimp_Procedure_get_argument_sync(ctx: Context, arg_name: str) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_argument_sync', [('arg_name', str)],
+     """Available since: 3.0
 
     :param arg_name: The name of one of procedure‘s arguments or auxiliary arguments.
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_argument_sync', args=[arg_name])
-
-@mcp.tool()
-def Gimp_Procedure_get_arguments(ctx: Context, n_arguments: int) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_arguments', [('n_arguments', int)],
+     """Available since: 3.0
 
     :param n_arguments: Returns the number of arguments.
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_arguments', args=[n_arguments])
-
-@mcp.tool()
-def Gimp_Procedure_get_authors(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_authors', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_authors', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_aux_arguments(ctx: Context, n_arguments: int) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_aux_arguments', [('n_arguments', int)],
+     """Available since: 3.0
 
     :param n_arguments: Returns the number of auxiliary arguments.
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_aux_arguments', args=[n_arguments])
-
-@mcp.tool()
-def Gimp_Procedure_get_blurb(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_blurb', args=[])
+    """),
+    ('Gimp.Procedure.get_blurb', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Procedure_get_copyright(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_copyright', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_date(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_date', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_help(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_help', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_help_id(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_copyright', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_help_id', args=[])
+    """),
+    ('Gimp.Procedure.get_date', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Procedure_get_icon_file(ctx: Context) -> str:
-    """Gets the file of the icon if one was set for procedure.
+    """),
+    ('Gimp.Procedure.get_help', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_icon_file', args=[])
+    """),
+    ('Gimp.Procedure.get_help_id', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Procedure_get_icon_name(ctx: Context) -> str:
-    """Gets the name of the icon if one was set for procedure.
+    """),
+    ('Gimp.Procedure.get_icon_file', [],
+     """Gets the file of the icon if one was set for procedure.
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_icon_name', args=[])
+    """),
+    ('Gimp.Procedure.get_icon_name', [],
+     """Gets the name of the icon if one was set for procedure.
 
-@mcp.tool()
-def Gimp_Procedure_get_icon_pixbuf(ctx: Context) -> str:
-    """Gets the GdkPixbuf of the icon if an icon was set this way for
+    """),
+    ('Gimp.Procedure.get_icon_pixbuf', [],
+     """Gets the GdkPixbuf of the icon if an icon was set this way for
 procedure.
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_icon_pixbuf', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_icon_type(ctx: Context) -> str:
-    """Gets the type of data set as procedure‘s icon. Depending on the
+    """),
+    ('Gimp.Procedure.get_icon_type', [],
+     """Gets the type of data set as procedure‘s icon. Depending on the
 result, you can call the relevant specific function, such as
 gimp_procedure_get_icon_name().
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_icon_type', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_image_types(ctx: Context) -> str:
-    """This function retrieves the list of image types the procedure can
+    """),
+    ('Gimp.Procedure.get_image_types', [],
+     """This function retrieves the list of image types the procedure can
 operate on. See gimp_procedure_set_image_types().
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_image_types', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_menu_label(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_menu_label', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_menu_paths(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_menu_paths', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_get_name(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_name', args=[])
+    """),
+    ('Gimp.Procedure.get_menu_label', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Procedure_get_plug_in(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_menu_paths', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_plug_in', args=[])
+    """),
+    ('Gimp.Procedure.get_name', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Procedure_get_proc_type(ctx: Context) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_plug_in', [],
+     """Available since: 3.0
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_proc_type', args=[])
+    """),
+    ('Gimp.Procedure.get_proc_type', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Procedure_get_return_values(ctx: Context, n_return_values: int) -> str:
-    """Available since: 3.0
+    """),
+    ('Gimp.Procedure.get_return_values', [('n_return_values', int)],
+     """Available since: 3.0
 
     :param n_return_values: Returns the number of return values.
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_return_values', args=[n_return_values])
-
-@mcp.tool()
-def Gimp_Procedure_get_sensitivity_mask(ctx: Context) -> str:
-    """Available since: 3.0
-
-    """
-    return call_api(ctx, 'Gimp.Procedure.get_sensitivity_mask', args=[])
+    """),
+    ('Gimp.Procedure.get_sensitivity_mask', [],
+     """Available since: 3.0
 
-@mcp.tool()
-def Gimp_Procedure_is_internal(ctx: Context) -> str:
-    """Provide the information if procedure is an internal procedure. Only
+    """),
+    ('Gimp.Procedure.is_internal', [],
+     """Provide the information if procedure is an internal procedure. Only
 a procedure looked up in the GimpPDB can be internal.
 Procedures created by a plug-in in particular are never internal.
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.is_internal', args=[])
-
-@mcp.tool()
-def Gimp_Procedure_new_return_values(ctx: Context, status: str, error: str = None) -> str:
-    """Format the expected return values from procedures.
+    """),
+    ('Gimp.Procedure.new_return_values', [('status', str), ('error', str, None)],
+     """Format the expected return values from procedures.
 
     :param status: The success status of the procedure run.
     :param error: 
-    """
-    return call_api(ctx, 'Gimp.Procedure.new_return_values', args=[status, error])
-
-@mcp.tool()
-def Gimp_Procedure_persistent_ready(ctx: Context) -> str:
-    """Notify the main GIMP application that the persistent procedure has
+    """),
+    ('Gimp.Procedure.persistent_ready', [],
+     """Notify the main GIMP application that the persistent procedure has
 been properly initialized and is ready to run.
 
-    """
-    return call_api(ctx, 'Gimp.Procedure.persistent_ready', args=[])
+    """),
+    ('Gimp.Procedure.run_config', [('config', str, None)],
+     """Runs procedure, calling the run_func given in gimp_procedure_new().
 
-@mcp.tool()
-def Gimp_Procedure_run(ctx: Context, first_arg_name: str = None, *args: str) -> str:
-    """Runs the procedure named procedure_name with arguments given as
-list of (name, value) pairs, terminated by NULL.
-
-    :param first_arg_name: The name of an argument of procedure or NULL to
-                 run procedure with default arguments.
-    :param args: Additional argument names and values.
-    """
-    return call_api(ctx, 'Gimp.Procedure.run', args=[first_arg_name] + list(args))
-
-@mcp.tool()
-def Gimp_Procedure_run_config(ctx: Context, config: str = None) -> str:
-    """Runs procedure, calling the run_func given in gimp_procedure_new().
-
-    :param config: The procedure‘s arguments.
-    """
-    return call_api(ctx, 'Gimp.Procedure.run_config', args=[config])
-
-@mcp.tool()
-def Gimp_Procedure_run_valist(ctx: Context, first_arg_name: str = None, *args: str) -> str:
-    """Runs procedure with argument names and values, given in the order as passed
-to gimp_procedure_run().
-
-    :param first_arg_name: The name of an argument of procedure or NULL to
-                 run procedure with default arguments.
-    :param args: Additional argument names and values.
-    """
-    return call_api(ctx, 'Gimp.Procedure.run_valist', args=[first_arg_name] + list(args))
-
-@mcp.tool()
-def Gimp_Procedure_set_argument_sync(ctx: Context, arg_name: str, sync: str) -> str:
-    """When the procedure’s run() function exits, a GimpProcedure‘s arguments
-or auxiliary arguments can be automatically synced with a GimpParasite of
-the GimpImage the procedure is running on.
+    :param config: The procedure‘s arguments.
+    """),
+    ('Gimp.Procedure.set_argument_sync', [('arg_name', str), ('sync', str)],
+     """When the procedure’s run() function exits, a GimpProcedure‘s arguments
+or auxiliary arguments can be automatically synced with a GimpParasite of
+the GimpImage the procedure is running on.
 
     :param arg_name: The name of one of procedure‘s arguments or auxiliary arguments.
     :param sync: How to sync the argument or auxiliary argument.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_argument_sync', args=[arg_name, sync])
-
-@mcp.tool()
-def Gimp_Procedure_set_attribution(ctx: Context, authors: str, copyright: str, date: str) -> str:
-    """Sets various attribution strings on procedure.
+    """),
+    ('Gimp.Procedure.set_attribution', [('authors', str), ('copyright', str), ('date', str)],
+     """Sets various attribution strings on procedure.
 
     :param authors: The procedure‘s author(s).
     :param copyright: The procedure‘s copyright.
     :param date: The procedure‘s date (written or published).
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_attribution', args=[authors, copyright, date])
-
-@mcp.tool()
-def Gimp_Procedure_set_documentation(ctx: Context, blurb: str, help: str = None, help_id: str = None) -> str:
-    """Sets various documentation strings on procedure:
+    """),
+    ('Gimp.Procedure.set_documentation', [('blurb', str), ('help', str, None), ('help_id', str, None)],
+     """Sets various documentation strings on procedure:
 
     :param blurb: The procedure‘s blurb.
     :param help: The procedure‘s help text.
     :param help_id: The procedure‘s help ID.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_documentation', args=[blurb, help, help_id])
-
-@mcp.tool()
-def Gimp_Procedure_set_icon_file(ctx: Context, file: str = None) -> str:
-    """Sets the icon for procedure to the contents of an image file.
+    """),
+    ('Gimp.Procedure.set_icon_file', [('file', str, None)],
+     """Sets the icon for procedure to the contents of an image file.
 
     :param file: A GFile pointing to an image file.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_icon_file', args=[file])
-
-@mcp.tool()
-def Gimp_Procedure_set_icon_name(ctx: Context, icon_name: str = None) -> str:
-    """Sets the icon for procedure to the icon referenced by icon_name.
+    """),
+    ('Gimp.Procedure.set_icon_name', [('icon_name', str, None)],
+     """Sets the icon for procedure to the icon referenced by icon_name.
 
     :param icon_name: An icon name.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_icon_name', args=[icon_name])
-
-@mcp.tool()
-def Gimp_Procedure_set_icon_pixbuf(ctx: Context, pixbuf: str = None) -> str:
-    """Sets the icon for procedure to pixbuf.
+    """),
+    ('Gimp.Procedure.set_icon_pixbuf', [('pixbuf', str, None)],
+     """Sets the icon for procedure to pixbuf.
 
     :param pixbuf: A GdkPixbuf.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_icon_pixbuf', args=[pixbuf])
-
-@mcp.tool()
-def Gimp_Procedure_set_image_types(ctx: Context, image_types: str) -> str:
-    """This is a comma separated list of image types, or actually drawable
+    """),
+    ('Gimp.Procedure.set_image_types', [('image_types', str)],
+     """This is a comma separated list of image types, or actually drawable
 types, that this procedure can deal with. Wildcards are possible
 here, so you could say “RGB*” instead of “RGB, RGBA” or “*” for all
 image types.
 
     :param image_types: The image types this procedure can operate on.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_image_types', args=[image_types])
-
-@mcp.tool()
-def Gimp_Procedure_set_menu_label(ctx: Context, menu_label: str) -> str:
-    """Sets the label to use for the procedure‘s menu entry, The
+    """),
+    ('Gimp.Procedure.set_menu_label', [('menu_label', str)],
+     """Sets the label to use for the procedure‘s menu entry, The
 location(s) where to register in the menu hierarchy is chosen using gimp_procedure_add_menu_path().
 
     :param menu_label: The procedure‘s menu label.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_menu_label', args=[menu_label])
-
-@mcp.tool()
-def Gimp_Procedure_set_sensitivity_mask(ctx: Context, sensitivity_mask: int) -> str:
-    """Sets the cases when procedure is supposed to be sensitive or not.
+    """),
+    ('Gimp.Procedure.set_sensitivity_mask', [('sensitivity_mask', int)],
+     """Sets the cases when procedure is supposed to be sensitive or not.
 
     :param sensitivity_mask: A binary mask of GimpProcedureSensitivityMask.
-    """
-    return call_api(ctx, 'Gimp.Procedure.set_sensitivity_mask', args=[sensitivity_mask])
-
-@mcp.tool()
-def Gimp_ProcedureConfig_get_choice_id(ctx: Context, property_name: str) -> str:
-    """A utility function which will get the current string value of a
+    """),
+    ('Gimp.ProcedureConfig.get_choice_id', [('property_name', str)],
+     """A utility function which will get the current string value of a
 GimpParamSpecChoice property in config and convert it to the
 integer ID mapped to this value.
 This makes it easy to work with an Enum type locally, within a plug-in code.
 
     :param property_name: The name of a GimpParamSpecChoice property.
-    """
-    return call_api(ctx, 'Gimp.ProcedureConfig.get_choice_id', args=[property_name])
-
-@mcp.tool()
-def Gimp_ProcedureConfig_get_color_array(ctx: Context, property_name: str) -> str:
-    """A function for bindings to get a GimpColorArray property. Getting
+    """),
+    ('Gimp.ProcedureConfig.get_color_array', [('property_name', str)],
+     """A function for bindings to get a GimpColorArray property. Getting
 these with g_object_get() or g_object_get_property() won’t
 work for the time being
 so all our boxed array types must be set and get using these
 alternative functions instead.
 
     :param property_name: The name of a GParamSpecBoxed param spec with GimpColorArray value type.
-    """
-    return call_api(ctx, 'Gimp.ProcedureConfig.get_color_array', args=[property_name])
-
-@mcp.tool()
-def Gimp_ProcedureConfig_get_core_object_array(ctx: Context, property_name: str) -> str:
-    """A function for bindings to get a GimpCoreObjectArray property. Getting
+    """),
+    ('Gimp.ProcedureConfig.get_core_object_array', [('property_name', str)],
+     """A function for bindings to get a GimpCoreObjectArray property. Getting
 these with g_object_get() or g_object_get_property() won’t
 work for the time being
 so all our boxed array types must be set and get using alternative
 functions instead.
 
     :param property_name: The name of a GimpParamSpecCoreObjectArray param spec.
-    """
-    return call_api(ctx, 'Gimp.ProcedureConfig.get_core_object_array', args=[property_name])
-
-@mcp.tool()
-def Gimp_ProcedureConfig_get_procedure(ctx: Context) -> str:
-    """This function returns the GimpProcedure which created config, see
+    """),
+    ('Gimp.ProcedureConfig.get_procedure', [],
+     """This function returns the GimpProcedure which created config, see
 gimp_procedure_create_config().
 
-    """
-    return call_api(ctx, 'Gimp.ProcedureConfig.get_procedure', args=[])
-
-@mcp.tool()
-def Gimp_ProcedureConfig_save_metadata(ctx: Context, exported_image: str, file: str) -> str:
-    """Note: There is normally no need to call this function because it’s
+    """),
+    ('Gimp.ProcedureConfig.save_metadata', [('exported_image', str), ('file', str)],
+     """Note: There is normally no need to call this function because it’s
 already called by GimpExportProcedure after the run() callback.
 
     :param exported_image: The image that was actually exported.
     :param file: The file exported_image was written to.
-    """
-    return call_api(ctx, 'Gimp.ProcedureConfig.save_metadata', args=[exported_image, file])
-
-@mcp.tool()
-def Gimp_ProcedureConfig_set_color_array(ctx: Context, property_name: str, colors: str, n_colors: int) -> str:
-    """A function for bindings to set a GimpColorArray property. Setting
+    """),
+    ('Gimp.ProcedureConfig.set_color_array', [('property_name', str), ('colors', str), ('n_colors', int)],
+     """A function for bindings to set a GimpColorArray property. Setting
 these with g_object_set() or g_object_set_property() won’t
 work for the time being
 so all our boxed array types must be set and get using these
@@ -6202,12 +4594,9 @@ alternative functions instead.
     :param property_name: The name of a GParamSpecBoxed param spec with GimpColorArray value type.
     :param colors: An array of GeglColor.
     :param n_colors: The numbers of colors.
-    """
-    return call_api(ctx, 'Gimp.ProcedureConfig.set_color_array', args=[property_name, colors, n_colors])
-
-@mcp.tool()
-def Gimp_ProcedureConfig_set_core_object_array(ctx: Context, property_name: str, objects: str, n_objects: int) -> str:
-    """A function for bindings to set a GimpCoreObjectArray property. Setting
+    """),
+    ('Gimp.ProcedureConfig.set_core_object_array', [('property_name', str), ('objects', str), ('n_objects', int)],
+     """A function for bindings to set a GimpCoreObjectArray property. Setting
 these with g_object_set() or g_object_set_property() won’t
 work for the time being
 so all our boxed array types must be set and get using alternative
@@ -6216,420 +4605,553 @@ functions instead.
     :param property_name: The name of a GimpParamSpecCoreObjectArray param spec.
     :param objects: An array of GObjects.
     :param n_objects: The numbers of objects.
-    """
-    return call_api(ctx, 'Gimp.ProcedureConfig.set_core_object_array', args=[property_name, objects, n_objects])
-
-@mcp.tool()
-def Gimp_Resource_delete(ctx: Context) -> str:
-    """Deletes a resource.
-
-    """
-    return call_api(ctx, 'Gimp.Resource.delete', args=[])
-
-@mcp.tool()
-def Gimp_Resource_duplicate(ctx: Context) -> str:
-    """Duplicates a resource.
-
-    """
-    return call_api(ctx, 'Gimp.Resource.duplicate', args=[])
-
-@mcp.tool()
-def Gimp_Resource_get_id(ctx: Context) -> str:
-    """mostly internal data and not reusable across sessions.
-
-    """
-    return call_api(ctx, 'Gimp.Resource.get_id', args=[])
-
-@mcp.tool()
-def Gimp_Resource_get_name(ctx: Context) -> str:
-    """Returns the resource’s name.
+    """),
+    ('Gimp.Resource.delete', [],
+     """Deletes a resource.
 
-    """
-    return call_api(ctx, 'Gimp.Resource.get_name', args=[])
+    """),
+    ('Gimp.Resource.duplicate', [],
+     """Duplicates a resource.
 
-@mcp.tool()
-def Gimp_Resource_is_brush(ctx: Context) -> str:
-    """Returns whether the resource is a brush.
+    """),
+    ('Gimp.Resource.get_id', [],
+     """mostly internal data and not reusable across sessions.
 
-    """
-    return call_api(ctx, 'Gimp.Resource.is_brush', args=[])
-
-@mcp.tool()
-def Gimp_Resource_is_editable(ctx: Context) -> str:
-    """Whether the resource can be edited.
+    """),
+    ('Gimp.Resource.get_name', [],
+     """Returns the resource’s name.
 
-    """
-    return call_api(ctx, 'Gimp.Resource.is_editable', args=[])
-
-@mcp.tool()
-def Gimp_Resource_is_font(ctx: Context) -> str:
-    """Returns whether the resource is a font.
-
-    """
-    return call_api(ctx, 'Gimp.Resource.is_font', args=[])
-
-@mcp.tool()
-def Gimp_Resource_is_gradient(ctx: Context) -> str:
-    """Returns whether the resource is a gradient.
-
-    """
-    return call_api(ctx, 'Gimp.Resource.is_gradient', args=[])
+    """),
+    ('Gimp.Resource.is_brush', [],
+     """Returns whether the resource is a brush.
 
-@mcp.tool()
-def Gimp_Resource_is_palette(ctx: Context) -> str:
-    """Returns whether the resource is a palette.
+    """),
+    ('Gimp.Resource.is_editable', [],
+     """Whether the resource can be edited.
 
-    """
-    return call_api(ctx, 'Gimp.Resource.is_palette', args=[])
+    """),
+    ('Gimp.Resource.is_font', [],
+     """Returns whether the resource is a font.
 
-@mcp.tool()
-def Gimp_Resource_is_pattern(ctx: Context) -> str:
-    """Returns whether the resource is a pattern.
+    """),
+    ('Gimp.Resource.is_gradient', [],
+     """Returns whether the resource is a gradient.
 
-    """
-    return call_api(ctx, 'Gimp.Resource.is_pattern', args=[])
+    """),
+    ('Gimp.Resource.is_palette', [],
+     """Returns whether the resource is a palette.
 
-@mcp.tool()
-def Gimp_Resource_is_valid(ctx: Context) -> str:
-    """Returns TRUE if the resource is valid.
+    """),
+    ('Gimp.Resource.is_pattern', [],
+     """Returns whether the resource is a pattern.
 
-    """
-    return call_api(ctx, 'Gimp.Resource.is_valid', args=[])
+    """),
+    ('Gimp.Resource.is_valid', [],
+     """Returns TRUE if the resource is valid.
 
-@mcp.tool()
-def Gimp_Resource_rename(ctx: Context, new_name: str) -> str:
-    """Renames a resource. When the name is in use, renames to a unique name.
+    """),
+    ('Gimp.Resource.rename', [('new_name', str)],
+     """Renames a resource. When the name is in use, renames to a unique name.
 
     :param new_name: The proposed new name of the resource.
-    """
-    return call_api(ctx, 'Gimp.Resource.rename', args=[new_name])
-
-@mcp.tool()
-def Gimp_TextLayer_get_antialias(ctx: Context) -> str:
-    """Check if antialiasing is used in the text layer.
+    """),
+    ('Gimp.TextLayer.get_antialias', [],
+     """Check if antialiasing is used in the text layer.
 
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_antialias', args=[])
-
-@mcp.tool()
-def Gimp_TextLayer_get_base_direction(ctx: Context) -> str:
-    """Get the base direction used for rendering the text layer.
-
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_base_direction', args=[])
-
-@mcp.tool()
-def Gimp_TextLayer_get_color(ctx: Context) -> str:
-    """Get the color of the text in a text layer.
-
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_color', args=[])
+    """),
+    ('Gimp.TextLayer.get_base_direction', [],
+     """Get the base direction used for rendering the text layer.
 
-@mcp.tool()
-def Gimp_TextLayer_get_font(ctx: Context) -> str:
-    """Get the font from a text layer as string.
+    """),
+    ('Gimp.TextLayer.get_color', [],
+     """Get the color of the text in a text layer.
 
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_font', args=[])
+    """),
+    ('Gimp.TextLayer.get_font', [],
+     """Get the font from a text layer as string.
 
-@mcp.tool()
-def Gimp_TextLayer_get_font_size(ctx: Context, unit: str) -> str:
-    """Get the font size from a text layer.
+    """),
+    ('Gimp.TextLayer.get_font_size', [('unit', str)],
+     """Get the font size from a text layer.
 
     :param unit: The unit used for the font size.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_font_size', args=[unit])
-
-@mcp.tool()
-def Gimp_TextLayer_get_hint_style(ctx: Context) -> str:
-    """Get information about hinting in the specified text layer.
-
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_hint_style', args=[])
-
-@mcp.tool()
-def Gimp_TextLayer_get_indent(ctx: Context) -> str:
-    """Get the line indentation of text layer.
-
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_indent', args=[])
-
-@mcp.tool()
-def Gimp_TextLayer_get_justification(ctx: Context) -> str:
-    """Get the text justification information of the text layer.
-
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_justification', args=[])
-
-@mcp.tool()
-def Gimp_TextLayer_get_kerning(ctx: Context) -> str:
-    """Check if kerning is used in the text layer.
-
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_kerning', args=[])
+    """),
+    ('Gimp.TextLayer.get_hint_style', [],
+     """Get information about hinting in the specified text layer.
 
-@mcp.tool()
-def Gimp_TextLayer_get_language(ctx: Context) -> str:
-    """Get the language used in the text layer.
+    """),
+    ('Gimp.TextLayer.get_indent', [],
+     """Get the line indentation of text layer.
 
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_language', args=[])
+    """),
+    ('Gimp.TextLayer.get_justification', [],
+     """Get the text justification information of the text layer.
 
-@mcp.tool()
-def Gimp_TextLayer_get_letter_spacing(ctx: Context) -> str:
-    """Get the letter spacing used in a text layer.
+    """),
+    ('Gimp.TextLayer.get_kerning', [],
+     """Check if kerning is used in the text layer.
 
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_letter_spacing', args=[])
+    """),
+    ('Gimp.TextLayer.get_language', [],
+     """Get the language used in the text layer.
 
-@mcp.tool()
-def Gimp_TextLayer_get_line_spacing(ctx: Context) -> str:
-    """Get the spacing between lines of text.
+    """),
+    ('Gimp.TextLayer.get_letter_spacing', [],
+     """Get the letter spacing used in a text layer.
 
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_line_spacing', args=[])
+    """),
+    ('Gimp.TextLayer.get_line_spacing', [],
+     """Get the spacing between lines of text.
 
-@mcp.tool()
-def Gimp_TextLayer_get_markup(ctx: Context) -> str:
-    """Get the markup from a text layer as string.
+    """),
+    ('Gimp.TextLayer.get_markup', [],
+     """Get the markup from a text layer as string.
 
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_markup', args=[])
+    """),
+    ('Gimp.TextLayer.get_text', [],
+     """Get the text from a text layer as string.
 
-@mcp.tool()
-def Gimp_TextLayer_get_text(ctx: Context) -> str:
-    """Get the text from a text layer as string.
-
-    """
-    return call_api(ctx, 'Gimp.TextLayer.get_text', args=[])
-
-@mcp.tool()
-def Gimp_TextLayer_resize(ctx: Context, width: float, height: float) -> str:
-    """Resize the box of a text layer.
+    """),
+    ('Gimp.TextLayer.resize', [('width', float), ('height', float)],
+     """Resize the box of a text layer.
 
     :param width: The new box width in pixels.
     :param height: The new box height in pixels.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.resize', args=[width, height])
-
-@mcp.tool()
-def Gimp_TextLayer_set_antialias(ctx: Context, antialias: bool) -> str:
-    """Enable/disable anti-aliasing in a text layer.
+    """),
+    ('Gimp.TextLayer.set_antialias', [('antialias', bool)],
+     """Enable/disable anti-aliasing in a text layer.
 
     :param antialias: Enable/disable antialiasing of the text.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_antialias', args=[antialias])
-
-@mcp.tool()
-def Gimp_TextLayer_set_base_direction(ctx: Context, direction: str) -> str:
-    """Set the base direction in the text layer.
+    """),
+    ('Gimp.TextLayer.set_base_direction', [('direction', str)],
+     """Set the base direction in the text layer.
 
     :param direction: The base direction of the text.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_base_direction', args=[direction])
-
-@mcp.tool()
-def Gimp_TextLayer_set_color(ctx: Context, color: str) -> str:
-    """Set the color of the text in the text layer.
+    """),
+    ('Gimp.TextLayer.set_color', [('color', str)],
+     """Set the color of the text in the text layer.
 
     :param color: The color to use for the text.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_color', args=[color])
-
-@mcp.tool()
-def Gimp_TextLayer_set_font(ctx: Context, font: str) -> str:
-    """Set the font of a text layer.
+    """),
+    ('Gimp.TextLayer.set_font', [('font', str)],
+     """Set the font of a text layer.
 
     :param font: The new font to use.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_font', args=[font])
-
-@mcp.tool()
-def Gimp_TextLayer_set_font_size(ctx: Context, font_size: float, unit: str) -> str:
-    """Set the font size.
+    """),
+    ('Gimp.TextLayer.set_font_size', [('font_size', float), ('unit', str)],
+     """Set the font size.
 
     :param font_size: The font size.
     :param unit: The unit to use for the font size.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_font_size', args=[font_size, unit])
-
-@mcp.tool()
-def Gimp_TextLayer_set_hint_style(ctx: Context, style: str) -> str:
-    """Control how font outlines are hinted in a text layer.
+    """),
+    ('Gimp.TextLayer.set_hint_style', [('style', str)],
+     """Control how font outlines are hinted in a text layer.
 
     :param style: The new hint style.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_hint_style', args=[style])
-
-@mcp.tool()
-def Gimp_TextLayer_set_indent(ctx: Context, indent: float) -> str:
-    """Set the indentation of the first line in a text layer.
+    """),
+    ('Gimp.TextLayer.set_indent', [('indent', float)],
+     """Set the indentation of the first line in a text layer.
 
     :param indent: The indentation for the first line.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_indent', args=[indent])
-
-@mcp.tool()
-def Gimp_TextLayer_set_justification(ctx: Context, justify: str) -> str:
-    """Set the justification of the text in a text layer.
+    """),
+    ('Gimp.TextLayer.set_justification', [('justify', str)],
+     """Set the justification of the text in a text layer.
 
     :param justify: The justification for your text.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_justification', args=[justify])
-
-@mcp.tool()
-def Gimp_TextLayer_set_kerning(ctx: Context, kerning: bool) -> str:
-    """Enable/disable kerning in a text layer.
+    """),
+    ('Gimp.TextLayer.set_kerning', [('kerning', bool)],
+     """Enable/disable kerning in a text layer.
 
     :param kerning: Enable/disable kerning in the text.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_kerning', args=[kerning])
-
-@mcp.tool()
-def Gimp_TextLayer_set_language(ctx: Context, language: str) -> str:
-    """Set the language of the text layer.
+    """),
+    ('Gimp.TextLayer.set_language', [('language', str)],
+     """Set the language of the text layer.
 
     :param language: The new language to use for the text layer.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_language', args=[language])
-
-@mcp.tool()
-def Gimp_TextLayer_set_letter_spacing(ctx: Context, letter_spacing: float) -> str:
-    """Adjust the letter spacing in a text layer.
+    """),
+    ('Gimp.TextLayer.set_letter_spacing', [('letter_spacing', float)],
+     """Adjust the letter spacing in a text layer.
 
     :param letter_spacing: The additional letter spacing to use.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_letter_spacing', args=[letter_spacing])
-
-@mcp.tool()
-def Gimp_TextLayer_set_line_spacing(ctx: Context, line_spacing: float) -> str:
-    """Adjust the line spacing in a text layer.
+    """),
+    ('Gimp.TextLayer.set_line_spacing', [('line_spacing', float)],
+     """Adjust the line spacing in a text layer.
 
     :param line_spacing: The additional line spacing to use.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_line_spacing', args=[line_spacing])
-
-@mcp.tool()
-def Gimp_TextLayer_set_markup(ctx: Context, markup: str) -> str:
-    """Set the markup for a text layer from a string.
+    """),
+    ('Gimp.TextLayer.set_markup', [('markup', str)],
+     """Set the markup for a text layer from a string.
 
     :param markup: The new markup to set.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_markup', args=[markup])
-
-@mcp.tool()
-def Gimp_TextLayer_set_text(ctx: Context, text: str) -> str:
-    """Set the text of a text layer.
+    """),
+    ('Gimp.TextLayer.set_text', [('text', str)],
+     """Set the text of a text layer.
 
     :param text: The new text to set.
-    """
-    return call_api(ctx, 'Gimp.TextLayer.set_text', args=[text])
-
-@mcp.tool()
-def Gimp_Unit_get_abbreviation(ctx: Context) -> str:
-    """This function returns the abbreviation of the unit (e.g. “in” for
+    """),
+    ('Gimp.Unit.get_abbreviation', [],
+     """This function returns the abbreviation of the unit (e.g. “in” for
 inches).
 It can be used as a short label for the unit in the interface.
 For long labels, use gimp_unit_get_name().
 
-    """
-    return call_api(ctx, 'Gimp.Unit.get_abbreviation', args=[])
+    """),
+    ('Gimp.Unit.get_deletion_flag', [],
+     """Type: gboolean
+
+    """),
+    ('Gimp.Unit.get_digits', [],
+     """Returns the number of digits set for unit.
+Built-in units’ accuracy is approximately the same as an inch with
+two digits. User-defined units can suggest a different accuracy.
+
+    """),
+    ('Gimp.Unit.get_factor', [],
+     """A GimpUnit‘s factor is defined to be:
+
+    """),
+    ('Gimp.Unit.get_id', [],
+     """The ID can be used to retrieve the unit with gimp_unit_get_by_id().
+
+    """),
+    ('Gimp.Unit.get_name', [],
+     """This function returns the usual name of the unit (e.g. “inches”).
+It can be used as the long label for the unit in the interface.
+For short labels, use gimp_unit_get_abbreviation().
+
+    """),
+    ('Gimp.Unit.get_scaled_digits', [('resolution', float)],
+     """Returns the number of digits a unit field should provide to get
+enough accuracy so that every pixel position shows a different
+value from neighboring pixels.
+
+    :param resolution: The resolution in PPI.
+    """),
+    ('Gimp.Unit.get_symbol', [],
+     """This is e.g. “”” for UNIT_INCH.
+
+    """),
+    ('Gimp.Unit.is_built_in', [],
+     """Returns whether the unit is built-in.
+
+    """),
+    ('Gimp.Unit.is_metric', [],
+     """Checks if the given unit is metric. A simplistic test is used
+that looks at the unit’s factor and checks if it is 2.54 multiplied
+by some common powers of 10. Currently it checks for mm, cm, dm, m.
+
+    """),
+    ('Gimp.Unit.set_deletion_flag', [('deletion_flag', bool)],
+     """Sets a GimpUnit‘s deletion_flag. If the deletion_flag of a unit is
+TRUE when GIMP exits, this unit will not be saved in the users’s
+“unitrc” file.
+
+    :param deletion_flag: The new deletion_flag.
+    """),
+    ('Gimp.VectorLoadProcedure.extract_dimensions', [('file', str), ('data', str), ('error', str, None)],
+     """Extracts native or suggested dimensions from file, which must be a vector
+file in the right format supported by procedure. It is considered a
+programming error to pass a file of invalid format.
+
+    :param file: A GFile which can be processed by procedure.
+    :param data: The returned dimension data.
+    :param error: No description available.
+    """),
+]
+
+def _signature(params):
+    """The tool signature for a TOOL_SPECS params list."""
+    parameters = [inspect.Parameter('ctx', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Context)]
+    for name, annotation, *default in params:
+        parameters.append(inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation,
+                                            default=default[0] if default else inspect.Parameter.empty))
+    return inspect.Signature(parameters, return_annotation=str)
+
+def _make_tool(api_path, params, doc, wire=None, signature=None):
+    """Build the forwarding function for one TOOL_SPECS entry."""
+    wire = wire or [param[0] for param in params]
+
+    # FastMCP validates against __signature__ and always passes arguments by keyword
+    async def tool(ctx, **kwargs):
+        return await _call_api_impl(api_path, [kwargs[name] for name in wire], instance=False)
+
+    tool.__name__ = tool.__qualname__ = api_path.replace('.', '_')
+    tool.__doc__ = doc
+    tool.__signature__ = signature or _signature(params)
+    return tool
+
+# Comma-separated GIMP classes (e.g. "Brush,Drawable") to register Gimp_* tools for; all
+# when unset. Fewer tools make for faster startup and a smaller tool list for the model,
+# and call_api can still reach every API method.
+NAMESPACES = {name.strip() for name in os.environ.get("GIMP_MCP_NAMESPACES", "").split(",") if name.strip()}
+
+def _wanted(api_path):
+    return not NAMESPACES or api_path.split('.')[1] in NAMESPACES
+
+def _register_tools(specs):
+    """Register the TOOL_SPECS tools, introspecting each distinct parameter list once.
+
+    Building the pydantic argument model and JSON schema is most of the cost of
+    mcp.tool(), and the 719 tools only have 291 distinct parameter lists. Tools
+    that share one reuse its signature, argument model and schema, which only
+    differ by the schema title. FastMCP has no public way to add a prebuilt Tool,
+    hence the write into its tool manager.
+    """
+    templates = {}
+    tools = mcp._tool_manager._tools
+    for api_path, params, doc, *wire in specs:
+        if not _wanted(api_path):
+            continue
+        shape = tuple(params)
+        cached = templates.get(shape)
+        fn = _make_tool(api_path, params, doc, *wire, signature=cached[0] if cached else _signature(params))
+        if cached is None:
+            cached = templates[shape] = fn.__signature__, Tool.from_function(fn)
+        template = cached[1]
+        tools[fn.__name__] = template.model_copy(update={
+            "fn": fn,
+            "name": fn.__name__,
+            "description": doc,
+            "parameters": {**template.parameters, "title": f"{fn.__name__}Arguments"},
+        })
+
+_register_tools(TOOL_SPECS)
+
+# Tool name -> (api_path, params, wire order) for Gimp_batch, whatever GIMP_MCP_NAMESPACES says
+_TOOL_CALLS = {api_path.replace('.', '_'): (api_path, params, wire[0] if wire else None)
+               for api_path, params, doc, *wire in TOOL_SPECS}
+
+def _batch_params(call, kwargs=None):
+    """call_api params for one Gimp_batch entry, with omitted optional arguments defaulted."""
+    api_path, params, wire = _TOOL_CALLS[call["tool"]]
+    arguments = call.get("arguments") or {}
+    values = {}
+    for name, annotation, *default in params:
+        if name in arguments:
+            values[name] = arguments[name]
+        elif default:
+            values[name] = default[0]
+        else:
+            raise ValueError(f"{call['tool']} is missing argument '{name}'")
+    return _call_params(api_path, [values[name] for name in wire or values], kwargs, instance=False)
 
 @mcp.tool()
-def Gimp_Unit_get_deletion_flag(ctx: Context) -> str:
-    """Type: gboolean
+async def Gimp_batch(ctx: Context, calls: list) -> str:
+    """Run several Gimp_* tools in one round trip to GIMP.
+
+    Parameters:
+    - calls: List of {"tool": tool name, "arguments": {parameter: value}}, e.g.
+     {"tool": "Gimp_Brush_set_angle", "arguments": {"angle": 45.0}}. They run in order.
 
+    Returns:
+    - JSON list with each call's result, or {"error": message} for calls that failed
     """
-    return call_api(ctx, 'Gimp.Unit.get_deletion_flag', args=[])
+    try:
+        requests = [_batch_params(call) for call in calls]
+    except KeyError as e:
+        return f"Error: unknown tool or missing key {e}"
+    except (ValueError, TypeError) as e:
+        return f"Error: {e}"
+    return await _call_batch_impl(requests)
 
 @mcp.tool()
-def Gimp_Unit_get_digits(ctx: Context) -> str:
-    """Returns the number of digits set for unit.
-Built-in units’ accuracy is approximately the same as an inch with
-two digits. User-defined units can suggest a different accuracy.
+async def Gimp_find_tools(ctx: Context, query: str = "") -> str:
+    """Look up Gimp_* tools by name, including ones GIMP_MCP_NAMESPACES leaves unregistered.
+
+    Parameters:
+    - query: Case-insensitive part of the tool name, e.g. "Image_get_" or "layer"; the exact
+     name of a tool returns its full description
+
+    Returns:
+    - JSON list of {"tool", "parameters": [{"name", "type", "default"?}], "description"}.
+     Any listed tool can be run through Gimp_batch, registered or not.
+    """
+    needle = query.lower()
+    matches = []
+    for api_path, params, doc, *wire in TOOL_SPECS:
+        name = api_path.replace('.', '_')
+        if needle not in name.lower():
+            continue
+        parameters = [{"name": param[0], "type": param[1].__name__, **({"default": param[2]} if len(param) > 2 else {})}
+                      for param in params]
+        # Summaries keep a broad query small; an exact match gets the whole docstring
+        description = doc.strip() if name == query else doc.strip().split('\n', 1)[0]
+        matches.append({"tool": name, "parameters": parameters, "description": description})
+    return _dumps(matches).decode('utf-8')
+
+def _hand_written_tool(api_path):
+    """mcp.tool() for a tool defined below, unless GIMP_MCP_NAMESPACES leaves it out."""
+    return mcp.tool() if _wanted(api_path) else (lambda fn: fn)
+
+# Variadic tools forward their extra arguments, so they are written out by hand
+@_hand_written_tool('Gimp.Drawable.append_new_filter')
+async def Gimp_Drawable_append_new_filter(ctx: Context, operation_name: str, name: str, mode: str, opacity: float, *filter_args: str) -> str:
+    """Utility function which combines gimp_drawable_filter_new()
+    followed by setting arguments for the
+    GimpDrawableFilterConfig returned by
+    gimp_drawable_filter_get_config(), and finally appending with
+    gimp_drawable_append_filter()
 
+    :param operation_name: The GEGL operation’s name.
+    :param name: The effect name.
+    :param mode: The blend mode.
+    :param opacity: The opacity from 0.0 (transparent) to 1.0 (opaque).
+    :param filter_args: A variable-length list of operation argument names and values.
+                        The list will be null-terminated automatically.
     """
-    return call_api(ctx, 'Gimp.Unit.get_digits', args=[])
+    # Build the argument list by appending a None to serve as a null terminator.
+    args = [operation_name, name, mode, opacity] + list(filter_args) + [None]
+    return await _call_api_impl('Gimp.Drawable.append_new_filter', args, instance=False)
 
-@mcp.tool()
-def Gimp_Unit_get_factor(ctx: Context) -> str:
-    """A GimpUnit‘s factor is defined to be:
+@_hand_written_tool('Gimp.Drawable.merge_new_filter')
+async def Gimp_Drawable_merge_new_filter(ctx: Context, operation_name: str, name: str, mode: str, opacity: float, *filter_args: str) -> str:
+    """Utility function which combines gimp_drawable_filter_new()
+followed by setting arguments for the
+GimpDrawableFilterConfig returned by
+gimp_drawable_filter_get_config(), and finally applying the
+effect to drawable with gimp_drawable_merge_filter()
 
+    :param operation_name: The GEGL operation’s name.
+    :param name: The effect name which will show in undo step.
+    :param mode: The blend mode.
+    :param opacity: The opacity from 0.0 (transparent) to 1.0 (opaque).
+    :param ...: A NULL-terminated list of operation argument names
+                 and values.
     """
-    return call_api(ctx, 'Gimp.Unit.get_factor', args=[])
+    args = [operation_name, name, mode, opacity] + list(filter_args) + [None]
+    return await _call_api_impl('Gimp.Drawable.merge_new_filter', args, instance=False)
 
-@mcp.tool()
-def Gimp_Unit_get_id(ctx: Context) -> str:
-    """The ID can be used to retrieve the unit with gimp_unit_get_by_id().
+@_hand_written_tool('Gimp.Procedure.run')
+async def Gimp_Procedure_run(ctx: Context, first_arg_name: str = None, *args: str) -> str:
+    """Runs the procedure named procedure_name with arguments given as
+list of (name, value) pairs, terminated by NULL.
 
+    :param first_arg_name: The name of an argument of procedure or NULL to
+                 run procedure with default arguments.
+    :param args: Additional argument names and values.
     """
-    return call_api(ctx, 'Gimp.Unit.get_id', args=[])
+    return await _call_api_impl('Gimp.Procedure.run', [first_arg_name] + list(args), instance=False)
 
-@mcp.tool()
-def Gimp_Unit_get_name(ctx: Context) -> str:
-    """This function returns the usual name of the unit (e.g. “inches”).
-It can be used as the long label for the unit in the interface.
-For short labels, use gimp_unit_get_abbreviation().
+@_hand_written_tool('Gimp.Procedure.run_valist')
+async def Gimp_Procedure_run_valist(ctx: Context, first_arg_name: str = None, *args: str) -> str:
+    """Runs procedure with argument names and values, given in the order as passed
+to gimp_procedure_run().
 
+    :param first_arg_name: The name of an argument of procedure or NULL to
+                 run procedure with default arguments.
+    :param args: Additional argument names and values.
     """
-    return call_api(ctx, 'Gimp.Unit.get_name', args=[])
+    return await _call_api_impl('Gimp.Procedure.run_valist', [first_arg_name] + list(args), instance=False)
 
-@mcp.tool()
-def Gimp_Unit_get_scaled_digits(ctx: Context, resolution: float) -> str:
-    """Returns the number of digits a unit field should provide to get
-enough accuracy so that every pixel position shows a different
-value from neighboring pixels.
+# Bulk pixel access. Reading or writing pixels one Gimp_Drawable_get_pixel/set_pixel call
+# at a time costs a round trip each; these move any number of them in one request.
+def _binary_param(data):
+    """Decoded base64 tool input, sent raw when the connection speaks msgpack."""
+    return base64.b64decode(data) if _connection.packed else data
 
-    :param resolution: The resolution in PPI.
+@_hand_written_tool('Gimp.Drawable.get_pixels_bulk')
+async def Gimp_Drawable_get_pixels_bulk(ctx: Context, drawable_id: int, coords: str, format: str = "R'G'B'A u8") -> str:
+    """Gets the values of many pixels of a drawable at once.
+
+    :param drawable_id: The ID of the drawable.
+    :param coords: Base64 of the pixel coordinates as packed little-endian int32 x, y pairs.
+    :param format: The Babl format to read the pixels in.
+
+    Returns the pixels' bytes, base64-encoded, in the order of coords.
     """
-    return call_api(ctx, 'Gimp.Unit.get_scaled_digits', args=[resolution])
+    return await _send_impl("get_pixels", {"drawable_id": drawable_id, "coords": _binary_param(coords), "format": format},
+                            read_only=True)
 
-@mcp.tool()
-def Gimp_Unit_get_symbol(ctx: Context) -> str:
-    """This is e.g. “”” for UNIT_INCH.
+@_hand_written_tool('Gimp.Drawable.set_pixels_bulk')
+async def Gimp_Drawable_set_pixels_bulk(ctx: Context, drawable_id: int, coords: str, colors: str, format: str = "R'G'B'A u8") -> str:
+    """Sets the values of many pixels of a drawable at once and updates the drawable.
+
+    :param drawable_id: The ID of the drawable.
+    :param coords: Base64 of the pixel coordinates as packed little-endian int32 x, y pairs.
+    :param colors: Base64 of the new pixel values in format, one after another in the order of coords.
+    :param format: The Babl format of colors.
 
+    Returns the number of pixels written.
     """
-    return call_api(ctx, 'Gimp.Unit.get_symbol', args=[])
+    return await _send_impl("set_pixels", {"drawable_id": drawable_id, "coords": _binary_param(coords),
+                                           "colors": _binary_param(colors), "format": format})
 
-@mcp.tool()
-def Gimp_Unit_is_built_in(ctx: Context) -> str:
-    """Returns whether the unit is built-in.
+@_hand_written_tool('Gimp.Drawable.get_sub_thumbnail_bundle')
+async def Gimp_Drawable_get_sub_thumbnail_bundle(ctx: Context, drawable_id: int, dest_width: int, dest_height: int,
+                                                 src_x: int = 0, src_y: int = 0, src_width: int = 0, src_height: int = 0) -> str:
+    """Gets a thumbnail of an area of a drawable together with its size and format, in one call
+instead of separate get_sub_thumbnail_data and get_thumbnail_format calls.
+
+    :param drawable_id: The ID of the drawable.
+    :param dest_width: The requested thumbnail width (<= 1024 pixels).
+    :param dest_height: The requested thumbnail height (<= 1024 pixels).
+    :param src_x: The x coordinate of the area.
+    :param src_y: The y coordinate of the area.
+    :param src_width: The width of the area; 0 for the drawable's width.
+    :param src_height: The height of the area; 0 for the drawable's height.
 
+    Returns {"pixels": base64 pixel data, "width", "height", "bpp", "rowstride", "format"}.
     """
-    return call_api(ctx, 'Gimp.Unit.is_built_in', args=[])
+    params = {
+        "drawable_id": drawable_id, "dest_width": dest_width, "dest_height": dest_height,
+        "src_x": src_x, "src_y": src_y, "src_width": src_width, "src_height": src_height,
+    }
+    return await _send_impl("get_thumbnail", params, read_only=True)
 
-@mcp.tool()
-def Gimp_Unit_is_metric(ctx: Context) -> str:
-    """Checks if the given unit is metric. A simplistic test is used
-that looks at the unit’s factor and checks if it is 2.54 multiplied
-by some common powers of 10. Currently it checks for mm, cm, dm, m.
+@_hand_written_tool('Gimp.Image.run_group')
+async def Gimp_Image_run_group(ctx: Context, image_id: int, calls: list, undo_group: bool = True, freeze: bool = True) -> str:
+    """Run several Gimp_* tools on one image in one round trip to GIMP, as a single undo step
+    and with the image's layer, channel and path lists frozen until the last one is done.
+
+    Parameters:
+    - image_id: The ID of the image the calls work on
+    - calls: List of {"tool": tool name, "arguments": {parameter: value}}, as for Gimp_batch
+    - undo_group: Whether to make the calls one undo step
+    - freeze: Whether to freeze the image's item lists while the calls run
 
+    Returns:
+    - JSON list with each call's result, or {"error": message} for calls that failed
     """
-    return call_api(ctx, 'Gimp.Unit.is_metric', args=[])
+    try:
+        # image_id fills in the instance of Image methods and lets the plugin see which
+        # image the calls change
+        requests = [_batch_params(call, {"image_id": image_id}) for call in calls]
+    except KeyError as e:
+        return f"Error: unknown tool or missing key {e}"
+    except (ValueError, TypeError) as e:
+        return f"Error: {e}"
+    return await _call_batch_impl(requests, {"image_id": image_id, "undo_group": undo_group, "freeze": freeze})
 
-@mcp.tool()
-def Gimp_Unit_set_deletion_flag(ctx: Context, deletion_flag: bool) -> str:
-    """Sets a GimpUnit‘s deletion_flag. If the deletion_flag of a unit is
-TRUE when GIMP exits, this unit will not be saved in the users’s
-“unitrc” file.
+@_hand_written_tool('Gimp.Drawable.describe')
+async def Gimp_Drawable_describe(ctx: Context, drawable_id: int) -> str:
+    """Gets a drawable's type, size and depth in one call instead of separate type, is_rgb,
+is_gray, is_indexed, has_alpha, get_bpp, get_width and get_height calls.
 
-    :param deletion_flag: The new deletion_flag.
+    :param drawable_id: The ID of the drawable.
+
+    Returns {"type": Gimp.ImageType name, "is_rgb", "is_gray", "is_indexed", "has_alpha", "bpp", "width", "height"}.
     """
-    return call_api(ctx, 'Gimp.Unit.set_deletion_flag', args=[deletion_flag])
+    return await _send_impl("describe_drawable", {"drawable_id": drawable_id}, read_only=True)
 
-@mcp.tool()
-def Gimp_VectorLoadProcedure_extract_dimensions(ctx: Context, file: str, data: str, error: str = None) -> str:
-    """Extracts native or suggested dimensions from file, which must be a vector
-file in the right format supported by procedure. It is considered a
-programming error to pass a file of invalid format.
+@_hand_written_tool('Gimp.Drawable.apply_filter_chain')
+async def Gimp_Drawable_apply_filter_chain(ctx: Context, drawable_id: int, filters: list[dict]) -> str:
+    """Applies several GEGL filters to a drawable in one render, e.g. gegl:levels followed by
+gegl:threshold, instead of one pass over the pixels per Gimp_Drawable_merge_new_filter call.
+The drawable must not already have layer effects.
 
-    :param file: A GFile which can be processed by procedure.
-    :param data: The returned dimension data.
-    :param error: No description available.
+    :param drawable_id: The ID of the drawable.
+    :param filters: The filters in order, each {"operation": GEGL operation name, "properties":
+                    {argument name: value}, "name": effect name, "opacity": 0.0 to 1.0}.
+                    Only operation is required.
+
+    Returns the number of filters applied.
     """
-    return call_api(ctx, 'Gimp.VectorLoadProcedure.extract_dimensions', args=[file, data, error])
+    return await _send_impl("apply_filters", {"drawable_id": drawable_id, "filters": filters})
 
 def main():
+    if uvloop:
+        # FastMCP starts its loop through anyio, which creates it from the current policy
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
 
 if __name__ == '__main__':
@@ -3,28 +3,64 @@
 # Provides an MCP interface to control GIMP via a socket connection.
 
 from mcp.server.fastmcp import FastMCP, Context
+import atexit
+import functools
+import os
 import socket
 import json
 import logging
 import inspect
+import struct
+import base64
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("GimpMCPServer")
 
+try:
+    import orjson
+except ImportError:  # fall back to the standard library codec
+    orjson = None
+
+if orjson:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj, default=None):
+        return json.dumps(obj, default=default).encode('utf-8')
+    _loads = json.loads
+
+try:
+    import msgpack
+except ImportError:  # stay on JSON
+    msgpack = None
+if os.environ.get("GIMP_MCP_JSON") == "1":
+    msgpack = None  # Keep the wire readable, e.g. for debugging with a packet capture
+
+# Every message is a 4-byte network-order length followed by that many bytes of UTF-8 JSON,
+# or of MessagePack when the top bit of the length is set
+HEADER = struct.Struct("!I")
+MSGPACK_FLAG = 0x80000000
+
 class GimpConnection:
     def __init__(self, host='localhost', port=9877):
         self.host = host
         self.port = port
         self.sock = None
+        self.packed = False
 
     def connect(self):
         if self.sock:
             return
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Requests are small and always answered, so don't let Nagle hold them back
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             self.sock.settimeout(10)
             self.sock.connect((self.host, self.port))
             logger.info(f"Connected to GIMP at {self.host}:{self.port}")
+            if msgpack:
+                self._negotiate()
         except socket.timeout:
             logger.error(f"Connection to GIMP at {self.host}:{self.port} timed out.")
             self._close_socket()
@@ -38,6 +74,12 @@ class GimpConnection:
             self._close_socket()
             raise ConnectionError(f"An unexpected error occurred while connecting to GIMP: {e}")
 
+    def _negotiate(self):
+        """Switch to MessagePack if the plugin offers it. Older plugins answer
+        the JSON hello with something else and the connection stays on JSON."""
+        result = self.send_command("hello", {"codecs": ["msgpack", "json"]}).get("result")
+        self.packed = isinstance(result, dict) and "msgpack" in result.get("codecs", ())
+
     def _close_socket(self):
         if self.sock:
             try:
@@ -47,6 +89,7 @@ class GimpConnection:
             finally:
                 self.sock.close()
                 self.sock = None
+                self.packed = False
                 logger.info("Socket closed.")
 
     def send_command(self, command_type, params=None):
@@ -58,61 +101,69 @@ class GimpConnection:
 
         command = {"type": command_type, "params": params or {}}
         try:
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
-            
-            response_data = b""
+            if self.packed:
+                payload = msgpack.packb(command, use_bin_type=True)
+                header = HEADER.pack(len(payload) | MSGPACK_FLAG)
+            else:
+                payload = _dumps(command)
+                header = HEADER.pack(len(payload))
+            self.sock.sendall(header + payload)
             self.sock.settimeout(10)
 
-            while True:
-                try:
-                    chunk = self.sock.recv(4096) # Increased buffer size
-                    if not chunk: # Connection closed by GIMP plugin
-                        break
-                    response_data += chunk
-                except socket.timeout:
-                    logger.error("Timeout while receiving data from GIMP.")
-                    raise Exception("Timeout receiving data from GIMP.")
-                except socket.error as e:
-                    logger.error(f"Socket error while receiving data: {e}")
-                    raise Exception(f"Socket error receiving data from GIMP: {e}")
-            
-            if not response_data:
-                logger.error("No response data received from GIMP (connection closed).")
-                raise Exception("No response data from GIMP (connection closed).")
+            (length,) = HEADER.unpack(self._recv_exact(HEADER.size))
+            response_data = self._recv_exact(length & ~MSGPACK_FLAG)
+            if length & MSGPACK_FLAG:
+                return msgpack.unpackb(response_data, raw=False)
 
             try:
-                return json.loads(response_data.decode('utf-8'))
+                return _loads(response_data)
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to decode JSON response from GIMP: '{response_data.decode('utf-8', errors='ignore')}'. Error: {e}")
                 raise Exception(f"Invalid JSON response from GIMP: {e}")
 
+        # The socket stays open for the next command; after a failure the
+        # stream may be mid-message, so drop it and reconnect next time.
         except socket.error as e:
             logger.error(f"Socket error during send/recv: {e}")
+            self._close_socket()
             raise Exception(f"Socket error communicating with GIMP: {e}")
         except Exception as e:
             logger.error(f"Communication error: {e}")
-            raise Exception(f"Error communicating with GIMP: {e}")
-        finally:
             self._close_socket()
+            raise Exception(f"Error communicating with GIMP: {e}")
 
-# Global connection
-_gimp_connection = None
+    def _recv_exact(self, size):
+        """Read exactly size bytes from the socket into one preallocated buffer."""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            try:
+                count = self.sock.recv_into(view[received:])
+            except socket.timeout:
+                logger.error("Timeout while receiving data from GIMP.")
+                raise Exception("Timeout receiving data from GIMP.")
+            except socket.error as e:
+                logger.error(f"Socket error while receiving data: {e}")
+                raise Exception(f"Socket error receiving data from GIMP: {e}")
+            if not count: # Connection closed by GIMP plugin
+                logger.error("No response data received from GIMP (connection closed).")
+                raise Exception("No response data from GIMP (connection closed).")
+            received += count
+        return buffer
 
-def get_gimp_connection():
-    global _gimp_connection
-    
-    if _gimp_connection is None:
-        _gimp_connection = GimpConnection()
+def _encode_bytes(obj):
+    """Base64-encode binary results (brush buffers, ICC profiles) for the JSON tool output."""
+    if isinstance(obj, (bytes, bytearray)):
+        return base64.b64encode(obj).decode('ascii')
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
-    if _gimp_connection.sock is None:
-        try:
-            logger.info("Attempting to connect/reconnect to GIMP.")
-            _gimp_connection.connect()
-        except ConnectionError as e:
-            logger.error(f"Failed to get GIMP connection: {e}")
-            raise 
-    
-    return _gimp_connection
+# Global connection, created on first use. send_command (re)connects it as needed.
+@functools.cache
+def get_gimp_connection():
+    connection = GimpConnection()
+    atexit.register(connection._close_socket)
+    return connection
 
 # MCP server
 mcp = FastMCP("GimpMCP", description="GIMP integration through MCP")
@@ -134,9 +185,9 @@ def call_api(ctx: Context, api_path: str, args: list = [], kwargs: dict = {}) ->
         conn = get_gimp_connection()
         result = conn.send_command("call_api", {"api_path": api_path, "args": args, "kwargs": kwargs})
         if result["status"] == "success":
-            return json.dumps(result["result"])
+            return _dumps(result["result"], default=_encode_bytes).decode('utf-8')
         else:
-            return f"Error: {json.dumps(result['error'])}"
+            return f"Error: {_dumps(result['error']).decode('utf-8')}"
     except Exception as e:
         return f"Error: {e}"
 
@@ -0,0 +1,121 @@
+"""What the Gimp_* tools send to the GIMP plugin. Run with python -m unittest."""
+import importlib.util
+import os
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _load_server():
+    spec = importlib.util.spec_from_file_location("gimp_mcp_root_server", os.path.join(ROOT, "server.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+server = _load_server()
+
+
+class ToolCallTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.sent = []
+
+        async def send_command(command_type, params=None):
+            self.sent.append((command_type, params))
+            return {"status": "success", "result": None}
+
+        server._getter_cache.invalidate()
+        server._connection.packed = False
+        server._connection.send_command = send_command
+
+    async def test_tool_marks_args_without_instance(self):
+        await server.mcp.call_tool("Gimp_Gradient_segment_set_left_pos", {"segment": 1, "pos": 0.5, "final_pos": 0.0})
+        command_type, params = self.sent[-1]
+        self.assertEqual(command_type, "call_api")
+        self.assertEqual(params["api_path"], "Gimp.Gradient.segment_set_left_pos")
+        self.assertEqual(params["args"], [1, 0.5, 0.0])
+        self.assertIs(params["instance"], False)
+
+    async def test_call_api_args_keep_instance(self):
+        await server._call_api_impl("Gimp.Gradient.segment_set_left_pos", [0, 1, 0.5, 0.0])
+        self.assertNotIn("instance", self.sent[-1][1])
+
+    async def test_batch_entries_mark_args_without_instance(self):
+        await server.mcp.call_tool("Gimp_batch", {"calls": [
+            {"tool": "Gimp_Gradient_segment_set_left_pos", "arguments": {"segment": 1, "pos": 0.5, "final_pos": 0.0}}]})
+        command_type, params = self.sent[-1]
+        self.assertEqual(command_type, "batch")
+        self.assertIs(params["calls"][0]["instance"], False)
+
+    async def test_argument_checks_skip_call_api_instance(self):
+        result = await server._call_api_impl("Gimp.Image.scale", [0, 100, 100])
+        self.assertFalse(result.startswith("Error"))
+        result = await server._call_api_impl("Gimp.Image.scale", [0, 100, 0])
+        self.assertIn("must be positive", result)
+        result = await server.mcp.call_tool("Gimp_Image_scale", {"new_width": 100, "new_height": 0})
+        self.assertIn("must be positive", str(result))
+
+    async def test_coordinates_packed_in_tool_and_call_api_layouts(self):
+        server._connection.packed = True
+        packed = server.struct.pack("<4d", 1, 2, 3, 4)
+        await server.mcp.call_tool("Gimp_Image_select_polygon", {"operation": "2", "num_segs": 4, "segs": "1,2 3,4"})
+        self.assertEqual(self.sent[-1][1]["args"], ["2", 4, packed])
+        await server._call_api_impl("Gimp.Image.select_polygon", [0, 2, 4, "1,2 3,4"])
+        self.assertEqual(self.sent[-1][1]["args"], [0, 2, 4, packed])
+
+    async def test_operation_names_converted_in_tool_and_call_api_layouts(self):
+        await server.mcp.call_tool("Gimp_Image_select_rectangle", {"operation": "subtract", "x": 1, "y": 2, "width": 3, "height": 4})
+        self.assertEqual(self.sent[-1][1]["args"], [1, 1, 2, 3, 4])
+        await server._call_api_impl("Gimp.Image.select_rectangle", [0, "replace", 1, 2, 3, 4])
+        self.assertEqual(self.sent[-1][1]["args"], [0, 2, 1, 2, 3, 4])
+        await server._call_api_impl("Gimp.Channel.combine_masks", [0, 5, "intersect", 0, 0])
+        self.assertEqual(self.sent[-1][1]["args"], [0, 5, 3, 0, 0])
+        count = len(self.sent)
+        result = await server._call_api_impl("Gimp.Image.select_item", [0, "intersect_with_floating", 5])
+        self.assertIn("not available", result)
+        self.assertEqual(len(self.sent), count)
+
+    async def test_batch_entries_checked_and_converted(self):
+        server._connection.packed = True
+        await server.mcp.call_tool("Gimp_batch", {"calls": [
+            {"tool": "Gimp_Image_select_polygon", "arguments": {"operation": "add", "num_segs": 4, "segs": "1,2 3,4"}}]})
+        self.assertEqual(self.sent[-1][1]["calls"][0]["args"], [0, 4, server.struct.pack("<4d", 1, 2, 3, 4)])
+        count = len(self.sent)
+        for arguments in ({"operation": "add", "num_segs": 3, "segs": "1,2 3,4"},
+                          {"operation": "intersect_with_floating", "num_segs": 4, "segs": "1,2 3,4"}):
+            result = await server.mcp.call_tool("Gimp_batch", {"calls": [
+                {"tool": "Gimp_Image_select_polygon", "arguments": arguments}]})
+            self.assertIn("Error", str(result))
+        self.assertEqual(len(self.sent), count)
+
+    async def test_run_group_entries_carry_the_image(self):
+        await server.mcp.call_tool("Gimp_Image_run_group", {"image_id": 7, "calls": [
+            {"tool": "Gimp_Image_scale", "arguments": {"new_width": 10, "new_height": 20}}]})
+        command_type, params = self.sent[-1]
+        self.assertEqual(command_type, "batch")
+        self.assertEqual(params["image_id"], 7)
+        self.assertEqual(params["calls"][0]["kwargs"], {"image_id": 7})
+        self.assertEqual(params["calls"][0]["args"], [10, 20])
+
+
+class ResultCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_oldest_results_dropped_over_max_size(self):
+        cache = server.ResultCache([], max_size=10)
+
+        async def send(result):
+            return result
+
+        await cache.fetch("a", lambda: send("1234"))
+        await cache.fetch("b", lambda: send("5678"))
+        await cache.fetch("c", lambda: send("90ab"))
+        self.assertEqual(list(cache.entries), ["b", "c"])
+        await cache.fetch("d", lambda: send("x" * 11))
+        self.assertNotIn("d", cache.entries)
+
+    async def test_close_clears_cache(self):
+        cache_entries = server._getter_cache.entries
+        cache_entries["key"] = "value"
+        server.GimpConnection().close()
+        self.assertEqual(server._getter_cache.entries, {})
+
+
+if __name__ == "__main__":
+    unittest.main()